@@ -20,6 +20,8 @@ from src.online_poker.routes.game_routes import game_bp
 from src.online_poker.routes.lobby_routes import lobby_bp, register_lobby_socket_events
 from src.online_poker.routes.table_routes import table_bp
 from src.online_poker.routes.test_routes import test_bp
+from src.online_poker.services.hand_persistence import hand_persistence_queue
+from src.online_poker.services.mc_worker_pool import equity_worker_pool
 from src.online_poker.services.websocket_manager import init_websocket_manager
 
 
@@ -126,6 +128,13 @@ def create_app(config_class=Config):
     # Initialize WebSocket manager
     init_websocket_manager(socketio)
 
+    # Monte Carlo bot rollouts run in worker processes, off the Socket.IO handlers
+    equity_worker_pool.configure(app.config.get("BOT_WORKERS", 0))
+    equity_worker_pool.warm()
+
+    # Completed hands are written by a background worker, flushed at exit
+    hand_persistence_queue.configure(app, app.config.get("HAND_PERSISTENCE_ASYNC", False))
+
     # Cache-busting: provide asset version to all templates
     _asset_version = str(int(time.time()))
 
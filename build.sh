@@ -98,6 +98,36 @@ with app.app_context():
             else:
                 print(f'Note: {e}')
 
+    # Compact hand history: payload column, nullable legacy JSON columns, and
+    # the (table_id, completed_at) index. Existing rows are re-encoded and
+    # indexed by player by compact-hands below.
+    try:
+        db.session.execute(text('ALTER TABLE game_history ADD COLUMN payload BYTEA'))
+        db.session.commit()
+        print('Added payload column to game_history')
+    except Exception as e:
+        db.session.rollback()
+        if 'already exists' in str(e).lower() or 'duplicate' in str(e).lower():
+            print('payload column already exists')
+        else:
+            print(f'Note: {e}')
+    for col in ['players', 'actions', 'results', 'stakes']:
+        try:
+            db.session.execute(text(f'ALTER TABLE game_history ALTER COLUMN {col} DROP NOT NULL'))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f'Note: {e}')
+    try:
+        db.session.execute(text(
+            'CREATE INDEX IF NOT EXISTS ix_game_history_table_completed ON game_history (table_id, completed_at)'
+        ))
+        db.session.commit()
+        print('Ensured game_history (table_id, completed_at) index exists')
+    except Exception as e:
+        db.session.rollback()
+        print(f'Note: {e}')
+
     # Create disabled_variants table if it doesn't exist
     try:
         db.session.execute(text('''
@@ -116,14 +146,23 @@ with app.app_context():
         print(f'Note: {e}')
 "
 
-# Pre-convert hand ranking CSVs to SQLite for memory-efficient evaluation
+# Re-encode hand history still stored as JSON text and index it by player, so
+# per-player counts and exports include it (only touches rows not yet compacted)
+python -m src.online_poker.cli compact-hands --config "${FLASK_ENV:-default}"
+
+# Build memory-mapped binary rankings, shared by all workers through the page cache
+python tools/generate_rankings/build_binary_rankings.py
+
+# Pre-convert the remaining hand ranking CSVs (hand strings too long to pack) to SQLite
 python -c "
 from pathlib import Path
-from generic_poker.evaluation.cache import HandRankingsCache
+from generic_poker.evaluation.cache import RANKINGS_BINARY_SUFFIX, HandRankingsCache
 cache = HandRankingsCache()
 csv_dir = Path('data/hand_rankings')
 for csv_file in sorted(csv_dir.glob('all_card_hands_ranked_*.csv')):
     db_path = csv_file.with_suffix('.db')
+    if csv_file.with_suffix(RANKINGS_BINARY_SUFFIX).exists():
+        continue
     if not db_path.exists():
         print(f'Converting {csv_file.name}...')
         cache._convert_csv_to_sqlite(csv_file, db_path)
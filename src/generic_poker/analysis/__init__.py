@@ -0,0 +1,14 @@
+"""Offline analysis built on the core engine (equity calculation, preflop tables)."""
+
+from generic_poker.analysis.equity import EquityResult, PlayerEquity, UnsupportedForEquity, calculate_equity
+from generic_poker.analysis.preflop import PreflopEquityTable, build_preflop_table, load_preflop_tables
+
+__all__ = [
+    "EquityResult",
+    "PlayerEquity",
+    "PreflopEquityTable",
+    "UnsupportedForEquity",
+    "build_preflop_table",
+    "calculate_equity",
+    "load_preflop_tables",
+]
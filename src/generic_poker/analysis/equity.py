@@ -0,0 +1,424 @@
+"""Showdown equity calculator.
+
+Given a variant's rules, the cards known for each player, any community and
+dead cards, works out each player's chance of winning, tying and scooping the
+pot and their expected pot share. Small spaces of unseen cards are enumerated
+exhaustively; larger ones are sampled, spread across a process pool.
+
+Equity follows the showdown rules the bots' rollouts use: each bestHand config
+is worth an equal share of the pot, and configs nobody qualifies for pass
+their share to the configs that do have winners. Hi-lo splits, qualifiers and
+ties are handled uniformly.
+
+The same hand-config and scoring helpers back the Monte Carlo bot's rollouts
+(online_poker.services.mc_rollout).
+"""
+
+import itertools
+import math
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from random import Random
+
+from generic_poker.config.loader import GameActionType, GameRules, GameStep
+from generic_poker.core.card import Card, cards_to_codes
+from generic_poker.core.deck import Deck, DeckType
+from generic_poker.evaluation.evaluator import EvaluationType, evaluator
+
+# bestHand fields the calculator understands.
+SUPPORTED_BESTHAND_KEYS = {"name", "evaluationType", "anyCards", "holeCards", "communityCards", "qualifier"}
+
+# Steps that can be simulated without a decision policy.
+SIMULATABLE_STEPS = {GameActionType.BET, GameActionType.DEAL, GameActionType.SHOWDOWN}
+
+# Completions up to this count are enumerated rather than sampled.
+DEFAULT_EXHAUSTIVE_LIMIT = 50_000
+DEFAULT_SAMPLES = 20_000
+
+COMMUNITY = "__community__"
+
+
+class UnsupportedForEquity(ValueError):
+    """Game rules or cards are outside what the equity calculator can model."""
+
+
+@dataclass
+class HandConfigSpec:
+    """One showdown bestHand entry, reduced to the supported vocabulary."""
+
+    eval_type: EvaluationType
+    any_cards: int | None = None
+    hole_cards: int | None = None
+    community_cards: int = 0
+    qualifier: list[int] | None = None
+
+
+@dataclass
+class PlayerEquity:
+    """One player's showdown results, as fractions of all completions."""
+
+    win: float = 0.0  # sole winner of at least one pot share
+    tie: float = 0.0  # shared a pot share but won none outright
+    scoop: float = 0.0  # sole winner of every pot share
+    equity: float = 0.0  # expected fraction of the pot
+
+
+@dataclass
+class EquityResult:
+    """Equity for every player, and how it was computed."""
+
+    players: dict[str, PlayerEquity]
+    trials: int
+    exhaustive: bool
+
+
+@dataclass
+class _Tally:
+    """Raw counts accumulated over completions; merged across workers."""
+
+    trials: int = 0
+    wins: dict[str, int] = field(default_factory=dict)
+    ties: dict[str, int] = field(default_factory=dict)
+    scoops: dict[str, int] = field(default_factory=dict)
+    shares: dict[str, float] = field(default_factory=dict)
+
+    def add(self, winners_per_config: list[list[str]]) -> None:
+        self.trials += 1
+        if not winners_per_config:
+            return
+        share_per_config = 1.0 / len(winners_per_config)
+        sole = {}
+        shared = set()
+        for winners in winners_per_config:
+            for pid in winners:
+                self.shares[pid] = self.shares.get(pid, 0.0) + share_per_config / len(winners)
+                if len(winners) == 1:
+                    sole[pid] = sole.get(pid, 0) + 1
+                else:
+                    shared.add(pid)
+        for pid, count in sole.items():
+            self.wins[pid] = self.wins.get(pid, 0) + 1
+            if count == len(winners_per_config):
+                self.scoops[pid] = self.scoops.get(pid, 0) + 1
+        for pid in shared - sole.keys():
+            self.ties[pid] = self.ties.get(pid, 0) + 1
+
+    def merge(self, other: "_Tally") -> None:
+        self.trials += other.trials
+        for mine, theirs in (
+            (self.wins, other.wins),
+            (self.ties, other.ties),
+            (self.scoops, other.scoops),
+            (self.shares, other.shares),
+        ):
+            for pid, value in theirs.items():
+                mine[pid] = mine.get(pid, 0) + value
+
+
+def parse_hand_config(cfg: dict) -> HandConfigSpec:
+    """Reduce a showdown bestHand entry to a HandConfigSpec, or raise UnsupportedForEquity."""
+    if set(cfg) - SUPPORTED_BESTHAND_KEYS:
+        raise UnsupportedForEquity(f"unsupported bestHand fields: {set(cfg) - SUPPORTED_BESTHAND_KEYS}")
+    try:
+        eval_type = EvaluationType(cfg["evaluationType"])
+    except (KeyError, ValueError) as e:
+        raise UnsupportedForEquity(f"evaluation type: {cfg.get('evaluationType')}") from e
+
+    any_cards = cfg.get("anyCards")
+    hole_cards = cfg.get("holeCards")
+    community_cards = cfg.get("communityCards", 0)
+    if any_cards is not None:
+        if not isinstance(any_cards, int):
+            raise UnsupportedForEquity("non-integer anyCards")
+    else:
+        if not isinstance(hole_cards, int) or not isinstance(community_cards, int):
+            raise UnsupportedForEquity("non-integer holeCards/communityCards")
+    return HandConfigSpec(
+        eval_type=eval_type,
+        any_cards=any_cards,
+        hole_cards=hole_cards,
+        community_cards=community_cards,
+        qualifier=cfg.get("qualifier"),
+    )
+
+
+def parse_showdown(rules: GameRules) -> list[HandConfigSpec]:
+    """Hand configs for a variant's showdown, or raise UnsupportedForEquity."""
+    showdown = rules.showdown
+    if showdown.declaration_mode not in (None, "cards_speak"):
+        raise UnsupportedForEquity("declaration mode")
+    if showdown.conditionalBestHands:
+        raise UnsupportedForEquity("conditional best hands")
+    if not showdown.best_hand:
+        raise UnsupportedForEquity("no bestHand configs")
+    return [parse_hand_config(cfg) for cfg in showdown.best_hand]
+
+
+def count_deals(steps: Sequence[GameStep]) -> tuple[int, int]:
+    """Count cards dealt per player and to the community over some gameplay steps.
+
+    Raises UnsupportedForEquity if a step needs a decision policy
+    (draw/discard/expose/...) or uses features we can't model.
+    """
+    player_cards = 0
+    community_cards = 0
+    for step in steps:
+        if step.action_type not in SIMULATABLE_STEPS:
+            raise UnsupportedForEquity(f"step: {step.action_type.name}")
+        if step.action_type != GameActionType.DEAL:
+            continue
+        config = step.action_config
+        if not isinstance(config, dict) or "conditional_state" in config:
+            raise UnsupportedForEquity("conditional deal step")
+        location = config.get("location")
+        for card_spec in config.get("cards", []):
+            number = card_spec.get("number", 0)
+            if not isinstance(number, int):
+                raise UnsupportedForEquity("non-integer deal count")
+            if location == "player":
+                player_cards += number
+            elif location == "community":
+                if card_spec.get("subset", "default") != "default":
+                    raise UnsupportedForEquity("multi-board community deal")
+                community_cards += number
+            else:
+                raise UnsupportedForEquity(f"deal location: {location}")
+    return player_cards, community_cards
+
+
+def best_hand_rank(hole: list[Card], community: list[Card], cfg: HandConfigSpec) -> tuple[int, int] | None:
+    """Best (rank, ordered_rank) for one player under one config; None if no qualifying hand.
+
+    Lower tuples are better (rank 1 = best for both high and low games).
+    """
+    return best_codes_rank(cards_to_codes(hole), cards_to_codes(community), cfg)
+
+
+def best_codes_rank(
+    hole_codes: list[int],
+    community_codes: list[int],
+    cfg: HandConfigSpec,
+    hole_combos: list[tuple[int, ...]] | None = None,
+) -> tuple[int, int] | None:
+    """best_hand_rank on integer card codes (see core.card.cards_to_codes).
+
+    hole_combos optionally supplies the precomputed holeCards-sized
+    combinations of hole_codes, for callers that score the same hole cards
+    against many boards.
+    """
+    best: tuple[int, int] | None = None
+    if cfg.any_cards is not None:
+        best = evaluator.best_codes(hole_codes + community_codes, cfg.any_cards, cfg.eval_type)
+        if best is None:
+            return None
+    elif cfg.community_cards == 0:
+        # Stud: one call picks the best hand from the hole cards
+        best = evaluator.best_codes(hole_codes, cfg.hole_cards, cfg.eval_type)
+        if best is None:
+            return None
+    else:
+        if len(hole_codes) < cfg.hole_cards or len(community_codes) < cfg.community_cards:
+            return None
+        if hole_combos is None:
+            hole_combos = list(itertools.combinations(hole_codes, cfg.hole_cards))
+        evaluate_codes = evaluator.get_evaluator(cfg.eval_type).evaluate_codes
+        for community_combo in itertools.combinations(community_codes, cfg.community_cards):
+            for hole_combo in hole_combos:
+                rank, ordered_rank = evaluate_codes(list(hole_combo + community_combo))
+                if rank == 0:
+                    continue
+                rank_key = (rank, ordered_rank if ordered_rank is not None else 0)
+                if best is None or rank_key < best:
+                    best = rank_key
+
+    # Qualifier check on the best hand only — if the best doesn't qualify,
+    # nothing does. evaluate_hand's own qualifier handling returns rank=0
+    # which would incorrectly beat rank 1 in tuple comparison, so check here.
+    if best is not None and cfg.qualifier:
+        q_rank, q_ordered = cfg.qualifier[0], cfg.qualifier[1] if len(cfg.qualifier) > 1 else None
+        if best[0] > q_rank or (best[0] == q_rank and q_ordered is not None and best[1] > q_ordered):
+            return None
+    return best
+
+
+def showdown_winners(
+    hands: dict[str, list[Card]], community: list[Card], hand_configs: list[HandConfigSpec]
+) -> list[list[str]]:
+    """Winners of each pot share that somebody qualifies for, in config order."""
+    hand_codes = {pid: cards_to_codes(cards) for pid, cards in hands.items()}
+    return showdown_winners_codes(hand_codes, cards_to_codes(community), hand_configs)
+
+
+def showdown_winners_codes(
+    hands: dict[str, list[int]],
+    community: list[int],
+    hand_configs: list[HandConfigSpec],
+    hole_combos: dict[tuple[str, int], list[tuple[int, ...]]] | None = None,
+) -> list[list[str]]:
+    """showdown_winners on integer card codes.
+
+    hole_combos maps (player_id, config index) to that player's precomputed
+    hole-card combinations, see best_codes_rank.
+    """
+    winners_per_config = []
+    for i, cfg in enumerate(hand_configs):
+        bests = {}
+        for pid, codes in hands.items():
+            combos = hole_combos.get((pid, i)) if hole_combos else None
+            rank = best_codes_rank(codes, community, cfg, combos)
+            if rank is not None:
+                bests[pid] = rank
+        if bests:
+            best_rank = min(bests.values())
+            winners_per_config.append([pid for pid, rank in bests.items() if rank == best_rank])
+    return winners_per_config
+
+
+def calculate_equity(
+    rules: GameRules,
+    hands: dict[str, list[Card]],
+    community: list[Card] | None = None,
+    dead: list[Card] | None = None,
+    samples: int = DEFAULT_SAMPLES,
+    exhaustive_limit: int = DEFAULT_EXHAUSTIVE_LIMIT,
+    workers: int | None = None,
+    seed: int | None = None,
+) -> EquityResult:
+    """
+    Calculate showdown equity for every player.
+
+    Args:
+        rules: Variant rules; the showdown and the deal steps are used
+        hands: Cards known for each player (may be partial, or empty)
+        community: Community cards already dealt
+        dead: Cards known to be out of play (folded, discarded, burned)
+        samples: Monte Carlo completions when the space is too big to enumerate
+        exhaustive_limit: Enumerate every completion when there are at most this many
+        workers: Processes for Monte Carlo sampling (default: CPU count; 1 runs in-process)
+        seed: Seed for reproducible sampling
+
+    Returns:
+        EquityResult with per-player win/tie/scoop/equity fractions
+
+    Raises:
+        UnsupportedForEquity: If the rules or cards cannot be modelled
+        ValueError: If a card is duplicated or a player holds too many cards
+    """
+    community = list(community or [])
+    dead = list(dead or [])
+    hand_configs = parse_showdown(rules)
+    player_total, community_total = count_deals(rules.gameplay)
+
+    known = [card for cards in hands.values() for card in cards] + community + dead
+    if any(card.is_wild for card in known):
+        raise UnsupportedForEquity("wild cards in play")
+    known_keys = [str(card) for card in known]
+    if len(set(known_keys)) != len(known_keys):
+        raise ValueError("Duplicate cards in hands, community or dead cards")
+
+    slots = []
+    for pid, cards in hands.items():
+        if len(cards) > player_total:
+            raise ValueError(f"Player {pid} holds {len(cards)} cards; {rules.game} deals {player_total}")
+        slots.append((pid, player_total - len(cards)))
+    if len(community) > community_total:
+        raise ValueError(f"{len(community)} community cards; {rules.game} deals {community_total}")
+    slots.append((COMMUNITY, community_total - len(community)))
+
+    known_set = set(known_keys)
+    unseen = [card for card in Deck(deck_type=DeckType(rules.deck_type)).cards if str(card) not in known_set]
+    needed = sum(count for _, count in slots)
+    if needed > len(unseen):
+        raise UnsupportedForEquity("not enough unseen cards to complete every hand")
+
+    # Completions are scored on integer card codes, encoded once here
+    hand_codes = {pid: cards_to_codes(cards) for pid, cards in hands.items()}
+    job = (hand_codes, cards_to_codes(community), hand_configs, slots, cards_to_codes(unseen))
+    completions = _count_completions(len(unseen), [count for _, count in slots])
+    if completions <= exhaustive_limit:
+        tally = _enumerate(job)
+        exhaustive = True
+    else:
+        tally = _sample_parallel(job, samples, workers, seed)
+        exhaustive = False
+
+    trials = max(tally.trials, 1)
+    players = {
+        pid: PlayerEquity(
+            win=tally.wins.get(pid, 0) / trials,
+            tie=tally.ties.get(pid, 0) / trials,
+            scoop=tally.scoops.get(pid, 0) / trials,
+            equity=tally.shares.get(pid, 0.0) / trials,
+        )
+        for pid in hands
+    }
+    return EquityResult(players=players, trials=tally.trials, exhaustive=exhaustive)
+
+
+def _count_completions(unseen: int, counts: list[int]) -> int:
+    total = 1
+    for count in counts:
+        total *= math.comb(unseen, count)
+        unseen -= count
+    return total
+
+
+def _complete(job, drawn: dict[str, list[int]]) -> list[list[str]]:
+    hands, community, hand_configs, _, _ = job
+    full_hands = {pid: codes + drawn.get(pid, []) for pid, codes in hands.items()}
+    return showdown_winners_codes(full_hands, community + drawn.get(COMMUNITY, []), hand_configs)
+
+
+def _assignments(slots: list[tuple[str, int]], pool: list[int]) -> Iterator[dict[str, list[int]]]:
+    """Every way of filling the slots from the pool, community first."""
+    if not slots:
+        yield {}
+        return
+    (slot, count), rest = slots[-1], slots[:-1]
+    for combo in itertools.combinations(range(len(pool)), count):
+        chosen = set(combo)
+        remaining = [card for i, card in enumerate(pool) if i not in chosen]
+        for assignment in _assignments(rest, remaining):
+            assignment[slot] = [pool[i] for i in combo]
+            yield assignment
+
+
+def _enumerate(job) -> _Tally:
+    tally = _Tally()
+    slots, unseen = job[3], job[4]
+    for drawn in _assignments([slot for slot in slots if slot[1]], unseen):
+        tally.add(_complete(job, drawn))
+    return tally
+
+
+def _sample(job, count: int, seed: int | None) -> _Tally:
+    rng = Random(seed)
+    slots, unseen = job[3], job[4]
+    needed = sum(n for _, n in slots)
+    tally = _Tally()
+    for _ in range(count):
+        cards = rng.sample(unseen, needed)
+        drawn = {}
+        pos = 0
+        for slot, n in slots:
+            drawn[slot] = cards[pos : pos + n]
+            pos += n
+        tally.add(_complete(job, drawn))
+    return tally
+
+
+def _sample_parallel(job, samples: int, workers: int | None, seed: int | None) -> _Tally:
+    workers = max(1, min(workers or os.cpu_count() or 1, samples))
+    if seed is None:
+        seed = Random().randrange(2**32)
+    # Each worker gets its own deterministic seed and an equal share of samples
+    counts = [samples // workers + (1 if i < samples % workers else 0) for i in range(workers)]
+    if workers == 1:
+        return _sample(job, samples, seed)
+    tally = _Tally()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_sample, [job] * workers, counts, [seed + i for i in range(workers)]):
+            tally.merge(part)
+    return tally
@@ -0,0 +1,214 @@
+"""Precomputed equity tables for starting hands.
+
+Before any community or upcard is seen, a player's equity depends only on
+their starting hand up to a relabelling of suits, and on how many opponents
+are still in. A PreflopEquityTable stores that equity per canonical starting
+hand and opponent count, so a bot can look it up instead of rolling out.
+
+Tables are built offline with tools/build_preflop_equity.py and stored as
+JSON under data/preflop_equity/, one file per variant.
+"""
+
+import contextlib
+import functools
+import itertools
+import json
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from generic_poker.analysis.equity import UnsupportedForEquity, calculate_equity, count_deals, parse_showdown
+from generic_poker.config.loader import GameActionType, GameRules
+from generic_poker.core.card import Card
+from generic_poker.core.deck import Deck, DeckType
+
+logger = logging.getLogger(__name__)
+
+PREFLOP_EQUITY_DIR = Path(__file__).resolve().parents[3] / "data" / "preflop_equity"
+
+# Forced bets posted before the first real decision
+FORCED_BET_TYPES = {"blinds", "antes"}
+
+_RANKS = "AKQJT98765432"
+_SUITS = "shdc"
+_RANK_INDEX = {rank: i for i, rank in enumerate(_RANKS)}
+_SUIT_INDEX = {suit: i for i, suit in enumerate(_SUITS)}
+# Every relabelling of suits, as old suit index -> new suit index
+_SUIT_PERMUTATIONS = list(itertools.permutations(range(len(_SUITS))))
+
+
+def canonical_hand(cards: list[Card]) -> str:
+    """Suit-isomorphic key for a starting hand, e.g. "AsKs" for any suited AK.
+
+    Every relabelling of suits gives the same key: the smallest of the
+    relabelled hands, with cards sorted by rank then suit.
+    """
+    indices = [(_RANK_INDEX[card.rank.value], _SUIT_INDEX[card.suit.value]) for card in cards]
+    best = min(sorted((rank, perm[suit]) for rank, suit in indices) for perm in _SUIT_PERMUTATIONS)
+    return "".join(_RANKS[rank] + _SUITS[suit] for rank, suit in best)
+
+
+def _suit_variants(key: str) -> int:
+    """Number of concrete hands a canonical key stands for (its distinct suit relabellings)."""
+    indices = [(_RANK_INDEX[key[i]], _SUIT_INDEX[key[i + 1]]) for i in range(0, len(key), 2)]
+    return len({tuple(sorted((rank, perm[suit]) for rank, suit in indices)) for perm in _SUIT_PERMUTATIONS})
+
+
+def starting_hands(hand_size: int, deck_type: DeckType = DeckType.STANDARD) -> dict[str, list[Card]]:
+    """One representative hand for each canonical starting hand of the given size."""
+    hands: dict[str, list[Card]] = {}
+    for combo in itertools.combinations(Deck(deck_type=deck_type).cards, hand_size):
+        hands.setdefault(canonical_hand(list(combo)), list(combo))
+    return hands
+
+
+@dataclass
+class PreflopEquityTable:
+    """Equity of every canonical starting hand against 1..N opponents with unknown cards."""
+
+    game: str
+    samples: int
+    max_opponents: int
+    # canonical hand -> equity against 1, 2, ... max_opponents opponents
+    equity: dict[str, list[float]] = field(default_factory=dict)
+    _percentiles: dict[str, float] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def lookup(self, cards: list[Card], opponents: int) -> float | None:
+        """Equity of a starting hand, or None if the table does not cover it."""
+        if not 1 <= opponents <= self.max_opponents:
+            return None
+        equities = self.equity.get(canonical_hand(cards))
+        return equities[opponents - 1] if equities else None
+
+    def percentiles(self) -> dict[str, float]:
+        """Strength of each canonical hand as the fraction of all starting hands it beats.
+
+        Hands are ranked by equity against one opponent and weighted by how
+        many concrete hands each canonical hand stands for, so a suited hand
+        counts 4 times and an offsuit one 12 times in Hold'em. Each hand sits
+        at the midpoint of its own share, so values lie strictly inside (0, 1).
+        """
+        if self._percentiles is None:
+            ranked = sorted(self.equity, key=lambda key: self.equity[key][0])
+            combos = {key: _suit_variants(key) for key in ranked}
+            total = sum(combos.values())
+            below = 0
+            self._percentiles = {}
+            for key in ranked:
+                self._percentiles[key] = (below + combos[key] / 2) / total
+                below += combos[key]
+        return self._percentiles
+
+    @classmethod
+    def load(cls, path: Path) -> "PreflopEquityTable":
+        data = json.loads(path.read_text())
+        return cls(
+            game=data["game"],
+            samples=data["samples"],
+            max_opponents=data["max_opponents"],
+            equity=data["equity"],
+        )
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "game": self.game,
+            "samples": self.samples,
+            "max_opponents": self.max_opponents,
+            "equity": self.equity,
+        }
+        path.write_text(json.dumps(data, separators=(",", ":")) + "\n")
+
+
+def _hand_equities(rules: GameRules, max_opponents: int, samples: int, cards: list[Card], seed: int | None):
+    """Equity of one starting hand against 1..max_opponents opponents; runs in a worker."""
+    equities = []
+    for opponents in range(1, max_opponents + 1):
+        players = {"hero": cards} | {f"opp_{i}": [] for i in range(opponents)}
+        result = calculate_equity(
+            rules, players, samples=samples, workers=1, seed=None if seed is None else seed + opponents
+        )
+        equities.append(round(result.players["hero"].equity, 4))
+    return equities
+
+
+def build_preflop_table(
+    rules: GameRules,
+    max_opponents: int,
+    samples: int,
+    workers: int | None = None,
+    seed: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> PreflopEquityTable:
+    """
+    Compute a preflop table for a variant with the equity calculator.
+
+    Args:
+        rules: Variant rules; must be supported by calculate_equity
+        max_opponents: Largest opponent count to tabulate
+        samples: Monte Carlo samples per (hand, opponent count)
+        workers: Processes, each working on whole hands (default: CPU count; 1 runs in-process)
+        seed: Base seed for reproducible tables
+        progress: Called with (hands done, total hands)
+
+    Raises:
+        UnsupportedForEquity: If the variant cannot be modelled or has no hidden starting hand
+    """
+    # Fail before enumerating hands if the calculator cannot model the variant
+    parse_showdown(rules)
+    count_deals(rules.gameplay)
+    hands = sorted(starting_hands(starting_hand_size(rules), DeckType(rules.deck_type)).items())
+    seeds = [None if seed is None else seed + i * max_opponents for i in range(len(hands))]
+    compute = functools.partial(_hand_equities, rules, max_opponents, samples)
+
+    table = PreflopEquityTable(game=rules.game, samples=samples, max_opponents=max_opponents)
+    workers = workers or os.cpu_count() or 1
+    with contextlib.ExitStack() as stack:
+        if workers == 1:
+            results = map(compute, [cards for _, cards in hands], seeds)
+        else:
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            results = pool.map(compute, [cards for _, cards in hands], seeds, chunksize=8)
+        for done, ((key, _), equities) in enumerate(zip(hands, results, strict=True), 1):
+            table.equity[key] = equities
+            if progress:
+                progress(done, len(hands))
+    return table
+
+
+def starting_hand_size(rules: GameRules) -> int:
+    """Face-down cards each player holds at the first betting decision.
+
+    Raises:
+        UnsupportedForEquity: If exposed or community cards come before it
+    """
+    size = 0
+    for step in rules.gameplay:
+        config = step.action_config if isinstance(step.action_config, dict) else {}
+        if step.action_type == GameActionType.BET and config.get("type") in FORCED_BET_TYPES:
+            continue
+        if step.action_type != GameActionType.DEAL:
+            break
+        cards = config.get("cards", [])
+        if config.get("location") != "player" or any(card.get("state") != "face down" for card in cards):
+            raise UnsupportedForEquity("starting hands include exposed or community cards")
+        size += sum(card.get("number", 0) for card in cards)
+    if not size:
+        raise UnsupportedForEquity("no starting hand before the first decision")
+    return size
+
+
+def load_preflop_tables(directory: Path = PREFLOP_EQUITY_DIR) -> dict[str, PreflopEquityTable]:
+    """Every table in a directory, keyed by game name; unreadable files are skipped."""
+    tables = {}
+    for path in sorted(directory.glob("*.json")):
+        try:
+            table = PreflopEquityTable.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Skipping preflop equity table {path.name}: {e}")
+            continue
+        tables[table.game] = table
+    return tables
@@ -183,3 +183,29 @@ class Card:
             raise ValueError(f"Invalid rank or suit in: {card_str}")
 
         return cls(rank=rank, suit=suit)
+
+
+# Compact integer card codes for hot evaluation paths: the rank's index in
+# Rank occupies the high bits and the suit's index in Suit the low three bits,
+# so every card fits in 7 bits and codes index directly into per-code tables.
+RANK_CODES: dict[Rank, int] = {rank: i for i, rank in enumerate(Rank)}
+SUIT_CODES: dict[Suit, int] = {suit: i for i, suit in enumerate(Suit)}
+_RANKS_BY_CODE = list(Rank)
+_SUITS_BY_CODE = list(Suit)
+SUIT_CODE_BITS = 3
+CARD_CODE_LIMIT = len(Rank) << SUIT_CODE_BITS
+
+
+def card_to_code(card: Card) -> int:
+    """Encode a card's rank and suit as a small integer (wild status is not encoded)."""
+    return RANK_CODES[card.rank] << SUIT_CODE_BITS | SUIT_CODES[card.suit]
+
+
+def cards_to_codes(cards: list[Card]) -> list[int]:
+    """Encode a list of cards; see card_to_code."""
+    return [RANK_CODES[card.rank] << SUIT_CODE_BITS | SUIT_CODES[card.suit] for card in cards]
+
+
+def code_to_card(code: int) -> Card:
+    """Decode an integer card code back into a (non-wild) Card."""
+    return Card(rank=_RANKS_BY_CODE[code >> SUIT_CODE_BITS], suit=_SUITS_BY_CODE[code & ((1 << SUIT_CODE_BITS) - 1)])
@@ -1,7 +1,14 @@
 """Cache managers for poker evaluation data."""
 
 import logging
+import mmap
+import os
 import sqlite3
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from generic_poker.evaluation.types import HandRanking
@@ -60,76 +67,380 @@ class SQLiteRankings:
             self._conn.close()
 
 
+# Hand strings are built from a small alphabet (ranks, suits, W/B wild and bug
+# markers with their 1-5 index, X padding). Each character maps to one base-32
+# digit so a whole hand string becomes a single integer via int(..., 32). Digit
+# 0 is never produced, so strings of different lengths can never collide.
+_KEY_ALPHABET = "123456789TJQKARXWBshdcjx"
+_KEY_DIGITS = "0123456789abcdefghijklmnopqrstuv"
+_ENCODE_TABLE = str.maketrans(_KEY_ALPHABET, _KEY_DIGITS[1 : len(_KEY_ALPHABET) + 1])
+_DECODE_TABLE = str.maketrans(_KEY_DIGITS[1 : len(_KEY_ALPHABET) + 1], _KEY_ALPHABET)
+# Deletes every alphabet character; anything left over cannot be packed.
+_STRIP_TABLE = str.maketrans("", "", _KEY_ALPHABET)
+# Hand strings with suits are rank/suit pairs; rank-only strings have none.
+_SUIT_CHARS = frozenset("shdcjx")
+
+# 12 characters * 5 bits = 60 bits, the most that fits an unsigned 64-bit key.
+MAX_PACKED_KEY_LENGTH = 12
+
+
+def encode_hand_key(hand_str: str) -> int:
+    """Encode a canonical hand string (e.g. "AsKsQsJsTs") as an integer key.
+
+    Raises:
+        ValueError: If the string is empty, contains characters outside the key
+            alphabet, or has suits but an odd length
+    """
+    # int() would accept underscores and the base-32 digits translate passes through
+    if not hand_str or hand_str.translate(_STRIP_TABLE):
+        raise ValueError(f"Hand string cannot be packed: {hand_str!r}")
+    if len(hand_str) % 2 and not _SUIT_CHARS.isdisjoint(hand_str):
+        raise ValueError(f"Hand string with suits has an odd length: {hand_str!r}")
+    return int(hand_str.translate(_ENCODE_TABLE), 32)
+
+
+def decode_hand_key(key: int) -> str:
+    """Inverse of encode_hand_key."""
+    digits = []
+    while key:
+        key, digit = divmod(key, 32)
+        digits.append(_KEY_DIGITS[digit])
+    return "".join(reversed(digits)).translate(_DECODE_TABLE)
+
+
+# Binary rankings layout (native little-endian, sections 8-byte aligned):
+#   header: magic, hand count n, sample count m
+#   keys[n] uint64 | sample_ids[m] uint64 | sample_keys[m] uint64 | ranks[n] uint32 | ordered_ranks[n] uint32
+# Fixed-width columns let a file be mapped and searched in place, so every
+# process shares the OS page cache instead of holding its own copy.
+RANKINGS_BINARY_SUFFIX = ".rnk"
+_BINARY_MAGIC = b"GPRANKS1"
+_BINARY_HEADER = struct.Struct("<8sQQ")
+
+
+def _sample_id(rank: int, ordered_rank: int) -> int:
+    """Sortable id for a (rank, ordered_rank) pair."""
+    return rank << 32 | ordered_rank
+
+
+def _typecode_for(max_value: int) -> str:
+    """Smallest unsigned array typecode that can hold max_value."""
+    if max_value < 1 << 8:
+        return "B"
+    if max_value < 1 << 16:
+        return "H"
+    return "I"
+
+
+def read_rankings_csv(csv_file: Path) -> Iterator[tuple[str, int, int]]:
+    """Yield (hand_str, rank, ordered_rank) rows from a rankings CSV, skipping malformed lines."""
+    with open(csv_file) as f:
+        next(f)  # Skip header
+        for line in f:
+            parts = line.strip().rsplit(",", 2)
+            if len(parts) != 3:
+                continue
+            try:
+                rank = int(parts[1])
+                ordered_rank = int(parts[2])
+            except ValueError:
+                continue
+            yield parts[0].replace(",", ""), rank, ordered_rank
+
+
+def write_sqlite_rankings(rows: Iterable[tuple[str, int, int]], db_path: Path, batch_size: int = 50000) -> None:
+    """Write (hand_str, rank, ordered_rank) rows to a new SQLite rankings database.
+
+    Duplicate hand strings keep the last row. The database is built beside
+    the target and renamed into place.
+    """
+    tmp_path = db_path.with_name(db_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    conn = sqlite3.connect(str(tmp_path))
+    conn.execute(
+        "CREATE TABLE hand_rankings (hand_str TEXT PRIMARY KEY, rank INTEGER NOT NULL, ordered_rank INTEGER NOT NULL)"
+    )
+
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            conn.executemany(
+                "INSERT OR REPLACE INTO hand_rankings (hand_str, rank, ordered_rank) VALUES (?, ?, ?)",
+                batch,
+            )
+            batch.clear()
+    if batch:
+        conn.executemany(
+            "INSERT OR REPLACE INTO hand_rankings (hand_str, rank, ordered_rank) VALUES (?, ?, ?)",
+            batch,
+        )
+
+    conn.commit()
+    conn.close()
+    os.replace(tmp_path, db_path)
+
+
+class PackedRankings:
+    """Dict-like interface backed by in-memory integer arrays.
+
+    Hand strings are packed into 64-bit integer keys (see encode_hand_key) and
+    stored in a sorted array('Q') with parallel rank/ordered_rank arrays, so a
+    lookup is a string translate plus a binary search with no database round
+    trip. Implements the same .get()/find_by_rank()/items()/__contains__ surface
+    as SQLiteRankings.
+    """
+
+    def __init__(self, keys, ranks, ordered_ranks, sample_ids, sample_keys, mapped: mmap.mmap | None = None):
+        """
+        Initialize from prebuilt columns (arrays, or memoryviews over a mapped file).
+
+        Args:
+            keys: Sorted, unique packed hand keys
+            ranks: Rank for each key (parallel to keys)
+            ordered_ranks: Ordered rank for each key (parallel to keys)
+            sample_ids: Sorted (rank, ordered_rank) ids, see _sample_id
+            sample_keys: First key seen in the source file for each sample id
+            mapped: Memory map backing the columns, kept open while in use
+        """
+        self._keys = keys
+        self._ranks = ranks
+        self._ordered_ranks = ordered_ranks
+        self._sample_ids = sample_ids
+        self._sample_keys = sample_keys
+        self._mapped = mapped
+
+    @classmethod
+    def from_csv(cls, csv_file: Path) -> "PackedRankings":
+        """Compile a rankings CSV into packed arrays.
+
+        Duplicate hand strings keep the last row, matching the INSERT OR REPLACE
+        semantics of the SQLite conversion.
+
+        Raises:
+            ValueError: If the file is missing or a hand string cannot be packed
+        """
+        if not csv_file.exists():
+            raise ValueError(f"Rankings file not found: {csv_file}")
+        return cls.from_rows(read_rankings_csv(csv_file))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[str, int, int]]) -> "PackedRankings":
+        """Compile (hand_str, rank, ordered_rank) rows into packed arrays.
+
+        Duplicate hand strings keep the last row. The first row seen for each
+        (rank, ordered_rank) becomes its find_by_rank sample.
+
+        Raises:
+            ValueError: If a hand string cannot be packed
+        """
+        raw_keys = array("Q")
+        raw_ranks = array("I")
+        raw_ordered = array("I")
+        samples: dict[int, int] = {}
+        for hand_str, rank, ordered_rank in rows:
+            if len(hand_str) > MAX_PACKED_KEY_LENGTH or hand_str.translate(_STRIP_TABLE):
+                raise ValueError(f"Hand string cannot be packed: {hand_str}")
+            key = encode_hand_key(hand_str)
+            raw_keys.append(key)
+            raw_ranks.append(rank)
+            raw_ordered.append(ordered_rank)
+            samples.setdefault(_sample_id(rank, ordered_rank), key)
+
+        # Stable sort keeps duplicate keys in input order, so the last one wins below.
+        order = sorted(range(len(raw_keys)), key=raw_keys.__getitem__)
+        keys = array("Q")
+        ranks = array(_typecode_for(max(raw_ranks, default=0)))
+        ordered_ranks = array(_typecode_for(max(raw_ordered, default=0)))
+        for i in order:
+            if keys and keys[-1] == raw_keys[i]:
+                ranks[-1] = raw_ranks[i]
+                ordered_ranks[-1] = raw_ordered[i]
+                continue
+            keys.append(raw_keys[i])
+            ranks.append(raw_ranks[i])
+            ordered_ranks.append(raw_ordered[i])
+
+        sample_ids = array("Q", sorted(samples))
+        sample_keys = array("Q", (samples[sample_id] for sample_id in sample_ids))
+        return cls(keys, ranks, ordered_ranks, sample_ids, sample_keys)
+
+    @classmethod
+    def from_binary(cls, binary_file: Path) -> "PackedRankings":
+        """Map a binary rankings file (see write_binary) without copying it.
+
+        Raises:
+            ValueError: If the file is missing, truncated or not a rankings file
+        """
+        if sys.byteorder != "little":
+            raise ValueError("Binary rankings require a little-endian host")
+        try:
+            with open(binary_file, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Cannot map binary rankings {binary_file}: {e}") from e
+
+        if len(mapped) < _BINARY_HEADER.size:
+            raise ValueError(f"Truncated binary rankings: {binary_file}")
+        magic, count, sample_count = _BINARY_HEADER.unpack_from(mapped)
+        if magic != _BINARY_MAGIC:
+            raise ValueError(f"Not a binary rankings file: {binary_file}")
+        if len(mapped) != _BINARY_HEADER.size + 8 * (count + 2 * sample_count) + 4 * (2 * count):
+            raise ValueError(f"Truncated binary rankings: {binary_file}")
+
+        view = memoryview(mapped)
+        offset = _BINARY_HEADER.size
+        columns = []
+        for length, typecode in ((count, "Q"), (sample_count, "Q"), (sample_count, "Q"), (count, "I"), (count, "I")):
+            size = length * struct.calcsize(typecode)
+            columns.append(view[offset : offset + size].cast(typecode))
+            offset += size
+        keys, sample_ids, sample_keys, ranks, ordered_ranks = columns
+        return cls(keys, ranks, ordered_ranks, sample_ids, sample_keys, mapped=mapped)
+
+    def write_binary(self, binary_file: Path) -> None:
+        """Write these rankings in the fixed-width binary format.
+
+        The file is written beside the target and renamed into place, so
+        processes mapping the old file are never shown a partial one, and
+        processes writing it at the same time never share a partial one.
+        """
+        if sys.byteorder != "little":
+            raise ValueError("Binary rankings require a little-endian host")
+        tmp_file = binary_file.with_name(f"{binary_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(_BINARY_HEADER.pack(_BINARY_MAGIC, len(self._keys), len(self._sample_ids)))
+            for column, typecode in (
+                (self._keys, "Q"),
+                (self._sample_ids, "Q"),
+                (self._sample_keys, "Q"),
+                (self._ranks, "I"),
+                (self._ordered_ranks, "I"),
+            ):
+                f.write(array(typecode, column).tobytes())
+        os.replace(tmp_file, binary_file)
+
+    def _index_of(self, hand_str: str) -> int | None:
+        try:
+            key = encode_hand_key(hand_str)
+        except ValueError:
+            return None
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            return i
+        return None
+
+    def lookup_key(self, key: int) -> tuple[int, int] | None:
+        """Look up (rank, ordered_rank) by an already-packed hand key."""
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            return self._ranks[i], self._ordered_ranks[i]
+        return None
+
+    def columns(self) -> tuple:
+        """The sorted key column and its parallel rank and ordered_rank columns (buffer objects)."""
+        return self._keys, self._ranks, self._ordered_ranks
+
+    def get(self, hand_str: str) -> HandRanking | None:
+        """Look up a hand ranking by hand string."""
+        i = self._index_of(hand_str)
+        if i is None:
+            return None
+        return HandRanking(hand_str=hand_str, rank=self._ranks[i], ordered_rank=self._ordered_ranks[i])
+
+    def items(self) -> Iterator[tuple[str, HandRanking]]:
+        """Iterate over all rankings in key order."""
+        for key, rank, ordered_rank in zip(self._keys, self._ranks, self._ordered_ranks, strict=True):
+            hand_str = decode_hand_key(key)
+            yield hand_str, HandRanking(hand_str=hand_str, rank=rank, ordered_rank=ordered_rank)
+
+    def find_by_rank(self, rank: int, ordered_rank: int) -> str | None:
+        """Find a hand string by rank and ordered_rank."""
+        sample_id = _sample_id(rank, ordered_rank)
+        i = bisect_left(self._sample_ids, sample_id)
+        if i < len(self._sample_ids) and self._sample_ids[i] == sample_id:
+            return decode_hand_key(self._sample_keys[i])
+        return None
+
+    def __contains__(self, key: str) -> bool:
+        return self._index_of(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
 class HandRankingsCache:
     """Singleton cache manager for hand rankings data.
 
-    Uses SQLite databases for lookups instead of loading entire CSV files
-    into memory. CSV files are automatically converted to SQLite on first access.
+    Rankings are loaded once per process as a PackedRankings table: mapped
+    from a prebuilt binary file (see tools/generate_rankings/build_binary_rankings.py)
+    when one is present and up to date, otherwise compiled from the CSV and
+    saved as that binary file for the next process to map. Files
+    whose hand strings do not fit a packed key fall back to a SQLite database,
+    converted from the CSV on first access.
     """
 
     _instance = None
-    _rankings: dict[str, SQLiteRankings] = {}
+    _rankings: dict[str, PackedRankings | SQLiteRankings] = {}
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def get_rankings(self, eval_type: str, rankings_file: Path) -> SQLiteRankings:
-        """Get rankings for evaluation type, using SQLite for lookups."""
+    def get_rankings(self, eval_type: str, rankings_file: Path) -> PackedRankings | SQLiteRankings:
+        """Get rankings for evaluation type, compiling them on first access."""
         if eval_type not in self._rankings:
-            db_path = rankings_file.with_suffix(".db")
-            if not db_path.exists():
-                logger.info(f"Converting {rankings_file.name} to SQLite for {eval_type}")
-                self._convert_csv_to_sqlite(rankings_file, db_path)
-            logger.info(f"Opening SQLite rankings for {eval_type} from {db_path.name}")
-            self._rankings[eval_type] = SQLiteRankings(db_path)
+            self._rankings[eval_type] = self._load_rankings(eval_type, rankings_file)
         else:
-            logger.debug(f"Using cached SQLite rankings for {eval_type}")
+            logger.debug(f"Using cached rankings for {eval_type}")
         return self._rankings[eval_type]
 
+    def _load_rankings(self, eval_type: str, rankings_file: Path) -> PackedRankings | SQLiteRankings:
+        """Map or compile packed rankings, falling back to SQLite for unpackable hand strings."""
+        binary_file = rankings_file.with_suffix(RANKINGS_BINARY_SUFFIX)
+        if binary_file.exists() and (
+            not rankings_file.exists() or binary_file.stat().st_mtime >= rankings_file.stat().st_mtime
+        ):
+            try:
+                rankings = PackedRankings.from_binary(binary_file)
+                logger.info(f"Mapped {len(rankings)} binary rankings for {eval_type} from {binary_file.name}")
+                return rankings
+            except ValueError as e:
+                logger.warning(f"Ignoring binary rankings for {eval_type}: {e}")
+        elif binary_file.exists():
+            logger.warning(f"{binary_file.name} is older than {rankings_file.name}; compiling from CSV")
+
+        db_path = rankings_file.with_suffix(".db")
+        if not rankings_file.exists():
+            # A generator may have written the SQLite database directly
+            if db_path.exists() and db_path.stat().st_size:
+                logger.info(f"Opening SQLite rankings for {eval_type} from {db_path.name}")
+                return SQLiteRankings(db_path)
+            raise ValueError(f"Rankings file not found: {rankings_file}")
+
+        try:
+            rankings = PackedRankings.from_csv(rankings_file)
+        except ValueError as e:
+            logger.info(f"Packed rankings unavailable for {eval_type} ({e}); using SQLite")
+        else:
+            logger.info(f"Compiled {len(rankings)} packed rankings for {eval_type} from {rankings_file.name}")
+            try:
+                rankings.write_binary(binary_file)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not save binary rankings for {eval_type}: {e}")
+            return rankings
+
+        if not db_path.exists():
+            logger.info(f"Converting {rankings_file.name} to SQLite for {eval_type}")
+            self._convert_csv_to_sqlite(rankings_file, db_path)
+        logger.info(f"Opening SQLite rankings for {eval_type} from {db_path.name}")
+        return SQLiteRankings(db_path)
+
     @staticmethod
     def _convert_csv_to_sqlite(csv_file: Path, db_path: Path) -> None:
         """Convert a CSV rankings file to SQLite database."""
         if not csv_file.exists():
             raise ValueError(f"Rankings file not found: {csv_file}")
-
-        conn = sqlite3.connect(str(db_path))
-        conn.execute(
-            "CREATE TABLE hand_rankings ("
-            "hand_str TEXT PRIMARY KEY, "
-            "rank INTEGER NOT NULL, "
-            "ordered_rank INTEGER NOT NULL)"
-        )
-
-        batch = []
-        batch_size = 50000
-        with open(csv_file) as f:
-            next(f)  # Skip header
-            for line in f:
-                parts = line.strip().rsplit(",", 2)
-                if len(parts) != 3:
-                    continue
-                hand_str = parts[0].replace(",", "")
-                try:
-                    rank = int(parts[1])
-                    ordered_rank = int(parts[2])
-                except ValueError:
-                    continue
-                batch.append((hand_str, rank, ordered_rank))
-                if len(batch) >= batch_size:
-                    conn.executemany(
-                        "INSERT OR REPLACE INTO hand_rankings (hand_str, rank, ordered_rank) VALUES (?, ?, ?)",
-                        batch,
-                    )
-                    batch.clear()
-
-        if batch:
-            conn.executemany(
-                "INSERT OR REPLACE INTO hand_rankings (hand_str, rank, ordered_rank) VALUES (?, ?, ?)",
-                batch,
-            )
-
-        conn.commit()
+        write_sqlite_rankings(read_rankings_csv(csv_file), db_path)
         logger.info(f"Created SQLite database: {db_path.name}")
-        conn.close()
@@ -3,8 +3,8 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
 
-from generic_poker.core.card import Card
-from generic_poker.evaluation.cache import HandRankingsCache
+from generic_poker.core.card import CARD_CODE_LIMIT, RANK_CODES, SUIT_CODE_BITS, SUIT_CODES, Card, code_to_card
+from generic_poker.evaluation.cache import HandRankingsCache, encode_hand_key
 from generic_poker.evaluation.constants import HAND_SIZES, PADDED_TYPES, RANK_ONLY_TYPES, RANK_ORDERS, SUIT_ORDER
 from generic_poker.evaluation.types import HandRanking
 
@@ -30,6 +30,76 @@ class BaseEvaluator(ABC):
             self.rankings = self._rankings_cache.get_rankings(eval_type, rankings_file)
         self.padding_required = eval_type in PADDED_TYPES
         self.hand_size = HAND_SIZES[eval_type]
+        self._code_tables: tuple[list, list, list] | None = None
+        self._batch_tables: tuple | None = None
+
+    def _get_code_tables(self) -> tuple[list, list, list]:
+        """
+        Per-card-code tables for the integer evaluation path, built on first use.
+
+        Returns:
+            (sort_keys, tokens, key_digits) indexed by card code. sort_keys matches
+            _sort_cards ordering, tokens matches _cards_to_string output and
+            key_digits is each token's packed rankings key. Codes for ranks outside
+            this evaluation type's rank order map to None.
+        """
+        if self._code_tables is None:
+            sort_keys: list[int | None] = [None] * CARD_CODE_LIMIT
+            tokens: list[str | None] = [None] * CARD_CODE_LIMIT
+            key_digits: list[int | None] = [None] * CARD_CODE_LIMIT
+            for rank, rank_code in RANK_CODES.items():
+                if rank.value not in self.rank_order:
+                    continue
+                rank_index = self.rank_order.index(rank.value)
+                for suit, suit_code in SUIT_CODES.items():
+                    code = rank_code << SUIT_CODE_BITS | suit_code
+                    sort_keys[code] = rank_index * len(SUIT_ORDER) + SUIT_ORDER[suit]
+                    tokens[code] = rank.value if self.rank_only else f"{rank.value}{suit.value}"
+                    key_digits[code] = encode_hand_key(tokens[code])
+            self._code_tables = (sort_keys, tokens, key_digits)
+        return self._code_tables
+
+    def evaluate_codes(self, codes: list[int]) -> tuple[int, int | None]:
+        """
+        Evaluate a hand given as integer card codes (see core.card.card_to_code).
+
+        Codes carry no wild status, so they always describe natural cards. The
+        base implementation decodes back to Card objects; subclasses can
+        override it with a string-free fast path.
+
+        Returns:
+            (rank, ordered_rank) of the hand
+
+        Raises:
+            ValueError: If the hand is invalid for this evaluation type
+        """
+        ranking = self.evaluate([code_to_card(code) for code in codes])
+        if not ranking:
+            raise ValueError(f"Invalid hand codes: {codes}")
+        return ranking.rank, ranking.ordered_rank
+
+    def evaluate_batch_codes(self, codes):
+        """
+        Evaluate many hands of card codes at once.
+
+        The base implementation evaluates each row with evaluate_codes;
+        subclasses can override it with a vectorized lookup.
+
+        Args:
+            codes: numpy integer array of shape (N, k), one hand of card codes per row
+
+        Returns:
+            (ranks, ordered_ranks) as numpy arrays of length N
+
+        Raises:
+            ValueError: If any hand is invalid for this evaluation type
+        """
+        import numpy as np
+
+        results = [self.evaluate_codes([int(code) for code in row]) for row in codes]
+        ranks = np.array([rank for rank, _ in results], dtype=np.int64)
+        ordered_ranks = np.array([ordered or 0 for _, ordered in results], dtype=np.int64)
+        return ranks, ordered_ranks
 
     def _cards_to_string(self, cards: list[Card | str]) -> str:
         """
@@ -0,0 +1,159 @@
+"""Direct best-hand evaluation for the standard high and low families."""
+
+import itertools
+
+from generic_poker.core.card import SUIT_CODE_BITS, SUIT_CODES, Suit
+from generic_poker.evaluation.eval_types.standard import StandardHandEvaluator
+
+_SUIT_MASK = (1 << SUIT_CODE_BITS) - 1
+_COUNT_BITS = 3  # per-rank count field in a shape key; counts never exceed 4
+_NATURAL_SUIT_CODES = [SUIT_CODES[suit] for suit in (Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS)]
+
+
+class DirectHandEvaluator(StandardHandEvaluator):
+    """
+    Standard evaluator that can also pick the best hand out of a larger pool of
+    natural cards (stud, hold'em) without ranking every combination.
+
+    In these families a hand's (rank, ordered_rank) depends only on its rank
+    multiset and on whether it is a flush. The best non-flush hand is therefore
+    a function of the pool's rank counts, and the best flush a function of one
+    suit's ranks; both are worked out once per distinct shape from the rankings
+    table itself and memoised, so results are identical to enumeration and a
+    repeated shape costs one dict lookup.
+    """
+
+    # How a flush affects each supported type: it can only help (high), can only
+    # hurt (2-7 low) or is irrelevant (A-5 low).
+    FLUSH_RULES = {"high": "help", "27_low": "hurt", "a5_low": "ignore"}
+
+    def __init__(self, rankings_file, eval_type: str):
+        super().__init__(rankings_file, eval_type)
+        self.flush_rule = self.FLUSH_RULES[eval_type]
+        # shape key -> (rank, ordered_rank, chosen rank codes)
+        self._shape_results: dict[int, tuple[int, int, tuple[int, ...]]] = {}
+        # frozenset of rank codes in one suit -> (rank, ordered_rank, chosen rank codes)
+        self._flush_results: dict[frozenset[int], tuple[int, int, tuple[int, ...]]] = {}
+
+    def evaluate_best_codes(self, codes: list[int]) -> tuple[int, int, list[int]]:
+        """
+        Find the best hand of this type's size within a pool of card codes.
+
+        Args:
+            codes: Card codes of natural cards (see core.card.card_to_code); at
+                least hand_size of them
+
+        Returns:
+            (rank, ordered_rank, codes of the chosen hand)
+
+        Raises:
+            ValueError: If the pool is too small or holds cards this type cannot rank
+        """
+        if len(codes) < self.hand_size:
+            raise ValueError(f"{self.eval_type} evaluation requires at least {self.hand_size} cards")
+        if len(codes) == self.hand_size:
+            return (*self.evaluate_codes(codes), list(codes))
+
+        suit_ranks: dict[int, list[int]] = {}
+        shape = 0
+        for code in codes:
+            rank_code = code >> SUIT_CODE_BITS
+            shape += 1 << (rank_code * _COUNT_BITS)
+            suit_ranks.setdefault(code & _SUIT_MASK, []).append(rank_code)
+        flush_suit = next((suit for suit, ranks in suit_ranks.items() if len(ranks) >= self.hand_size), None)
+
+        if flush_suit is not None and self.flush_rule == "hurt":
+            # Whether a given rank set is forced into a flush depends on exact
+            # suits, so fall back to ranking each combination.
+            return self._enumerate_best(codes)
+
+        result = self._shape_results.get(shape)
+        if result is None:
+            result = self._best_for_shape(sorted(code >> SUIT_CODE_BITS for code in codes))
+            self._shape_results[shape] = result
+
+        if flush_suit is not None and self.flush_rule == "help":
+            flush_ranks = frozenset(suit_ranks[flush_suit])
+            flush_result = self._flush_results.get(flush_ranks)
+            if flush_result is None:
+                flush_result = self._best_flush(flush_ranks)
+                self._flush_results[flush_ranks] = flush_result
+            if flush_result[:2] < result[:2]:
+                rank, ordered_rank, chosen = flush_result
+                return rank, ordered_rank, [rank_code << SUIT_CODE_BITS | flush_suit for rank_code in chosen]
+
+        rank, ordered_rank, chosen = result
+        return rank, ordered_rank, self._pick_codes(codes, chosen)
+
+    def _enumerate_best(self, codes: list[int]) -> tuple[int, int, list[int]]:
+        """Rank every combination of the pool and keep the first best."""
+        best = None
+        for combo in itertools.combinations(codes, self.hand_size):
+            rank, ordered_rank = self.evaluate_codes(list(combo))
+            if best is None or (rank, ordered_rank) < best[:2]:
+                best = (rank, ordered_rank, list(combo))
+        return best
+
+    def _best_for_shape(self, rank_codes: list[int]) -> tuple[int, int, tuple[int, ...]]:
+        """Best non-flush hand for a pool's rank multiset."""
+        best = None
+        for chosen in set(itertools.combinations(rank_codes, self.hand_size)):
+            rank, ordered_rank = self.evaluate_codes(self._offsuit_codes(chosen))
+            if best is None or (rank, ordered_rank, chosen) < best:
+                best = (rank, ordered_rank, chosen)
+        return best
+
+    def _best_flush(self, rank_codes: frozenset[int]) -> tuple[int, int, tuple[int, ...]]:
+        """Best flush (or straight flush) from one suit's ranks."""
+        suit_code = _NATURAL_SUIT_CODES[0]
+        best = None
+        for chosen in itertools.combinations(sorted(rank_codes), self.hand_size):
+            rank, ordered_rank = self.evaluate_codes([rank_code << SUIT_CODE_BITS | suit_code for rank_code in chosen])
+            if best is None or (rank, ordered_rank) < best[:2]:
+                best = (rank, ordered_rank, chosen)
+        return best
+
+    @staticmethod
+    def _offsuit_codes(rank_codes: tuple[int, ...]) -> list[int]:
+        """
+        Representative codes for a sorted rank multiset that are never a flush.
+
+        Each distinct rank starts its suits one step further along, so copies of
+        a rank get different suits and five distinct ranks cannot share one.
+        """
+        codes = []
+        start = -1
+        previous = None
+        offset = 0
+        for rank_code in rank_codes:
+            if rank_code != previous:
+                start += 1
+                offset = 0
+                previous = rank_code
+            suit_code = _NATURAL_SUIT_CODES[(start + offset) % len(_NATURAL_SUIT_CODES)]
+            codes.append(rank_code << SUIT_CODE_BITS | suit_code)
+            offset += 1
+        return codes
+
+    def _pick_codes(self, codes: list[int], chosen: tuple[int, ...]) -> list[int]:
+        """
+        Map a chosen rank multiset back onto cards from the pool.
+
+        Prefers the earliest cards of each rank, but never returns a flush when
+        flushes matter and another selection of the same ranks exists.
+        """
+        by_rank: dict[int, list[int]] = {}
+        for code in codes:
+            by_rank.setdefault(code >> SUIT_CODE_BITS, []).append(code)
+        needed = {rank_code: chosen.count(rank_code) for rank_code in dict.fromkeys(chosen)}
+        options = [itertools.combinations(by_rank[rank_code], count) for rank_code, count in needed.items()]
+        fallback = None
+        for selection in itertools.product(*options):
+            picked = [code for group in selection for code in group]
+            if self.flush_rule == "ignore" or len({code & _SUIT_MASK for code in picked}) > 1:
+                return picked
+            fallback = fallback or picked
+        return fallback
+
+
+DIRECT_EVAL_TYPES = frozenset(DirectHandEvaluator.FLUSH_RULES)
@@ -3,11 +3,17 @@
 import logging
 
 from generic_poker.core.card import Card, WildType
+from generic_poker.evaluation.cache import PackedRankings
 from generic_poker.evaluation.eval_types.base import BaseEvaluator, HandRanking
 
 logger = logging.getLogger(__name__)
 
 
+def _buffer_dtype(column) -> str:
+    """NumPy dtype string for an array('B'/'H'/'I'/'Q') or a memoryview cast to one."""
+    return "=" + (column.typecode if hasattr(column, "typecode") else column.format)
+
+
 class StandardHandEvaluator(BaseEvaluator):
     """Evaluator for standard poker."""
 
@@ -90,6 +96,113 @@ class StandardHandEvaluator(BaseEvaluator):
 
         return ranking
 
+    def evaluate_codes(self, codes: list[int]) -> tuple[int, int | None]:
+        """
+        Evaluate a hand of natural cards given as integer card codes.
+
+        Sorting uses precomputed per-code keys instead of rank_order.index(), and
+        with packed rankings the lookup key is assembled arithmetically, so no
+        hand string is built.
+
+        Args:
+            codes: Card codes (see core.card.card_to_code)
+
+        Returns:
+            (rank, ordered_rank) of the hand
+        """
+        if len(codes) != self.required_size and not self.padding_required:
+            raise ValueError(f"{self.eval_type} evaluation requires exactly {self.required_size} cards")
+
+        sort_keys, tokens, key_digits = self._get_code_tables()
+        try:
+            sorted_codes = sorted(codes, key=sort_keys.__getitem__)
+        except TypeError:
+            # A code outside this type's rank order (e.g. a joker) has no sort key
+            raise ValueError(f"Invalid hand codes for {self.eval_type}: {codes}") from None
+
+        if isinstance(self.rankings, PackedRankings) and not self.padding_required:
+            shift = 5 if self.rank_only else 10
+            key = 0
+            for code in sorted_codes:
+                key = key << shift | key_digits[code]
+            result = self.rankings.lookup_key(key)
+            if result is None:
+                raise ValueError(f"Invalid hand codes for {self.eval_type}: {codes}")
+            return result
+
+        hand = [tokens[code] for code in sorted_codes]
+        if self.padding_required:
+            hand = self.pad_hand(hand, self.hand_size)
+        hand_str = "".join(hand)
+        ranking = self.rankings.get(hand_str)
+        if not ranking:
+            raise ValueError(f"Invalid hand: {hand_str}")
+        return ranking.rank, ranking.ordered_rank
+
+    def evaluate_batch_codes(self, codes):
+        """
+        Evaluate many hands of card codes with vectorized NumPy operations.
+
+        Rows are canonicalized by sorting on per-code sort keys, packed into
+        rankings keys column by column and located with searchsorted against
+        the sorted key column of the packed rankings. Padded types and SQLite
+        rankings fall back to per-row evaluation.
+
+        Args:
+            codes: numpy integer array of shape (N, k), one hand of card codes per row
+
+        Returns:
+            (ranks, ordered_ranks) as int64 numpy arrays of length N
+
+        Raises:
+            ValueError: If the rows have the wrong size or any hand is invalid
+        """
+        import numpy as np
+
+        codes = np.asarray(codes)
+        if codes.ndim != 2:
+            raise ValueError(f"Expected a 2-D array of card codes, got shape {codes.shape}")
+        if not isinstance(self.rankings, PackedRankings) or self.padding_required:
+            return super().evaluate_batch_codes(codes)
+        if codes.shape[1] != self.required_size:
+            raise ValueError(f"{self.eval_type} evaluation requires exactly {self.required_size} cards")
+
+        sort_keys, key_digits, keys, ranks, ordered_ranks = self._get_batch_tables()
+        if codes.size and (codes.min() < 0 or codes.max() >= len(sort_keys)):
+            raise ValueError(f"Invalid hand codes for {self.eval_type}")
+        row_sort_keys = sort_keys[codes]
+        if (row_sort_keys < 0).any():
+            raise ValueError(f"Invalid hand codes for {self.eval_type}")
+        sorted_codes = np.take_along_axis(codes, np.argsort(row_sort_keys, axis=1, kind="stable"), axis=1)
+
+        shift = np.uint64(5 if self.rank_only else 10)
+        packed = np.zeros(len(codes), dtype=np.uint64)
+        for column in key_digits[sorted_codes].T:
+            packed = (packed << shift) | column
+
+        index = np.searchsorted(keys, packed)
+        found = index < len(keys)
+        found[found] = keys[index[found]] == packed[found]
+        if not found.all():
+            raise ValueError(f"Invalid hand codes for {self.eval_type}: {codes[~found][0].tolist()}")
+        return ranks[index].astype(np.int64), ordered_ranks[index].astype(np.int64)
+
+    def _get_batch_tables(self):
+        """NumPy views of the code tables and packed rankings columns, built on first use."""
+        if self._batch_tables is None:
+            import numpy as np
+
+            sort_keys, _, key_digits = self._get_code_tables()
+            keys, ranks, ordered_ranks = self.rankings.columns()
+            self._batch_tables = (
+                np.array([-1 if key is None else key for key in sort_keys], dtype=np.int64),
+                np.array([0 if digit is None else digit for digit in key_digits], dtype=np.uint64),
+                np.frombuffer(keys, dtype=np.uint64),
+                np.frombuffer(ranks, dtype=_buffer_dtype(ranks)),
+                np.frombuffer(ordered_ranks, dtype=_buffer_dtype(ordered_ranks)),
+            )
+        return self._batch_tables
+
     def get_sample_hand(self, rank, ordered_rank) -> str:
         """
         Get a sample hand for a specific rank and ordered rank.
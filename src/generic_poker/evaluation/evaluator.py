@@ -1,14 +1,17 @@
 """Main poker hand evaluation interface."""
 
 import csv
+import itertools
 import logging
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
-from generic_poker.core.card import Card
+from generic_poker.core.card import Card, cards_to_codes
 from generic_poker.core.hand import PlayerHand
 from generic_poker.evaluation.eval_types.base import BaseEvaluator, HandRanking
+from generic_poker.evaluation.eval_types.direct import DIRECT_EVAL_TYPES, DirectHandEvaluator
 from generic_poker.evaluation.eval_types.large import LargeHandEvaluator
 from generic_poker.evaluation.eval_types.standard import StandardHandEvaluator
 from generic_poker.evaluation.evaluation_config import evaluation_config_loader
@@ -136,6 +139,10 @@ class HandEvaluator:
     Now loads evaluator configurations from JSON files instead of hardcoded mappings.
     """
 
+    # Comparison tables indexed by (rank, ordered_rank), shared by all instances;
+    # None records a table file that does not exist.
+    _comparison_tables: dict[Path, dict[tuple[int, int], tuple[int, float]] | None] = {}
+
     def __init__(self):
         """Initialize evaluator."""
         self._evaluators: dict[EvaluationType, BaseEvaluator] = {}
@@ -215,6 +222,55 @@ class HandEvaluator:
 
         return result
 
+    def evaluate_codes(
+        self, codes: list[int], eval_type: EvaluationType, qualifier: list[int] | None = None
+    ) -> HandResult:
+        """
+        Evaluate a hand given as integer card codes.
+
+        Equivalent to evaluate_hand for natural (non-wild) cards, but skips Card
+        sorting and hand string building. Hot loops can encode cards once with
+        core.card.cards_to_codes and evaluate many combinations of the codes.
+
+        Args:
+            codes: Card codes to evaluate
+            eval_type: Type of evaluation to use
+            qualifier: Minimum hand requirement [rank, ordered_rank]
+
+        Returns:
+            HandResult with rank and ordered_rank
+        """
+        rank, ordered_rank = self.get_evaluator(eval_type).evaluate_codes(codes)
+        result = HandResult(rank=rank, ordered_rank=ordered_rank)
+        if qualifier and not self._meets_qualifier(result, qualifier):
+            return HandResult(rank=0)
+        return result
+
+    def evaluate_batch(self, cards, eval_type: EvaluationType):
+        """
+        Evaluate many hands of natural cards in one vectorized call.
+
+        Requires numpy (an optional dependency: pip install generic_poker[numpy]).
+
+        Args:
+            cards: numpy integer array (e.g. int8) of shape (N, k) holding card
+                codes (see core.card.cards_to_codes), one hand per row
+            eval_type: Type of evaluation to use
+
+        Returns:
+            (ranks, ordered_ranks) as int64 numpy arrays of length N; ordered_rank
+            is 0 for types without one
+
+        Raises:
+            ImportError: If numpy is not installed
+            ValueError: If the rows have the wrong size or any hand is invalid
+        """
+        try:
+            import numpy  # noqa: F401
+        except ImportError as e:
+            raise ImportError("evaluate_batch requires numpy: pip install generic_poker[numpy]") from e
+        return self.get_evaluator(eval_type).evaluate_batch_codes(cards)
+
     def get_sample_hand(self, eval_type: EvaluationType, rank: int, ordered_rank: int) -> list[Card]:
         """
         Get a sample hand for a specific evaluation type and rank.
@@ -295,6 +351,158 @@ class HandEvaluator:
 
         return 0  # Completely tied
 
+    def best_of(
+        self, hands: Iterable[Sequence[Card]], eval_type: EvaluationType, qualifier: list[int] | None = None
+    ) -> tuple[int, HandResult] | None:
+        """
+        Find the best of several candidate hands, evaluating each exactly once.
+
+        Unlike a compare_hands loop, the incumbent best hand is never
+        re-evaluated: each candidate is ranked once and its (rank, ordered_rank)
+        kept. Ties keep the earliest candidate.
+
+        Args:
+            hands: Candidate hands, each of the evaluation type's hand size
+            eval_type: Type of evaluation to use
+            qualifier: Minimum hand requirement applied to the best hand
+
+        Returns:
+            (index of the best candidate, its HandResult), or None if there were
+            no candidates. If the best hand does not meet the qualifier its
+            result has rank 0.
+        """
+        hand_evaluator = self.get_evaluator(eval_type)
+        best_index = None
+        best_key = None
+        best_ranking = None
+        for index, hand in enumerate(hands):
+            ranking = hand_evaluator.evaluate(list(hand))
+            key = (ranking.rank, ranking.ordered_rank if ranking.ordered_rank is not None else 0)
+            if best_key is None or key < best_key:
+                best_index, best_key, best_ranking = index, key, ranking
+
+        if best_index is None:
+            return None
+        result = HandResult.from_ranking(best_ranking)
+        if qualifier and not self._meets_qualifier(result, qualifier):
+            result = HandResult(rank=0)
+        return best_index, result
+
+    def best_hand(
+        self,
+        hole: Sequence[Card],
+        community: Sequence[Card],
+        hole_count: int,
+        community_count: int,
+        eval_type: EvaluationType,
+        qualifier: list[int] | None = None,
+    ) -> tuple[list[Card], HandResult] | None:
+        """
+        Find the best hand using exactly hole_count hole and community_count community cards.
+
+        Every combination is evaluated once (Omaha's 60 combinations cost 60
+        lookups, not 120 as with pairwise compare_hands).
+
+        Args:
+            hole: Player's hole cards
+            community: Available community cards
+            hole_count: Number of hole cards the hand must use
+            community_count: Number of community cards the hand must use
+            eval_type: Type of evaluation to use
+            qualifier: Minimum hand requirement applied to the best hand
+
+        Returns:
+            (cards, HandResult) with the hole cards first in cards, or None if
+            there are not enough cards to form a hand
+        """
+        # A hand drawn from one pool only (stud, or community-only boards) can
+        # use the direct best-of-N path
+        if community_count == 0:
+            return self.best_any(hole, hole_count, eval_type, qualifier)
+        if hole_count == 0:
+            return self.best_any(community, community_count, eval_type, qualifier)
+
+        hole_combos = list(itertools.combinations(hole, hole_count))
+        community_combos = list(itertools.combinations(community, community_count))
+        hands = [h + c for h in hole_combos for c in community_combos]
+        best = self.best_of(hands, eval_type, qualifier)
+        if best is None:
+            return None
+        index, result = best
+        return list(hands[index]), result
+
+    def best_any(
+        self, cards: Sequence[Card], count: int, eval_type: EvaluationType, qualifier: list[int] | None = None
+    ) -> tuple[list[Card], HandResult] | None:
+        """
+        Find the best hand using any count of the given cards.
+
+        For the high, 2-7 low and A-5 low families a pool of natural cards is
+        handed to DirectHandEvaluator in one call; anything else (other types,
+        wild cards, partial hands) ranks each combination via best_of.
+
+        Args:
+            cards: Cards to choose from
+            count: Number of cards the hand must use
+            eval_type: Type of evaluation to use
+            qualifier: Minimum hand requirement applied to the best hand
+
+        Returns:
+            (cards, HandResult) with the chosen cards in pool order, or None if
+            there are fewer than count cards
+        """
+        if len(cards) < count:
+            return None
+        hand_evaluator = self.get_evaluator(eval_type)
+        if (
+            isinstance(hand_evaluator, DirectHandEvaluator)
+            and count == hand_evaluator.hand_size
+            and not any(card.is_wild for card in cards)
+        ):
+            codes = cards_to_codes(list(cards))
+            rank, ordered_rank, chosen = hand_evaluator.evaluate_best_codes(codes)
+            remaining = list(chosen)
+            hand = []
+            for card, code in zip(cards, codes, strict=True):
+                if code in remaining:
+                    remaining.remove(code)
+                    hand.append(card)
+            result = HandResult(rank=rank, ordered_rank=ordered_rank)
+            if qualifier and not self._meets_qualifier(result, qualifier):
+                result = HandResult(rank=0)
+            return hand, result
+
+        hands = list(itertools.combinations(cards, count))
+        best = self.best_of(hands, eval_type, qualifier)
+        if best is None:
+            return None
+        index, result = best
+        return list(hands[index]), result
+
+    def best_codes(self, codes: list[int], count: int, eval_type: EvaluationType) -> tuple[int, int] | None:
+        """
+        Best (rank, ordered_rank) using any count of the given card codes.
+
+        The integer counterpart of best_any for hot loops such as bot rollouts.
+
+        Returns:
+            (rank, ordered_rank) with ordered_rank 0 when the type has none, or
+            None if there are fewer than count codes
+        """
+        if len(codes) < count:
+            return None
+        hand_evaluator = self.get_evaluator(eval_type)
+        if isinstance(hand_evaluator, DirectHandEvaluator) and count == hand_evaluator.hand_size:
+            rank, ordered_rank, _ = hand_evaluator.evaluate_best_codes(codes)
+            return rank, ordered_rank
+        best = None
+        for combo in itertools.combinations(codes, count):
+            rank, ordered_rank = hand_evaluator.evaluate_codes(list(combo))
+            key = (rank, ordered_rank if ordered_rank is not None else 0)
+            if best is None or key < best:
+                best = key
+        return best
+
     def get_hand_size_for_type(self, eval_type: EvaluationType) -> int:
         """Get the required hand size for an evaluation type."""
         config = evaluation_config_loader.get_config(eval_type.value)
@@ -356,6 +564,8 @@ class HandEvaluator:
         # Special cases that need the large hand evaluator
         if eval_type.value == "ne_seven_card_high":
             return LargeHandEvaluator
+        if eval_type.value in DIRECT_EVAL_TYPES:
+            return DirectHandEvaluator
         return StandardHandEvaluator
 
     def validate_all_enum_types(self) -> dict[str, bool]:
@@ -436,10 +646,9 @@ class HandEvaluator:
         # Get the comparison table file path
         comparison_file = self._get_comparison_file(smaller_eval_type, larger_eval_type)
 
-        if comparison_file.exists():
-            # Load the comparison table
-            comparison_table = self._load_comparison_table(comparison_file)
-
+        # Load the comparison table index (parsed once per process)
+        comparison_table = self._load_comparison_table(comparison_file)
+        if comparison_table is not None:
             # Map the smaller hand's rank to the larger hand's system
             equivalent_rank = self._get_equivalent_rank(
                 comparison_table, smaller_result.rank, smaller_result.ordered_rank
@@ -491,28 +700,40 @@ class HandEvaluator:
         file_name = f"{smaller_eval_type.value}_{larger_eval_type.value}_comparison.csv"
         return comparison_dir / file_name
 
-    def _load_comparison_table(self, file_path: Path) -> list[dict[str, str]]:
+    def _load_comparison_table(self, file_path: Path) -> dict[tuple[int, int], tuple[int, float]] | None:
         """
-        Load the comparison table from a CSV file.
+        Load a comparison table, indexed by the smaller hand's (rank, ordered_rank).
+
+        Each file is parsed once per process and shared by all HandEvaluator
+        instances.
 
         Args:
             file_path: Path to the CSV file
 
         Returns:
-            List of dictionaries containing the table rows
+            Mapping of (rank, ordered_rank) to the equivalent (rank, ordered_rank)
+            in the larger hand's system, or None if the file does not exist
         """
-        with open(file_path) as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+        if file_path not in self._comparison_tables:
+            table = None
+            if file_path.exists():
+                table = {}
+                with open(file_path) as f:
+                    for row in csv.DictReader(f):
+                        key = (int(row["two_card_rank"]), int(row["two_card_ordered_rank"]))
+                        # Keep the first row for a key, as the linear scan it replaces did
+                        table.setdefault(key, (int(row["five_card_rank"]), float(row["five_card_ordered_rank"])))
+            self._comparison_tables[file_path] = table
+        return self._comparison_tables[file_path]
 
     def _get_equivalent_rank(
-        self, table: list[dict[str, str]], rank: int, ordered_rank: int | None
+        self, table: dict[tuple[int, int], tuple[int, float]], rank: int, ordered_rank: int | None
     ) -> tuple[int, float] | None:
         """
         Map the smaller hand's rank and ordered rank to the larger hand's system.
 
         Args:
-            table: Loaded comparison table
+            table: Loaded comparison table index
             rank: Primary rank of the smaller hand
             ordered_rank: Secondary ordered rank of the smaller hand
 
@@ -522,13 +743,7 @@ class HandEvaluator:
         """
         # Handle case where ordered_rank is None
         ordered_rank = ordered_rank if ordered_rank is not None else 0
-
-        for row in table:
-            if int(row["two_card_rank"]) == rank and int(row["two_card_ordered_rank"]) == ordered_rank:
-                mapped_rank = int(row["five_card_rank"])
-                mapped_ordered_rank = float(row["five_card_ordered_rank"])
-                return (mapped_rank, mapped_ordered_rank)
-        return None
+        return table.get((rank, ordered_rank))
 
     def _meets_qualifier(self, result: HandResult | None, qualifier: list[int]) -> bool:
         """Check if hand meets qualifier requirements."""
@@ -547,6 +762,8 @@ class HandEvaluator:
         """Get appropriate evaluator class for eval type."""
         if eval_type == EvaluationType.NE_SEVEN_CARD_HIGH:
             return LargeHandEvaluator
+        if eval_type.value in DIRECT_EVAL_TYPES:
+            return DirectHandEvaluator
         return StandardHandEvaluator
 
 
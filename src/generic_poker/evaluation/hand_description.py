@@ -5,9 +5,31 @@ from generic_poker.core.card import Card, Rank
 from generic_poker.evaluation.constants import BASE_RANKS, RANK_ORDERS, SUIT_ORDER
 from generic_poker.evaluation.evaluator import EvaluationType, HandEvaluator, evaluator
 
+# Parsed description files, shared by every describer that uses them:
+# file name -> description indexed by rank (None where the file has no entry)
+_DESCRIPTION_TABLES: dict[str, list[str | None]] = {}
+
+
+def _card_token(card: Card) -> str:
+    """String for a card that also distinguishes wild status."""
+    return f"{card}*{card.wild_type.value}" if card.is_wild and card.wild_type else str(card)
+
 
 class HandDescriber:
-    """Generates human-readable descriptions for poker hands."""
+    """
+    Generates human-readable descriptions for poker hands.
+
+    Use HandDescriber.for_type() to share one describer per evaluation type
+    across the process; descriptions load on first use and results are
+    memoised per hand.
+    """
+
+    # Maximum memoised descriptions per describer; the memo is cleared when full
+    MEMO_SIZE = 50_000
+
+    _instances: dict[EvaluationType, "HandDescriber"] = {}
+    # One evaluator shared by all describers, created with the first of them
+    _shared_evaluator: HandEvaluator | None = None
 
     HAND_DESCRIPTION_FILES: dict[EvaluationType, str] = {
         EvaluationType.HIGH: "all_card_hands_description_high.csv",
@@ -46,14 +68,43 @@ class HandDescriber:
     }
 
     def __init__(self, eval_type: EvaluationType):
-        """Initialize with evaluation type."""
+        """Initialize with evaluation type; descriptions are loaded on first use."""
         self.eval_type = eval_type
-        self.descriptions = self._load_hand_descriptions()
-        self.evaluator = HandEvaluator()
+        if HandDescriber._shared_evaluator is None:
+            HandDescriber._shared_evaluator = HandEvaluator()
+        self.evaluator = HandDescriber._shared_evaluator
+        self._description_table: list[str | None] | None = None
+        self._memo: dict[tuple[bool, str], str] = {}
 
         # Get the proper rank ordering for this evaluation type
         self.rank_order = RANK_ORDERS.get(eval_type.value, BASE_RANKS)
 
+    @classmethod
+    def for_type(cls, eval_type: EvaluationType) -> "HandDescriber":
+        """Get the process-wide describer for an evaluation type."""
+        describer = cls._instances.get(eval_type)
+        if describer is None:
+            describer = cls._instances[eval_type] = cls(eval_type)
+        return describer
+
+    def _get_description(self, rank: int) -> str:
+        """Basic description for a rank, loading the description table on first use."""
+        if self._description_table is None:
+            file_name = self.HAND_DESCRIPTION_FILES.get(self.eval_type)
+            if file_name in _DESCRIPTION_TABLES:
+                self._description_table = _DESCRIPTION_TABLES[file_name]
+            else:
+                descriptions = self._load_hand_descriptions()
+                table: list[str | None] = [None] * (max(descriptions, default=-1) + 1)
+                for table_rank, description in descriptions.items():
+                    table[table_rank] = description
+                self._description_table = table
+                if file_name and descriptions:
+                    _DESCRIPTION_TABLES[file_name] = table
+        table = self._description_table
+        description = table[rank] if 0 <= rank < len(table) else None
+        return description if description is not None else f"Rank {rank}"
+
     def _load_hand_descriptions(self) -> dict[int, str]:
         """Load hand descriptions from CSV files."""
         descriptions = {}
@@ -112,11 +163,23 @@ class HandDescriber:
 
     def describe_hand(self, cards: list[Card]) -> str:
         """Get a basic description of the hand."""
-        return self._describe_hand(cards, detailed=False)
+        # The basic description depends only on the hand's rank, so card order is irrelevant
+        return self._memoized(False, "".join(sorted(_card_token(card) for card in cards)), cards)
 
     def describe_hand_detailed(self, cards: list[Card]) -> str:
         """Get a detailed description of the hand."""
-        return self._describe_hand(cards, detailed=True)
+        return self._memoized(True, "".join(_card_token(card) for card in cards), cards)
+
+    def _memoized(self, detailed: bool, hand_key: str, cards: list[Card]) -> str:
+        """Describe a hand, reusing the result for a hand already seen."""
+        key = (detailed, hand_key)
+        description = self._memo.get(key)
+        if description is None:
+            description = self._describe_hand(cards, detailed)
+            if len(self._memo) >= self.MEMO_SIZE:
+                self._memo.clear()
+            self._memo[key] = description
+        return description
 
     def _get_highest_rank(self, cards: list[Card]) -> Rank:
         """
@@ -154,7 +217,7 @@ class HandDescriber:
             return "Invalid Hand"
 
         # Get basic description
-        basic_desc = self.descriptions.get(hand_result.rank, f"Rank {hand_result.rank}")
+        basic_desc = self._get_description(hand_result.rank)
 
         # For non-detailed, just return the basic description
         if not detailed:
@@ -71,6 +71,10 @@ class BettingManager(ABC):
         # may contribute across a whole hand. 0 = no cap. Set by Game.
         self.hand_cap: int = 0
         self.hand_contributed: dict[str, int] = {}  # player_id -> chips put in this hand
+        # Voluntary action this hand, for opponent modelling (bots): bets and
+        # raises made, and chips put in beyond forced bets.
+        self.hand_aggression: dict[str, int] = {}
+        self.hand_voluntary: dict[str, int] = {}
         # Stud 4th-street open-pair double bet (Robert's Rules 8.7). Set by Game.
         self.open_pair_double_rule: bool = False
         self.big_increment_engaged: bool = False  # a big-size raise was made on 4th street
@@ -353,6 +357,12 @@ class BettingManager(ABC):
             # A per-hand money cap makes the player all-in once their cap is reached.
             is_all_in = amount_to_add >= self.effective_stack(player_id, stack)
 
+            if not is_forced and bet_type != BetType.BRING_IN:
+                if amount > self.current_bet:
+                    self.hand_aggression[player_id] = self.hand_aggression.get(player_id, 0) + 1
+                if amount_to_add > 0:
+                    self.hand_voluntary[player_id] = self.hand_voluntary.get(player_id, 0) + amount_to_add
+
             # Track raise size if this bet is raising
             if amount > self.current_bet:
                 raise_size = amount - self.current_bet
@@ -505,6 +515,8 @@ class BettingManager(ABC):
         self.cap_reached = False
         self.big_increment_engaged = False
         self.hand_contributed.clear()  # Reset per-hand money-cap tracking
+        self.hand_aggression.clear()
+        self.hand_voluntary.clear()
         self.pot.new_hand()  # Reset pot for new hand
 
 
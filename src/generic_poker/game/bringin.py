@@ -40,8 +40,7 @@ class BringInDeterminator:
 
         eval_type = cls._get_dynamic_eval_type(num_cards, card_rule, rules=rules)
 
-        best_player = None
-        best_cards = None
+        candidates: list[tuple[Player, list[Card]]] = []
         for player in players:
             visible_cards = [c for c in player.hand.get_cards() if c.visibility == Visibility.FACE_UP][:num_cards]
             if not visible_cards:
@@ -56,9 +55,11 @@ class BringInDeterminator:
                     eval_cards.append(clone)
                 else:
                     eval_cards.append(c)
-            if best_cards is None or evaluator.compare_hands(eval_cards, best_cards, eval_type) > 0:
-                best_cards = eval_cards
-                best_player = player
+            candidates.append((player, eval_cards))
+
+        # Rank each player's visible cards once; ties keep the earlier player
+        best = evaluator.best_of([cards for _, cards in candidates], eval_type)
+        best_player = candidates[best[0]][0] if best is not None else None
 
         if best_player is None:
             logger.warning("No players with visible cards found, returning None")
@@ -58,6 +58,7 @@ class Game:
         max_raises_override: int | None = None,  # Limit: override bet+N raise cap
         unlimited_raises: bool = False,  # Limit: disable the raise cap entirely
         hand_cap: int = 0,  # NL/PL: max chips a player may lose per hand (0 = off)
+        describe_hands: bool = True,  # False skips hand name text in results (headless simulation)
     ):
         """
         Initialize new game.
@@ -136,6 +137,7 @@ class Game:
         self.showdown_manager = ShowdownManager(self.table, self.betting, self.rules)
         # Give the showdown manager a reference to the game instance for access to game_choices
         self.showdown_manager.game = self
+        self.showdown_manager.describe_hands = describe_hands
 
         self.state = GameState.WAITING
         self.current_step = -1  # Not started
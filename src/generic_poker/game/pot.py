@@ -1,8 +1,7 @@
 """Pot management and distribution."""
 
-import copy
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from generic_poker.game.table import Player
 
@@ -30,6 +29,17 @@ class ActivePot:
         """Return descriptive name of pot."""
         return "Main Pot" if self.main_pot else f"Side Pot {self.order}"
 
+    def copy(self) -> "ActivePot":
+        """Independent copy; cheaper than deepcopy since the fields are flat sets and dicts."""
+        return replace(
+            self,
+            eligible_players=set(self.eligible_players),
+            active_players=set(self.active_players),
+            excluded_players=set(self.excluded_players),
+            player_bets=dict(self.player_bets),
+            player_antes=dict(self.player_antes),
+        )
+
     def __str__(self):
         bets = ", ".join(f"{pid}:{amt}" for pid, amt in self.player_bets.items())
         antes = ", ".join(f"{pid}:{amt}" for pid, amt in self.player_antes.items())
@@ -81,8 +91,8 @@ class Pot:
 
         if last_round:
             new_round = RoundPots(
-                main_pot=copy.deepcopy(last_round.main_pot),
-                side_pots=[copy.deepcopy(pot) for pot in last_round.side_pots],
+                main_pot=last_round.main_pot.copy(),
+                side_pots=[pot.copy() for pot in last_round.side_pots],
                 round_number=self.current_round,
             )
             eligible_players = set(last_round.main_pot.eligible_players)
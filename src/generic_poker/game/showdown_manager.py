@@ -27,6 +27,8 @@ class ShowdownManager:
         self.table = table
         self.betting = betting
         self.rules = rules
+        # Whether hand results carry display text; headless simulation turns it off
+        self.describe_hands = True
         self.declarations: dict[str, dict[int, str]] = {}
 
     def handle_showdown(self) -> GameResult:
@@ -477,14 +479,12 @@ class ShowdownManager:
                     if len(comm_cards) >= required_community:
                         hand.extend(list(itertools.combinations(comm_cards, required_community))[0])
 
-                from generic_poker.evaluation.hand_description import HandDescriber
-
-                describer = HandDescriber(eval_type)
+                hand_name, hand_description = self._describe_hand(hand, eval_type)
                 result = HandResult(
                     player_id=player.id,
                     cards=hand,
-                    hand_name=describer.describe_hand(hand),
-                    hand_description=describer.describe_hand_detailed(hand),
+                    hand_name=hand_name,
+                    hand_description=hand_description,
                     hand_type=config.get("name"),
                     evaluation_type=eval_type.value,
                     used_hole_cards=unused_hole[:required_hole],
@@ -496,6 +496,15 @@ class ShowdownManager:
 
         return config_results
 
+    def _describe_hand(self, hand: list[Card], eval_type: EvaluationType) -> tuple[str, str]:
+        """Short and detailed hand names, or empty strings when describe_hands is off."""
+        if not self.describe_hands:
+            return "", ""
+        from generic_poker.evaluation.hand_description import HandDescriber
+
+        describer = HandDescriber.for_type(eval_type)
+        return describer.describe_hand(hand), describer.describe_hand_detailed(hand)
+
     def _update_hand_results(self, hand_results: dict, config_results: dict, config_name: str) -> None:
         """Update hand_results dictionary with new configuration results."""
         for player_id, result in config_results.items():
@@ -969,9 +978,6 @@ class ShowdownManager:
         else:
             required_hole = int(required_hole)
 
-        best_hand = None
-        best_used_hole_cards = []
-
         # Generate hole card combinations
         if required_hole == 0:
             hole_combos = [tuple()]
@@ -981,20 +987,28 @@ class ShowdownManager:
         else:
             hole_combos = list(itertools.combinations(hole_cards, required_hole))
 
-        # For each hole card combination, try all valid community combinations
-        for hole_combo in hole_combos:
-            # Generate all valid community card combinations based on subset requirements
-            community_combinations = self._generate_subset_combinations(community_cards, subset_requirements)
-
-            for comm_combo in community_combinations:
-                hand = list(hole_combo) + list(comm_combo)
+        # Generate all valid community card combinations based on subset requirements
+        community_combinations = self._generate_subset_combinations(community_cards, subset_requirements)
 
-                if best_hand is None or evaluator.compare_hands(hand, best_hand, eval_type) > 0:
-                    best_hand = hand
-                    best_used_hole_cards = list(hole_combo)
+        # For each hole card combination, try all valid community combinations
+        candidates = [
+            (list(hole_combo) + list(comm_combo), list(hole_combo))
+            for hole_combo in hole_combos
+            for comm_combo in community_combinations
+        ]
+        best_hand, best_used_hole_cards = self._best_candidate(candidates, eval_type) or ([], [])
 
         logger.debug(f"Best hand found: {best_hand}")
-        return best_hand if best_hand else [], best_used_hole_cards
+        return best_hand, best_used_hole_cards
+
+    def _best_candidate(
+        self, candidates: list[tuple[list[Card], list[Card]]], eval_type: EvaluationType
+    ) -> tuple[list[Card], list[Card]] | None:
+        """Pick the best (hand, used_hole_cards) candidate, evaluating each hand once."""
+        best = evaluator.best_of([hand for hand, _ in candidates], eval_type)
+        if best is None:
+            return None
+        return candidates[best[0]]
 
     def _generate_subset_combinations(
         self, community_cards: dict[str, list[Card]], subset_requirements: list[dict[str, Any]]
@@ -1390,10 +1404,7 @@ class ShowdownManager:
         Returns:
             Dictionary mapping player IDs to their best hand results
         """
-        from generic_poker.evaluation.hand_description import HandDescriber
-
         hand_type = hand_config.get("name", "Hand")
-        describer = HandDescriber(eval_type)
         results = {}
 
         zero_cards_pip_value = hand_config.get("zeroCardsPipValue")
@@ -1443,13 +1454,14 @@ class ShowdownManager:
                 continue
 
             # Create hand result with used_hole_cards
+            hand_name, hand_description = self._describe_hand(best_hand, eval_type)
             results[player.id] = HandResult(
                 player_id=player.id,
                 cards=best_hand,
                 rank=rank_result.rank,
                 ordered_rank=rank_result.ordered_rank,
-                hand_name=describer.describe_hand(best_hand),
-                hand_description=describer.describe_hand_detailed(best_hand),
+                hand_name=hand_name,
+                hand_description=hand_description,
                 hand_type=hand_type,
                 evaluation_type=eval_type.value,
                 community_cards=self.table.community_cards,
@@ -1903,8 +1915,7 @@ class ShowdownManager:
         eval_type: EvaluationType,
     ) -> tuple[list[Card], list[Card]]:
         """Find best hand using 'combinations' configuration."""
-        best_hand = None
-        best_used_hole_cards = []
+        candidates = []
 
         for combo in showdown_rules["combinations"]:
             required_hole = combo["holeCards"]
@@ -1927,13 +1938,11 @@ class ShowdownManager:
             # Try each combination
             for hole_combo in hole_combos:
                 for comm_combo in comm_combos:
-                    hand = list(hole_combo) + list(comm_combo)
-                    if best_hand is None or evaluator.compare_hands(hand, best_hand, eval_type) > 0:
-                        best_hand = hand
-                        best_used_hole_cards = list(hole_combo)
+                    candidates.append((list(hole_combo) + list(comm_combo), list(hole_combo)))
 
-        if best_hand:
-            return best_hand, best_used_hole_cards
+        best = self._best_candidate(candidates, eval_type)
+        if best and best[0]:
+            return best
         else:
             logger.warning("No valid hand combinations found")
             return [], []
@@ -1948,8 +1957,7 @@ class ShowdownManager:
         """Find best hand using communityCardSelectCombinations configuration."""
         select_combinations = showdown_rules.get("communityCardSelectCombinations", [])
         required_hole = showdown_rules.get("holeCards", 2)
-        best_hand = None
-        best_used_hole_cards = []
+        candidates = []
 
         # Process each select combination (a group of subset selections)
         for combination in select_combinations:
@@ -2003,14 +2011,10 @@ class ShowdownManager:
 
                     # Try all valid hole card combinations
                     for hole_combo in itertools.combinations(hole_cards, required_hole):
-                        hand = list(hole_combo) + community_selection
+                        candidates.append((list(hole_combo) + community_selection, list(hole_combo)))
 
-                        # Check if this hand is better than our current best
-                        if best_hand is None or evaluator.compare_hands(hand, best_hand, eval_type) > 0:
-                            best_hand = hand
-                            best_used_hole_cards = list(hole_combo)
-
-        return best_hand if best_hand else [], best_used_hole_cards
+        best_hand, best_used_hole_cards = self._best_candidate(candidates, eval_type) or ([], [])
+        return best_hand, best_used_hole_cards
 
     def _find_hand_with_any_cards(
         self,
@@ -2029,25 +2033,26 @@ class ShowdownManager:
 
         if allowed_combinations:
             # Evaluate each allowed combination
+            hands = []
             for combo in allowed_combinations:
                 subset_cards = []
                 for subset_name in combo["hole_subsets"]:
                     subset_cards.extend(player.hand.get_subset(subset_name))
                 all_cards = subset_cards + comm_cards
                 if len(all_cards) >= total_cards:
-                    for hand_combo in itertools.combinations(all_cards, total_cards):
-                        hand = list(hand_combo)
-                        if best_hand is None or evaluator.compare_hands(hand, best_hand, eval_type) > 0:
-                            best_hand = hand
-                            best_used_hole_cards = [c for c in hand if c in hole_cards]
+                    hands.extend(list(hand_combo) for hand_combo in itertools.combinations(all_cards, total_cards))
+            best = evaluator.best_of(hands, eval_type)
+            if best is not None:
+                best_hand = hands[best[0]]
         else:
+            # One pool of cards: the evaluator picks the best N directly where it can
             all_cards = hole_cards + comm_cards
-            if len(all_cards) >= total_cards:
-                for hand_combo in itertools.combinations(all_cards, total_cards):
-                    hand = list(hand_combo)
-                    if best_hand is None or evaluator.compare_hands(hand, best_hand, eval_type) > 0:
-                        best_hand = hand
-                        best_used_hole_cards = [c for c in hand if c in hole_cards]
+            best = evaluator.best_any(all_cards, total_cards, eval_type)
+            if best is not None:
+                best_hand = best[0]
+
+        if best_hand is not None:
+            best_used_hole_cards = [c for c in best_hand if c in hole_cards]
 
         # If there are no community cards or exactly the right number of hole cards,
         # we can just use the hole cards (straight poker case)
@@ -2072,8 +2077,7 @@ class ShowdownManager:
         """Find best hand with multiple hole card options."""
         hole_options = showdown_rules["holeCards"]
         comm_options = showdown_rules.get("communityCards", [])
-        best_hand = None
-        best_used_hole_cards = []
+        candidates = []
 
         # If communityCards is a single value, convert it to a list for consistency
         if isinstance(comm_options, int):
@@ -2099,17 +2103,12 @@ class ShowdownManager:
             # Try all combinations for this option
             for hole_combo in hole_combos:
                 for comm_combo in community_combos:
-                    # Combine the two sets of cards
-                    hand = list(hole_combo) + list(comm_combo)
-
-                    # Compare with our best hand so far
-                    if best_hand is None or evaluator.compare_hands(hand, best_hand, eval_type) > 0:
-                        best_hand = hand
-                        best_used_hole_cards = list(hole_combo)
+                    candidates.append((list(hole_combo) + list(comm_combo), list(hole_combo)))
 
         # If we found a valid hand, return it
-        if best_hand:
-            return best_hand, best_used_hole_cards
+        best = self._best_candidate(candidates, eval_type)
+        if best and best[0]:
+            return best
         else:
             logger.warning("No valid hand combinations found")
             return [], []
@@ -2126,8 +2125,7 @@ class ShowdownManager:
         required_hole = showdown_rules.get("holeCards", 0)
         total_cards = showdown_rules.get("totalCards", 5)  # Default to 5 if not specified
         required_community = total_cards - required_hole
-        best_hand = None
-        best_used_hole_cards = []
+        candidates = []
 
         for combo in combinations:
             # Collect cards from all subsets in this combination
@@ -2148,12 +2146,10 @@ class ShowdownManager:
                 # Evaluate all combinations for this combination
                 for hole_combo in hole_combos:
                     for comm_combo in community_combos:
-                        hand = list(hole_combo) + list(comm_combo)
-                        if best_hand is None or evaluator.compare_hands(hand, best_hand, eval_type) > 0:
-                            best_hand = hand
-                            best_used_hole_cards = list(hole_combo)
+                        candidates.append((list(hole_combo) + list(comm_combo), list(hole_combo)))
 
-        return best_hand if best_hand else [], best_used_hole_cards
+        best_hand, best_used_hole_cards = self._best_candidate(candidates, eval_type) or ([], [])
+        return best_hand, best_used_hole_cards
 
     def _find_hand_with_hole_and_community(
         self,
@@ -2168,8 +2164,6 @@ class ShowdownManager:
         required_community = showdown_rules.get("communityCards", 0)
         allowed_combinations = showdown_rules.get("holeCardsAllowed", [])
         padding = showdown_rules.get("padding", False)
-        best_hand = None
-        best_used_hole_cards = []
 
         # Special case for "all" hole cards
         if required_hole == "all":
@@ -2198,6 +2192,11 @@ class ShowdownManager:
             )
             return [], []
 
+        # Stud-style hands choose from the hole cards alone
+        if required_community == 0 and len(hole_cards) > required_hole > 0:
+            best = evaluator.best_any(hole_cards, required_hole, eval_type)
+            return (best[0], best[0]) if best is not None else ([], [])
+
         # Generate combinations only for categories with requirements > 0
         # use the minimum of the cards we have and the required list, since padding will take care of the rest
         hole_combos = (
@@ -2209,23 +2208,17 @@ class ShowdownManager:
             [tuple()] if required_community == 0 else list(itertools.combinations(comm_cards, required_community))
         )
 
-        # Try all combinations and find the best
-        for hole_combo in hole_combos:
-            for comm_combo in community_combos:
-                # Combine the two sets of cards
-                hand = list(hole_combo) + list(comm_combo)
-
-                # Compare with our best hand so far
-                if best_hand is None:
-                    best_hand = hand
-                    best_used_hole_cards = list(hole_combo)
-                else:
-                    # Use compare_hands to determine which is better
-                    if evaluator.compare_hands(hand, best_hand, eval_type) > 0:
-                        best_hand = hand
-                        best_used_hole_cards = list(hole_combo)
+        candidates = [
+            (list(hole_combo) + list(comm_combo), list(hole_combo))
+            for hole_combo in hole_combos
+            for comm_combo in community_combos
+        ]
 
-        return best_hand if best_hand else [], best_used_hole_cards
+        # A single candidate needs no evaluation; otherwise rank each once and keep the best
+        if len(candidates) == 1:
+            return candidates[0]
+        best_hand, best_used_hole_cards = self._best_candidate(candidates, eval_type) or ([], [])
+        return best_hand, best_used_hole_cards
 
     def _find_hand_with_player_hand_size(
         self,
@@ -2296,25 +2289,21 @@ class ShowdownManager:
             return [], []
 
         # Generate combinations
-        best_hand = None
-        best_used_hole_cards = []
-
         hole_combos = list(itertools.combinations(hole_cards, required_hole))
         community_combos = (
             [tuple()] if required_community == 0 else list(itertools.combinations(comm_cards, required_community))
         )
 
         # Try all combinations and find the best
-        for hole_combo in hole_combos:
-            for comm_combo in community_combos:
-                hand = list(hole_combo) + list(comm_combo)
-
-                if best_hand is None or evaluator.compare_hands(hand, best_hand, eval_type) > 0:
-                    best_hand = hand
-                    best_used_hole_cards = list(hole_combo)
+        candidates = [
+            (list(hole_combo) + list(comm_combo), list(hole_combo))
+            for hole_combo in hole_combos
+            for comm_combo in community_combos
+        ]
+        best_hand, best_used_hole_cards = self._best_candidate(candidates, eval_type) or ([], [])
 
         logger.debug(f"Best hand found with playerHandSize: {best_hand}")
-        return best_hand if best_hand else [], best_used_hole_cards
+        return best_hand, best_used_hole_cards
 
     def _find_best_hand_for_player(
         self, player: Player, community_cards: dict[str, list[Card]], showdown_rules: dict, eval_type: EvaluationType
@@ -1,6 +1,5 @@
 """Enhanced Table implementation with realistic poker seating."""
 
-import itertools
 import logging
 import random
 from dataclasses import dataclass
@@ -612,19 +611,9 @@ class Table:
 
         required_size = HAND_SIZES.get(eval_type.value, 5)
 
-        def best_n_cards(cards, n):
-            """Find the best n-card subset from cards for the eval type."""
-            if len(cards) <= n:
-                return cards
-            best = None
-            for combo in itertools.combinations(cards, n):
-                combo_list = list(combo)
-                if best is None or evaluator.compare_hands(combo_list, best, eval_type) > 0:
-                    best = combo_list
-            return best or cards[:n]
-
         best_player = None
         best_hand = None
+        best_key = None
 
         for player in active_players:
             player_visible = [c for c in player.hand.get_cards() if c.visibility == Visibility.FACE_UP]
@@ -633,9 +622,13 @@ class Table:
             if len(all_visible) < required_size:
                 continue
             try:
-                player_hand = best_n_cards(all_visible, required_size)
-                if best_hand is None or evaluator.compare_hands(player_hand, best_hand, eval_type) > 0:
+                # Each player's visible combinations are ranked once; players are
+                # then compared on the resulting (rank, ordered_rank) keys.
+                player_hand, result = evaluator.best_hand(all_visible, [], required_size, 0, eval_type)
+                key = (result.rank, result.ordered_rank if result.ordered_rank is not None else 0)
+                if best_key is None or key < best_key:
                     best_hand = player_hand
+                    best_key = key
                     best_player = player
             except (ValueError, KeyError) as e:
                 # Skip players whose hands can't be evaluated (e.g., joker in lookup table)
@@ -725,12 +718,15 @@ class Table:
         """Deal hole cards to all active players."""
         active_players = [p for p in self.players.values() if p.is_active]
         cards_dealt = {player.id: [] for player in active_players}
+        # Formatting a line per card is measurable in bulk simulation
+        log_cards = logger.isEnabledFor(logging.INFO)
 
         for _ in range(num_cards):
             for player in active_players:
                 card = self.deck.deal_card(face_up=face_up)
                 if card:
-                    logger.info(f"  Dealt {card} to player {player.name} in subset '{subset}'")
+                    if log_cards:
+                        logger.info(f"  Dealt {card} to player {player.name} in subset '{subset}'")
                     player.hand.add_card(card)
                     cards_dealt[player.id].append(card)
                     if subset and subset != "default":
@@ -761,6 +757,7 @@ class Table:
         if subsets is None:
             subsets = ["default"]
         cards_dealt = []
+        log_cards = logger.isEnabledFor(logging.DEBUG)
         for _ in range(num_cards):
             card = self.deck.deal_card(face_up=face_up)
             if card:
@@ -769,7 +766,8 @@ class Table:
                     if subset not in self.community_cards:
                         self.community_cards[subset] = []
                     self.community_cards[subset].append(card)
-                    logger.debug(f"Dealt {card} to community subset '{subset}'")
+                    if log_cards:
+                        logger.debug(f"Dealt {card} to community subset '{subset}'")
         return cards_dealt
 
     def expose_community_cards(self, subset: str = "default", indices: list[int] | None = None) -> None:
@@ -0,0 +1,15 @@
+"""Headless hand simulation for bots, benchmarks and bulk experiments."""
+
+from generic_poker.sim.policies import Decision, PassivePolicy, Policy, RandomPolicy
+from generic_poker.sim.simulator import HandSimulator, SimStats, advance_non_player_steps, play_hand
+
+__all__ = [
+    "Decision",
+    "HandSimulator",
+    "PassivePolicy",
+    "Policy",
+    "RandomPolicy",
+    "SimStats",
+    "advance_non_player_steps",
+    "play_hand",
+]
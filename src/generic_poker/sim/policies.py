@@ -0,0 +1,136 @@
+"""Decision policies for headless simulation.
+
+A policy is anything with ``choose_action_full(valid_actions, game, player_id)``
+returning an object with ``action``, ``amount``, ``cards`` and
+``declaration_data`` — the same contract the web bots (SimpleBot,
+MonteCarloBot) implement, so they can be seated in a simulation unchanged.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Protocol
+
+from generic_poker.core.card import Visibility
+from generic_poker.game.game import Game, PlayerAction
+
+BET_ACTIONS = {PlayerAction.BET, PlayerAction.RAISE, PlayerAction.CALL, PlayerAction.COMPLETE}
+CARD_ACTIONS = {
+    PlayerAction.DRAW,
+    PlayerAction.DISCARD,
+    PlayerAction.EXPOSE,
+    PlayerAction.PASS,
+    PlayerAction.SEPARATE,
+    PlayerAction.REPLACE_COMMUNITY,
+}
+
+# Relative weights of the betting actions RandomPolicy picks from
+ACTION_WEIGHTS = {
+    PlayerAction.FOLD: 20,
+    PlayerAction.CHECK: 70,
+    PlayerAction.CALL: 60,
+    PlayerAction.BET: 20,
+    PlayerAction.RAISE: 20,
+    PlayerAction.COMPLETE: 20,
+}
+
+
+@dataclass
+class Decision:
+    """A chosen action with everything Game.player_action needs."""
+
+    action: PlayerAction
+    amount: int | None = None
+    cards: list | None = None
+    declaration_data: list | None = None
+
+
+class Policy(Protocol):
+    def choose_action_full(self, valid_actions: list[tuple], game: Game, player_id: str) -> Decision: ...
+
+
+class RandomPolicy:
+    """Weighted random valid actions, like SimpleBot, but with its own seeded RNG.
+
+    Never folds when it can check, mostly checks or calls, and sizes bets
+    towards the minimum. Card actions pick random cards within the step's
+    limits, so every variant can be played to showdown.
+    """
+
+    def __init__(self, seed: int | None = None):
+        self._rng = random.Random(seed)
+
+    def choose_action_full(self, valid_actions: list[tuple], game: Game, player_id: str) -> Decision:
+        first = valid_actions[0]
+        action = first[0]
+        if action in CARD_ACTIONS:
+            return self._choose_cards(first, game, player_id)
+        if action == PlayerAction.DECLARE:
+            options = getattr(game, "current_declare_config", {}).get("options") or ["high"]
+            return Decision(action, 0, declaration_data=[{"pot_index": -1, "declaration": options[0]}])
+        if action == PlayerAction.BUY:
+            # Always buy when the step allows it
+            return Decision(action, (first[2] if len(first) > 2 else 0) or 0)
+        if action in (PlayerAction.CHOOSE, PlayerAction.BRING_IN):
+            # First option / minimum bring-in
+            return Decision(action, (first[1] if len(first) > 1 else 0) or 0)
+        return self._choose_bet(valid_actions)
+
+    def _choose_bet(self, valid_actions: list[tuple]) -> Decision:
+        can_check = any(a[0] == PlayerAction.CHECK for a in valid_actions)
+        weights = [0 if a[0] == PlayerAction.FOLD and can_check else ACTION_WEIGHTS.get(a[0], 5) for a in valid_actions]
+        chosen = self._rng.choices(valid_actions, weights=weights)[0]
+        action = chosen[0]
+        min_amount = chosen[1] if len(chosen) > 1 else None
+        max_amount = chosen[2] if len(chosen) > 2 else None
+        if action not in BET_ACTIONS or min_amount is None:
+            return Decision(action)
+        if max_amount is not None and max_amount > min_amount:
+            # Favour smaller bets
+            return Decision(action, min_amount + int((max_amount - min_amount) * min(self._rng.expovariate(2.0), 1.0)))
+        return Decision(action, min_amount)
+
+    def _choose_cards(self, action_tuple: tuple, game: Game, player_id: str) -> Decision:
+        action = action_tuple[0]
+        min_cards = (action_tuple[1] if len(action_tuple) > 1 else 0) or 0
+        max_cards = (action_tuple[2] if len(action_tuple) > 2 else 0) or 0
+        hand = list(game.table.players[player_id].hand.get_cards())
+
+        if action == PlayerAction.REPLACE_COMMUNITY:
+            community = list(
+                {id(card): card for cards in game.table.community_cards.values() for card in cards}.values()
+            )
+            return Decision(action, 0, cards=self._rng.sample(community, min(min_cards, len(community))))
+        if action == PlayerAction.SEPARATE:
+            # The engine splits the ordered hand by the configured subset sizes
+            self._rng.shuffle(hand)
+            return Decision(action, 0, cards=hand)
+        if action == PlayerAction.EXPOSE:
+            hand = [card for card in hand if card.visibility == Visibility.FACE_DOWN]
+            count = min(min_cards or 1, len(hand))
+        elif action == PlayerAction.PASS:
+            count = min(max_cards or min_cards or 1, len(hand))
+        else:
+            count = self._discard_count(min_cards, min(max_cards, len(hand)))
+        return Decision(action, 0, cards=self._rng.sample(hand, count))
+
+    def _discard_count(self, min_cards: int, max_cards: int) -> int:
+        return self._rng.randint(min_cards, max_cards) if max_cards > min_cards else min_cards
+
+
+class PassivePolicy(RandomPolicy):
+    """Checks or calls every bet and discards as little as allowed.
+
+    Nobody folds, so every hand reaches showdown with all players — the
+    deterministic baseline the engine benchmarks use.
+    """
+
+    def _choose_bet(self, valid_actions: list[tuple]) -> Decision:
+        by_type = {a[0]: a for a in valid_actions}
+        for action in (PlayerAction.CHECK, PlayerAction.CALL):
+            if action in by_type:
+                chosen = by_type[action]
+                return Decision(action, chosen[1] if len(chosen) > 1 else None)
+        return super()._choose_bet(valid_actions)
+
+    def _discard_count(self, min_cards: int, max_cards: int) -> int:
+        return min_cards
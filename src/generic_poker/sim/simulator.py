@@ -0,0 +1,185 @@
+"""Headless hand simulation: complete hands through Game, no web layer.
+
+A HandSimulator seats one policy per player at a single Game and plays hands
+back to back on it, reusing the Game, Table, players and betting state. Each
+hand still gets a freshly built deck: cards are mutable (visibility, wild
+status) and end up referenced by hand results, so recycling them would leak
+state between hands.
+
+Display-only work is switched off: hand results carry no HandDescriber text,
+and engine logging is disabled for the duration of run(). Stacks are reset
+before every hand, so each player's result is a plain sum of per-hand deltas.
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+
+from generic_poker.config.loader import BettingStructure, GameActionType, GameRules
+from generic_poker.game.game import Game
+from generic_poker.game.game_state import GameState
+from generic_poker.sim.policies import Policy, RandomPolicy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STACK = 200
+# Hands that take more decisions than this are treated as stalled
+MAX_ACTIONS_PER_HAND = 500
+# Blinds, bets, bring-in and ante; each variant uses the ones its structure needs
+DEFAULT_STAKES = {"small_blind": 1, "big_blind": 2, "small_bet": 2, "big_bet": 4, "bring_in": 1, "ante": 1}
+
+
+@dataclass
+class SimStats:
+    """Throughput and per-player results of a simulation run."""
+
+    variant: str
+    hands: int = 0
+    completed: int = 0
+    stalled: int = 0
+    elapsed_s: float = 0.0
+    # player id -> chips won over completed hands
+    profit: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def hands_per_sec(self) -> float:
+        return self.hands / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+def advance_non_player_steps(game: Game) -> None:
+    """Run dealing and other automatic steps until a player must act or the hand ends."""
+    while game.state != GameState.COMPLETE:
+        if game.current_step >= len(game.rules.gameplay):
+            break
+        if game.state == GameState.DEALING:
+            step = game.rules.gameplay[game.current_step]
+            if step.action_type == GameActionType.CHOOSE and game.current_player is not None:
+                break
+            game._next_step()
+        elif game.state == GameState.BETTING and game.current_player is None:
+            game._next_step()
+        else:
+            break
+
+
+def play_hand(game: Game, policies: dict[str, Policy]) -> bool:
+    """Play one hand to completion. Returns False if the hand stalled or a decision was rejected."""
+    game.start_hand(shuffle_deck=True)
+    advance_non_player_steps(game)
+
+    for _ in range(MAX_ACTIONS_PER_HAND):
+        if game.state == GameState.COMPLETE:
+            return True
+        player = game.current_player
+        if player is None:
+            advance_non_player_steps(game)
+            if game.current_player is None and game.state != GameState.COMPLETE:
+                return False
+            continue
+
+        valid_actions = game.get_valid_actions(player.id)
+        if not valid_actions:
+            return False
+        decision = policies[player.id].choose_action_full(valid_actions, game, player.id)
+        result = game.player_action(
+            player.id,
+            decision.action,
+            decision.amount or 0,
+            cards=decision.cards,
+            declaration_data=decision.declaration_data,
+        )
+        if not result.success:
+            logger.warning(f"{player.id} {decision.action.value} rejected: {result.error}")
+            return False
+        if result.advance_step and game.state != GameState.COMPLETE:
+            game._next_step()
+            advance_non_player_steps(game)
+    return game.state == GameState.COMPLETE
+
+
+@contextmanager
+def logging_disabled(level: int = logging.CRITICAL) -> Iterator[None]:
+    """Suppress log records up to level (and skip guarded log formatting) inside the block."""
+    previous = logging.root.manager.disable
+    logging.disable(level)
+    try:
+        yield
+    finally:
+        logging.disable(previous)
+
+
+class HandSimulator:
+    """Plays hands of one variant back to back with pluggable policies."""
+
+    def __init__(
+        self,
+        rules: GameRules,
+        policies: list[Policy] | None = None,
+        num_players: int | None = None,
+        structure: BettingStructure | None = None,
+        stack: int = DEFAULT_STACK,
+        seed: int | None = None,
+        quiet: bool = True,
+    ):
+        """
+        Args:
+            rules: Variant to play
+            policies: One policy per seat (default: RandomPolicy for every seat)
+            num_players: Seats when no policies are given (default: the variant's minimum, at least 2)
+            structure: Betting structure (default: the variant's first)
+            stack: Chips every player starts each hand with
+            seed: Seeds the deck and the default policies for reproducible runs
+            quiet: Disable logging while run() plays hands
+        """
+        if policies is None:
+            count = num_players or max(2, rules.min_players)
+            policies = [RandomPolicy(None if seed is None else seed + i) for i in range(count)]
+        if not rules.min_players <= len(policies) <= rules.max_players:
+            raise ValueError(f"{rules.game} needs {rules.min_players}-{rules.max_players} players")
+
+        self.rules = rules
+        self.stack = stack
+        self.quiet = quiet
+        self.game = Game(
+            rules,
+            structure=structure or rules.betting_structures[0],
+            auto_progress=False,
+            describe_hands=False,
+            **DEFAULT_STAKES,
+        )
+        self.game.table.set_deck_seed(seed)
+        self.policies: dict[str, Policy] = {}
+        for i, policy in enumerate(policies):
+            player_id = f"sim_{i}"
+            self.policies[player_id] = policy
+            # Fixed seats (1-based), so seeded runs do not depend on random seating
+            self.game.add_player(player_id, f"Sim {i}", stack, preferred_seat=i + 1)
+
+    def play_hand(self) -> dict[str, int] | None:
+        """Play one hand from fresh stacks; chip deltas per player, or None if it stalled."""
+        players = self.game.table.players.values()
+        for player in players:
+            player.stack = self.stack
+        self.game.table.move_button()
+        if not play_hand(self.game, self.policies):
+            return None
+        return {player.id: player.stack - self.stack for player in players}
+
+    def run(self, hands: int) -> SimStats:
+        """Play a number of hands and report throughput and results."""
+        stats = SimStats(self.rules.game, profit=dict.fromkeys(self.policies, 0))
+        started = time.perf_counter()
+        with logging_disabled() if self.quiet else nullcontext():
+            for _ in range(hands):
+                deltas = self.play_hand()
+                stats.hands += 1
+                if deltas is None:
+                    stats.stalled += 1
+                    continue
+                stats.completed += 1
+                for player_id, delta in deltas.items():
+                    stats.profit[player_id] += delta
+        stats.elapsed_s = time.perf_counter() - started
+        return stats
@@ -7,6 +7,7 @@ from .config import get_config
 from .database import init_database
 from .db_utils import cleanup_inactive_tables, get_database_health
 from .migrations import create_sample_data_if_needed, get_database_info, reset_database, setup_database
+from .services.hand_history_service import HandHistoryService
 
 
 def create_app(config_name: str = "development") -> Flask:
@@ -102,5 +103,33 @@ def health_check(config):
         click.echo(f"  Error: {health.get('error', 'Unknown error')}")
 
 
+@cli.command()
+@click.option("--config", default="development", help="Configuration to use")
+@click.option("--output", type=click.File("w"), default="-", help="File to write (default: stdout)")
+@click.option("--table-id", default=None, help="Only hands at this table")
+@click.option("--user-id", default=None, help="Only hands this player was dealt into")
+@click.option("--since", type=click.DateTime(), default=None, help="Only hands completed at or after this time")
+@click.option("--until", type=click.DateTime(), default=None, help="Only hands completed before this time")
+def export_hands(config, output, table_id, user_id, since, until):
+    """Export hand history as newline-delimited JSON, one hand per line."""
+    app = create_app(config)
+    count = 0
+    with app.app_context():
+        for line in HandHistoryService.export_ndjson(table_id=table_id, user_id=user_id, since=since, until=until):
+            output.write(line)
+            count += 1
+    click.echo(f"Exported {count} hands.", err=True)
+
+
+@cli.command()
+@click.option("--config", default="development", help="Configuration to use")
+def compact_hands(config):
+    """Re-encode hand history stored as JSON text into compact payloads."""
+    app = create_app(config)
+    with app.app_context():
+        compacted, skipped = HandHistoryService.compact_legacy_hands()
+    click.echo(f"Compacted {compacted} hands ({skipped} unreadable, left as they were).")
+
+
 if __name__ == "__main__":
     cli()
@@ -36,6 +36,12 @@ class Config:
 
     # Bot settings — "mc" (Monte Carlo equity) or "simple" (random weighted)
     BOT_TYPE = os.environ.get("BOT_TYPE", "mc")
+    # Worker processes for MC bot rollouts; 0 runs them inside the web process
+    BOT_WORKERS = int(os.environ.get("BOT_WORKERS", "2"))
+
+    # Write completed hands (history, session state, stacks) from a background
+    # worker instead of the Socket.IO handler that finished the hand
+    HAND_PERSISTENCE_ASYNC = os.environ.get("HAND_PERSISTENCE_ASYNC", "true").lower() == "true"
 
     # Debug: allow the /api/debug stacked/seeded deck endpoints (T009). Off by
     # default; enable per-environment (dev/testing) or via env var to reproduce
@@ -123,6 +129,12 @@ class TestingConfig(Config):
     # Allow the debug stacked-deck endpoints in tests
     DEBUG_ALLOW_STACKED_DECK = True
 
+    # Run MC bot rollouts in-process in tests
+    BOT_WORKERS = 0
+
+    # Write completed hands inline in tests
+    HAND_PERSISTENCE_ASYNC = False
+
 
 class ProductionConfig(Config):
     """Production configuration."""
@@ -8,6 +8,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from .database import db
 from .models import GameHistory, PokerTable, Transaction, User
+from .services.hand_history_service import HandHistoryService
 
 logger = logging.getLogger(__name__)
 
@@ -215,7 +216,7 @@ def get_user_statistics(user_id: str) -> dict[str, Any]:
         total_winnings = sum(t.amount for t in transactions if t.transaction_type == Transaction.TYPE_WINNINGS)
 
         # Get game history statistics
-        game_count = GameHistory.query.join(PokerTable).filter(GameHistory.players.contains(user_id)).count()
+        game_count = HandHistoryService.count_player_hands(user_id)
 
         return {
             "user_id": user_id,
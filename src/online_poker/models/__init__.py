@@ -3,7 +3,7 @@
 from .chat import ChatFilter, ChatMessage, ChatModerationAction
 from .custom_mix import CustomMix
 from .disabled_variant import DisabledVariant
-from .game_history import GameHistory
+from .game_history import GameHistory, GameHistoryPlayer
 from .game_session_state import GameSessionState
 from .table import PokerTable
 from .table_access import TableAccess
@@ -18,6 +18,7 @@ __all__ = [
     "TableAccess",
     "Transaction",
     "GameHistory",
+    "GameHistoryPlayer",
     "GameSessionState",
     "ChatMessage",
     "ChatModerationAction",
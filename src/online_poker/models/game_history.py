@@ -5,16 +5,23 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, LargeBinary, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import db
+from .hand_encoding import decode_hand, encode_hand
 
 
 class GameHistory(db.Model):
-    """Model for storing completed poker hands."""
+    """Model for storing completed poker hands.
+
+    Players, actions, results and stakes are stored together as one compact
+    payload (see hand_encoding). Rows written before that keep them in the
+    JSON text columns until compacted (HandHistoryService.compact_legacy_hands).
+    """
 
     __tablename__ = "game_history"
+    __table_args__ = (Index("ix_game_history_table_completed", "table_id", "completed_at"),)
 
     # Primary key
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -22,15 +29,18 @@ class GameHistory(db.Model):
     # Game identification
     hand_number: Mapped[int] = mapped_column(Integer, nullable=False)
 
-    # Game data (stored as JSON)
-    players: Mapped[str] = mapped_column(Text, nullable=False)  # JSON string
-    actions: Mapped[str] = mapped_column(Text, nullable=False)  # JSON string
-    results: Mapped[str] = mapped_column(Text, nullable=False)  # JSON string
+    # Game data: players, actions, results and stakes (see hand_encoding)
+    payload: Mapped[bytes | None] = mapped_column(LargeBinary)
+
+    # Legacy game data (JSON strings), set only on rows not yet compacted
+    players: Mapped[str | None] = mapped_column(Text)
+    actions: Mapped[str | None] = mapped_column(Text)
+    results: Mapped[str | None] = mapped_column(Text)
 
     # Additional metadata
     variant: Mapped[str] = mapped_column(String(50), nullable=False)
     betting_structure: Mapped[str] = mapped_column(String(20), nullable=False)
-    stakes: Mapped[str] = mapped_column(Text, nullable=False)  # JSON string
+    stakes: Mapped[str | None] = mapped_column(Text)  # legacy JSON string
 
     # Timestamp
     completed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -40,6 +50,9 @@ class GameHistory(db.Model):
 
     # Relationships
     table: Mapped["PokerTable"] = relationship("PokerTable", back_populates="game_history")
+    participants: Mapped[list["GameHistoryPlayer"]] = relationship(
+        "GameHistoryPlayer", back_populates="hand", cascade="all, delete-orphan"
+    )
 
     def __init__(
         self,
@@ -55,28 +68,52 @@ class GameHistory(db.Model):
         """Initialize game history record."""
         self.table_id = table_id
         self.hand_number = hand_number
-        self.players = json.dumps(players)
-        self.actions = json.dumps(actions)
-        self.results = json.dumps(results)
         self.variant = variant
         self.betting_structure = betting_structure
-        self.stakes = json.dumps(stakes)
+        self.completed_at = datetime.utcnow()
+        self.payload = encode_hand(players, actions, results, stakes)
+        self.participants = GameHistoryPlayer.for_hand(self, players)
+
+    def compact(self) -> None:
+        """Move a legacy row's JSON columns into the payload and index its players."""
+        if self.payload is not None:
+            return
+        hand = self._hand()
+        self.payload = encode_hand(hand["players"], hand["actions"], hand["results"], hand["stakes"])
+        self.players = self.actions = self.results = self.stakes = None
+        self.participants = GameHistoryPlayer.for_hand(self, hand["players"])
+
+    def _hand(self) -> dict[str, Any]:
+        """Decoded hand data, decoded once per instance."""
+        hand = getattr(self, "_decoded_hand", None)
+        if hand is None:
+            if self.payload is not None:
+                hand = decode_hand(self.payload)
+            else:
+                hand = {
+                    "players": json.loads(self.players),
+                    "actions": json.loads(self.actions),
+                    "results": json.loads(self.results),
+                    "stakes": json.loads(self.stakes),
+                }
+            self._decoded_hand = hand
+        return hand
 
     def get_players(self) -> list[dict[str, Any]]:
         """Get players data as list of dictionaries."""
-        return json.loads(self.players)
+        return self._hand()["players"]
 
     def get_actions(self) -> list[dict[str, Any]]:
         """Get actions data as list of dictionaries."""
-        return json.loads(self.actions)
+        return self._hand()["actions"]
 
     def get_results(self) -> dict[str, Any]:
         """Get results data as dictionary."""
-        return json.loads(self.results)
+        return self._hand()["results"]
 
     def get_stakes(self) -> dict[str, int]:
         """Get stakes data as dictionary."""
-        return json.loads(self.stakes)
+        return self._hand()["stakes"]
 
     def get_winner_ids(self) -> list[str]:
         """Get list of winner user IDs."""
@@ -173,3 +210,31 @@ class GameHistory(db.Model):
 
     def __repr__(self) -> str:
         return f"<GameHistory Hand #{self.hand_number} at Table {self.table_id}>"
+
+
+class GameHistoryPlayer(db.Model):
+    """A player's part in a completed hand, for looking up hands by player."""
+
+    __tablename__ = "game_history_players"
+    __table_args__ = (Index("ix_game_history_players_user_completed", "user_id", "completed_at"),)
+
+    hand_id: Mapped[str] = mapped_column(String(36), ForeignKey("game_history.id"), primary_key=True)
+    # Not a foreign key: bots play hands without a users row
+    user_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    # Copied from the hand so per-player queries filter and sort on this table alone
+    table_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    completed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    hand: Mapped["GameHistory"] = relationship("GameHistory", back_populates="participants")
+
+    @staticmethod
+    def for_hand(hand: GameHistory, players: list[dict[str, Any]]) -> list["GameHistoryPlayer"]:
+        """One row per distinct player in a hand's players list."""
+        user_ids = dict.fromkeys(player["user_id"] for player in players if player.get("user_id"))
+        return [
+            GameHistoryPlayer(user_id=user_id, table_id=hand.table_id, completed_at=hand.completed_at)
+            for user_id in user_ids
+        ]
+
+    def __repr__(self) -> str:
+        return f"<GameHistoryPlayer {self.user_id} in hand {self.hand_id}>"
@@ -0,0 +1,283 @@
+"""Compact binary encoding of a completed hand.
+
+GameHistory rows used to hold players, actions, results and stakes as four
+JSON text columns, each parsed separately (and results several times) per
+row read. A hand is now one zlib-compressed payload:
+
+    b"HH" magic, format version byte
+    actions, column by column (n actions):
+        varint n
+        n player indexes (byte, into the hand's players)
+        n action indexes (byte, into ACTION_NAMES)
+        n amounts (varint, amount + 1; 0 for none)
+        varint start time (µs since the epoch), n time offsets (varint µs)
+    cards: varint list count, then per list a varint length and one byte per card
+    varint length + JSON document: players, results and stakes
+
+Card lists in results (a hand's cards, hole cards, community cards) move to
+the cards section as one byte per card — rank index * 4 + suit index — and
+the JSON keeps {"$cards": <the list's position in that section>}. Whatever
+does not fit the binary columns (a non-standard action, a card string such as
+a joker) stays in the JSON as it was, and actions are checked to decode back
+to their input, so decoding returns what json.loads(json.dumps(...)) of each
+part used to. Results that already hold a {"$cards": <int>} object under a
+card-list key cannot be told apart from a reference and are refused.
+Version 1 payloads kept the bare position, and still decode.
+
+ACTION_NAMES, RANKS and SUITS are part of the stored format: only append to
+them.
+"""
+
+import json
+import zlib
+from datetime import datetime, timedelta
+from typing import Any
+
+MAGIC = b"HH"
+FORMAT_VERSION = 2
+# Version 1 stored card list references as bare ints
+_BARE_REF_VERSION = 1
+COMPRESSION_LEVEL = 6
+
+ACTION_NAMES = (
+    "fold",
+    "check",
+    "call",
+    "bet",
+    "raise",
+    "bring_in",
+    "complete",
+    "discard",
+    "draw",
+    "separate",
+    "expose",
+    "pass",
+    "declare",
+    "deal",
+    "choose",
+    "protect_card",
+    "decline_protection",
+    "replace_community",
+    "buy",
+)
+RANKS = "23456789TJQKA"
+SUITS = "cdhs"
+
+# Result keys whose values are card lists, and the key holding lists per player
+CARD_LIST_KEYS = ("cards", "community_cards", "used_hole_cards")
+CARDS_BY_PLAYER_KEY = "player_hole_cards"
+CARDS_REF_KEY = "$cards"
+
+_ACTION_FIELDS = {"user_id", "action", "amount", "timestamp"}
+_ACTION_CODES = {name: i for i, name in enumerate(ACTION_NAMES)}
+_CARD_CODES = {rank + suit: r * len(SUITS) + s for r, rank in enumerate(RANKS) for s, suit in enumerate(SUITS)}
+_CARDS_BY_CODE = {code: card for card, code in _CARD_CODES.items()}
+_EPOCH = datetime(1970, 1, 1)
+
+
+class HandEncodingError(ValueError):
+    """Raised when a payload is not a hand encoded by this module."""
+
+
+def encode_hand(players: list[dict[str, Any]], actions: list[dict[str, Any]], results: dict, stakes: dict) -> bytes:
+    """Encode one hand's history as a compressed payload.
+
+    Raises:
+        ValueError: If results hold a {"$cards": <int>} object under a card-list key
+    """
+    out = bytearray(MAGIC)
+    out.append(FORMAT_VERSION)
+    document: dict[str, Any] = {"players": players, "stakes": stakes}
+
+    columns = _encode_action_columns(players, actions)
+    if columns is None:
+        _write_varint(out, 0)
+        document["actions"] = actions
+    else:
+        out += columns
+
+    card_lists: list[bytes] = []
+    document["results"] = _extract_cards(results, card_lists)
+    _write_varint(out, len(card_lists))
+    for codes in card_lists:
+        _write_varint(out, len(codes))
+        out += codes
+
+    body = json.dumps(document, separators=(",", ":")).encode()
+    _write_varint(out, len(body))
+    out += body
+    return zlib.compress(bytes(out), COMPRESSION_LEVEL)
+
+
+def decode_hand(payload: bytes) -> dict[str, Any]:
+    """Decode a payload into a dict with players, actions, results and stakes."""
+    try:
+        data = zlib.decompress(payload)
+    except zlib.error as e:
+        raise HandEncodingError(f"hand payload is not compressed: {e}") from e
+    if data[:2] != MAGIC:
+        raise HandEncodingError("not a hand payload")
+    version = data[2]
+    if version not in (_BARE_REF_VERSION, FORMAT_VERSION):
+        raise HandEncodingError(f"unsupported hand payload version {version}")
+
+    reader = _Reader(data, 3)
+    count = reader.varint()
+    player_indexes = reader.take(count)
+    action_indexes = reader.take(count)
+    amounts = [reader.varint() for _ in range(count)]
+    start = reader.varint() if count else 0
+    offsets = [reader.varint() for _ in range(count)]
+
+    card_lists = []
+    for _ in range(reader.varint()):
+        card_lists.append([_CARDS_BY_CODE[code] for code in reader.take(reader.varint())])
+
+    document = json.loads(reader.take(reader.varint()))
+    if count:
+        players = document["players"]
+        document["actions"] = [
+            {
+                "user_id": players[player_indexes[i]]["user_id"],
+                "action": ACTION_NAMES[action_indexes[i]],
+                "amount": amounts[i] - 1 if amounts[i] else None,
+                "timestamp": _timestamp(start + offsets[i]),
+            }
+            for i in range(count)
+        ]
+    document.setdefault("actions", [])
+    document["results"] = _restore_cards(document["results"], card_lists, version == _BARE_REF_VERSION)
+    return document
+
+
+def _encode_action_columns(players: list[dict[str, Any]], actions: list[dict[str, Any]]) -> bytes | None:
+    """Columnar encoding of actions, or None if any action doesn't fit the columns."""
+    if not actions:
+        return None
+    seats = {player.get("user_id"): i for i, player in enumerate(players)}
+    if len(players) > 255 or len(seats) != len(players):
+        return None
+    if any(not isinstance(action, dict) or set(action) != _ACTION_FIELDS for action in actions):
+        return None
+    try:
+        player_indexes = bytes(seats[action["user_id"]] for action in actions)
+        action_indexes = bytes(_ACTION_CODES[action["action"]] for action in actions)
+        times = [_microseconds(action["timestamp"]) for action in actions]
+    except (KeyError, TypeError, ValueError):
+        return None
+    amounts = [action["amount"] for action in actions]
+    if any(amount is not None and (type(amount) is not int or amount < 0) for amount in amounts):
+        return None
+    start = min(times)
+
+    out = bytearray()
+    _write_varint(out, len(actions))
+    out += player_indexes
+    out += action_indexes
+    for amount in amounts:
+        _write_varint(out, 0 if amount is None else amount + 1)
+    _write_varint(out, start)
+    for time in times:
+        _write_varint(out, time - start)
+
+    # Timestamps must come back as the same strings
+    if any(_timestamp(time) != action["timestamp"] for time, action in zip(times, actions, strict=True)):
+        return None
+    return bytes(out)
+
+
+def _extract_cards(value: Any, card_lists: list[bytes]) -> Any:
+    """Copy of a results value with card lists replaced by their index in card_lists."""
+    if isinstance(value, list):
+        return [_extract_cards(item, card_lists) for item in value]
+    if not isinstance(value, dict):
+        return value
+    extracted = {}
+    for key, item in value.items():
+        if key in CARD_LIST_KEYS:
+            extracted[key] = _card_list_ref(item, card_lists)
+        elif key == CARDS_BY_PLAYER_KEY and isinstance(item, dict):
+            extracted[key] = {player: _card_list_ref(cards, card_lists) for player, cards in item.items()}
+        else:
+            extracted[key] = _extract_cards(item, card_lists)
+    return extracted
+
+
+def _card_list_ref(cards: Any, card_lists: list[bytes]) -> Any:
+    if not isinstance(cards, list) or not all(isinstance(card, str) and card in _CARD_CODES for card in cards):
+        if _is_ref(cards):
+            raise ValueError(f"card list value {cards!r} would read back as a card list reference")
+        return _extract_cards(cards, card_lists)
+    card_lists.append(bytes(_CARD_CODES[card] for card in cards))
+    return {CARDS_REF_KEY: len(card_lists) - 1}
+
+
+def _restore_cards(value: Any, card_lists: list[list[str]], bare_refs: bool) -> Any:
+    if isinstance(value, list):
+        return [_restore_cards(item, card_lists, bare_refs) for item in value]
+    if not isinstance(value, dict):
+        return value
+    restored = {}
+    for key, item in value.items():
+        if key in CARD_LIST_KEYS:
+            restored[key] = _restore_card_list(item, card_lists, bare_refs)
+        elif key == CARDS_BY_PLAYER_KEY and isinstance(item, dict):
+            restored[key] = {player: _restore_card_list(cards, card_lists, bare_refs) for player, cards in item.items()}
+        else:
+            restored[key] = _restore_cards(item, card_lists, bare_refs)
+    return restored
+
+
+def _restore_card_list(value: Any, card_lists: list[list[str]], bare_refs: bool) -> Any:
+    if bare_refs and type(value) is int:
+        return card_lists[value]
+    if not bare_refs and _is_ref(value):
+        return card_lists[value[CARDS_REF_KEY]]
+    return _restore_cards(value, card_lists, bare_refs)
+
+
+def _is_ref(value: Any) -> bool:
+    return isinstance(value, dict) and set(value) == {CARDS_REF_KEY} and type(value[CARDS_REF_KEY]) is int
+
+
+def _microseconds(timestamp: str) -> int:
+    moment = datetime.fromisoformat(timestamp)
+    if moment.tzinfo is not None:
+        raise ValueError("aware timestamps are kept as text")
+    delta = moment - _EPOCH
+    if delta < timedelta(0):
+        raise ValueError("timestamp before the epoch")
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _timestamp(microseconds: int) -> str:
+    return (_EPOCH + timedelta(microseconds=microseconds)).isoformat()
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _Reader:
+    def __init__(self, data: bytes, pos: int):
+        self.data = data
+        self.pos = pos
+
+    def take(self, n: int) -> bytes:
+        if self.pos + n > len(self.data):
+            raise HandEncodingError("truncated hand payload")
+        chunk = self.data[self.pos : self.pos + n]
+        self.pos += n
+        return chunk
+
+    def varint(self) -> int:
+        value = shift = 0
+        while True:
+            byte = self.take(1)[0]
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
@@ -3,7 +3,17 @@
 import functools
 from datetime import datetime, timedelta
 
-from flask import Blueprint, current_app, jsonify, redirect, render_template, request, url_for
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    jsonify,
+    redirect,
+    render_template,
+    request,
+    stream_with_context,
+    url_for,
+)
 from flask_login import current_user, login_required
 from sqlalchemy import func
 
@@ -14,7 +24,9 @@ from ..models.table import PokerTable
 from ..models.table_access import TableAccess
 from ..models.transaction import Transaction
 from ..models.user import User
+from ..services.hand_history_service import HandHistoryService
 from ..services.table_manager import TableManager
+from ..services.table_roster_cache import table_roster_cache
 
 admin_bp = Blueprint("admin", __name__, template_folder="../../templates/admin")
 
@@ -184,7 +196,7 @@ def api_user_detail(user_id):
     )
 
     # Count hands played
-    hands_played = db.session.query(func.count(GameHistory.id)).filter(GameHistory.players.contains(user_id)).scalar()
+    hands_played = HandHistoryService.count_player_hands(user_id)
 
     # Active table sessions
     active_sessions = db.session.query(TableAccess).filter_by(user_id=user_id, is_active=True, is_spectator=False).all()
@@ -314,6 +326,8 @@ def api_purge_all_tables():
         db.session.query(User).filter_by(username=username).update({"bankroll": bankroll})
 
     db.session.commit()
+    # Bulk deletes bypass the session, so the roster cache never sees them
+    table_roster_cache.clear()
 
     return jsonify(
         {
@@ -402,7 +416,7 @@ def api_delete_table(table_id):
 
     # Clear FK references before deleting the table
     from ..models.chat import ChatMessage, ChatModerationAction
-    from ..models.game_history import GameHistory
+    from ..models.game_history import GameHistory, GameHistoryPlayer
     from ..models.game_session_state import GameSessionState
 
     # Null out transaction references (keep audit trail)
@@ -410,15 +424,41 @@ def api_delete_table(table_id):
     # Delete related records
     db.session.query(ChatMessage).filter_by(table_id=table_id).delete()
     db.session.query(ChatModerationAction).filter_by(table_id=table_id).delete()
+    db.session.query(GameHistoryPlayer).filter_by(table_id=table_id).delete()
     db.session.query(GameHistory).filter_by(table_id=table_id).delete()
     db.session.query(GameSessionState).filter_by(table_id=table_id).delete()
     db.session.query(TableAccess).filter_by(table_id=table_id).delete()
     db.session.delete(table)
     db.session.commit()
+    table_roster_cache.invalidate(table_id)
 
     return jsonify({"success": True, "message": f"Table '{table_name}' deleted"})
 
 
+@admin_bp.route("/api/hands/export")
+@admin_required
+def api_export_hands():
+    """Stream completed hands as newline-delimited JSON, oldest first.
+
+    Query parameters (all optional): table_id, user_id, and since/until as
+    ISO timestamps bounding completed_at.
+    """
+    try:
+        since = datetime.fromisoformat(request.args["since"]) if request.args.get("since") else None
+        until = datetime.fromisoformat(request.args["until"]) if request.args.get("until") else None
+    except ValueError:
+        return jsonify({"success": False, "message": "since and until must be ISO timestamps"}), 400
+
+    lines = HandHistoryService.export_ndjson(
+        table_id=request.args.get("table_id"), user_id=request.args.get("user_id"), since=since, until=until
+    )
+    return Response(
+        stream_with_context(lines),
+        mimetype="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=hands.ndjson"},
+    )
+
+
 @admin_bp.route("/api/variants")
 @admin_required
 def api_variants():
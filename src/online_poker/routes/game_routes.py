@@ -730,7 +730,7 @@ def get_hand_history(table_id: str):
         records = (
             db.session.query(GameHistory)
             .filter(GameHistory.table_id == table_id)
-            .order_by(GameHistory.hand_number.desc())
+            .order_by(GameHistory.completed_at.desc(), GameHistory.hand_number.desc())
             .limit(limit)
             .all()
         )
@@ -4,6 +4,7 @@ from flask import Blueprint, current_app, jsonify, redirect, render_template, re
 from flask_limiter.util import get_remote_address
 from flask_login import current_user, login_required
 from flask_socketio import emit
+from sqlalchemy.orm import selectinload
 
 from ..database import db
 from ..extensions import limiter
@@ -27,7 +28,12 @@ def get_tables():
     """Get list of active tables."""
     try:
         # Get all public tables
-        tables = db.session.query(PokerTable).filter(PokerTable.is_private == False).all()
+        tables = (
+            db.session.query(PokerTable)
+            .options(selectinload(PokerTable.access_records))
+            .filter(PokerTable.is_private == False)
+            .all()
+        )
 
         table_list = []
         for table in tables:
@@ -563,7 +569,12 @@ def register_lobby_socket_events(socketio):
         """Send list of active tables."""
         try:
             # Get all public tables
-            tables = db.session.query(PokerTable).filter(PokerTable.is_private == False).all()
+            tables = (
+                db.session.query(PokerTable)
+                .options(selectinload(PokerTable.access_records))
+                .filter(PokerTable.is_private == False)
+                .all()
+            )
 
             table_list = []
             for table in tables:
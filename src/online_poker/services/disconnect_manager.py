@@ -279,10 +279,11 @@ class DisconnectManager:
                     }
                     ws_manager.broadcast_to_table(table_id, GameEvent.PLAYER_RECONNECTED, reconnect_data)
 
-                    # Send updated game state to reconnected player
+                    # Send a full, versioned game state so the player's next delta applies
                     game_state = GameStateManager.generate_game_state_view(table_id, user_id)
-                    if game_state:
-                        ws_manager.send_to_user(user_id, GameEvent.GAME_STATE_UPDATE, game_state.to_dict())
+                    session_id = ws_manager.user_sessions.get(user_id)
+                    if game_state and session_id:
+                        ws_manager.send_game_state(session_id, table_id, game_state.to_dict(), full=True)
 
                 logger.info(
                     f"Successfully reconnected player {user_id} to table {table_id} "
@@ -888,8 +888,11 @@ class GameOrchestrator:
         try:
             from ..database import db
             from ..models.game_session_state import GameSessionState
+            from ..services.hand_persistence import hand_persistence_queue
 
-            state = db.session.query(GameSessionState).filter_by(table_id=table_id).first()
+            # A queued hand would mark the state active again after this
+            hand_persistence_queue.flush(table_id)
+            state = db.session.query(GameSessionState).filter_by(table_id=table_id).populate_existing().first()
             if state:
                 state.is_active = False
                 db.session.commit()
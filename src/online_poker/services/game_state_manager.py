@@ -1,6 +1,9 @@
 """Service for managing game state views and synchronization."""
 
 import logging
+from collections.abc import Iterable
+from dataclasses import replace
+from threading import Lock
 from typing import Any
 
 from generic_poker.config.loader import GameActionType
@@ -22,6 +25,10 @@ from ..services.table_access_manager import TableAccessManager
 
 logger = logging.getLogger(__name__)
 
+# Last game state version assigned per table (see GameStateManager.next_state_version)
+_state_versions: dict[str, int] = {}
+_state_versions_lock = Lock()
+
 
 class GameStateManager:
     """Service for managing game state views and synchronization."""
@@ -46,125 +53,219 @@ class GameStateManager:
                 logger.debug(f"No game session found for table {table_id}, returning waiting state")
                 return GameStateManager._generate_waiting_state(table_id, viewer_id, is_spectator)
 
-            # Get table players
+            base_view = GameStateManager._generate_base_view(table_id, session)
+            if base_view is None:
+                return None
+            if is_spectator:
+                return replace(base_view, viewer_id=viewer_id)
+            return GameStateManager._personalize_view(base_view, session, viewer_id)
+
+        except Exception as e:
+            logger.error(f"Failed to generate game state view for table {table_id}, viewer {viewer_id}: {e}")
+            return None
+
+    @staticmethod
+    def generate_game_state_payloads(table_id: str, viewer_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Generate serialized game state views for everyone watching a table.
+
+        The viewer-independent view (as a spectator sees it: hidden cards
+        redacted, no valid actions) is built and serialized once, from a
+        single roster query. Spectators, and anyone without an active seat,
+        share that payload with only their viewer id filled in. Each seated
+        player gets it with their own cards revealed and, on their turn,
+        their valid actions.
+
+        Args:
+            table_id: ID of the table
+            viewer_ids: IDs of the users to generate views for
+
+        Returns:
+            Dictionary mapping viewer ID to GameStateView.to_dict() output,
+            empty if the table has no players
+        """
+        try:
             table_players = TableAccessManager.get_table_players(table_id)
             if not table_players:
-                logger.warning(f"No players found for table {table_id}")
-                return None
+                return {}
 
-            # Generate player views
-            player_views = []
-            human_ids = set()
-            for player_info in table_players:
-                if player_info["is_spectator"]:
-                    continue  # Skip spectators in player list
+            session = game_orchestrator.get_session(table_id)
+            if session:
+                base_view = GameStateManager._generate_base_view(table_id, session, table_players)
+            else:
+                base_view = GameStateManager._generate_waiting_state(table_id, "", True, table_players)
+            if base_view is None:
+                return {}
+
+            shared = base_view.to_dict()
+            seated = {player["user_id"] for player in table_players if not player["is_spectator"]}
+            payloads = {}
+            for viewer_id in viewer_ids:
+                if viewer_id in seated:
+                    payloads[viewer_id] = GameStateManager._personalize_view(base_view, session, viewer_id).to_dict()
+                else:
+                    payloads[viewer_id] = {
+                        **shared,
+                        "viewer_id": viewer_id,
+                        "current_user": {"id": viewer_id, "username": None},
+                    }
+            return payloads
 
-                human_ids.add(player_info["user_id"])
-                player_view = GameStateManager._create_player_view(player_info, session, viewer_id, is_spectator)
-                if player_view:
-                    player_views.append(player_view)
-
-            # Add bot players from game session (they have no DB records)
-            from ..services.simple_bot import SimpleBot
-
-            if session.game:
-                for pid, player in session.game.table.players.items():
-                    if SimpleBot.is_bot_player(pid) and pid not in human_ids:
-                        seat_num = session.game.table.layout.get_player_seat(pid)
-                        bot_info = {
-                            "user_id": pid,
-                            "username": player.name,
-                            "seat_number": seat_num,
-                            "current_stack": player.stack,
-                            "is_spectator": False,
-                        }
-                        bot_view = GameStateManager._create_player_view(bot_info, session, viewer_id, is_spectator)
-                        if bot_view:
-                            bot_view.is_bot = True
-                            player_views.append(bot_view)
+        except Exception as e:
+            logger.error(f"Failed to generate game state payloads for table {table_id}: {e}")
+            return {}
 
-            # Sort players by seat number
-            player_views.sort(key=lambda p: p.seat_number)
+    @staticmethod
+    def _generate_base_view(
+        table_id: str, session: GameSession, table_players: list[dict[str, Any]] | None = None
+    ) -> GameStateView | None:
+        """Generate the viewer-independent view of a table, as a spectator sees it.
 
-            # Get community cards (visible to all)
-            community_cards = GameStateManager._get_community_cards(session)
+        Args:
+            table_id: ID of the table
+            session: Active game session for the table
+            table_players: Table roster if already loaded (see TableAccessManager.get_table_players)
+
+        Returns:
+            GameStateView with an empty viewer ID, or None if the table has no players
+        """
+        if table_players is None:
+            table_players = TableAccessManager.get_table_players(table_id)
+        if not table_players:
+            logger.warning(f"No players found for table {table_id}")
+            return None
 
-            # Get pot information
-            pot_info = GameStateManager._get_pot_info(session)
+        # Generate player views
+        player_views = []
+        human_ids = set()
+        for player_info in table_players:
+            if player_info["is_spectator"]:
+                continue  # Skip spectators in player list
 
-            # Get current player
-            current_player = GameStateManager._get_current_player(session)
+            human_ids.add(player_info["user_id"])
+            player_view = GameStateManager._create_player_view(player_info, session, "", True)
+            if player_view:
+                player_views.append(player_view)
 
-            # Get valid actions for the viewer (if they're a player and it's their turn)
-            valid_actions = []
-            if not is_spectator and current_player == viewer_id:
-                # Import here to avoid circular imports
-                from ..services.player_action_manager import player_action_manager
+        # Add bot players from game session (they have no DB records)
+        from ..services.simple_bot import SimpleBot
+
+        if session.game:
+            for pid, player in session.game.table.players.items():
+                if SimpleBot.is_bot_player(pid) and pid not in human_ids:
+                    seat_num = session.game.table.layout.get_player_seat(pid)
+                    bot_info = {
+                        "user_id": pid,
+                        "username": player.name,
+                        "seat_number": seat_num,
+                        "current_stack": player.stack,
+                        "is_spectator": False,
+                    }
+                    bot_view = GameStateManager._create_player_view(bot_info, session, "", True)
+                    if bot_view:
+                        bot_view.is_bot = True
+                        player_views.append(bot_view)
 
-                action_options = player_action_manager.get_available_actions(table_id, viewer_id)
-                valid_actions = [GameStateManager._convert_action_option(opt, session) for opt in action_options]
+        # Sort players by seat number
+        player_views.sort(key=lambda p: p.seat_number)
 
-            # Determine game phase
-            game_phase = GameStateManager._get_game_phase(session)
+        # Get community cards (visible to all)
+        community_cards = GameStateManager._get_community_cards(session)
 
-            # Get table information
-            table_info = GameStateManager._get_table_info(session)
+        # Get pot information
+        pot_info = GameStateManager._get_pot_info(session)
 
-            # Send a countdown time_limit only when action timeouts are actually
-            # enabled. With timeouts off (the default), there is no auto-action, so
-            # a ticking countdown is misleading false pressure — the client just
-            # highlights whose turn it is instead.
-            try:
-                from flask import current_app
+        # Get current player
+        current_player = GameStateManager._get_current_player(session)
 
-                if current_app.config.get("ACTION_TIMEOUT_ENABLED", False):
-                    time_limit = current_app.config.get("ACTION_TIMEOUT_SECONDS", 30)
-                else:
-                    time_limit = None
-            except RuntimeError:
+        # Determine game phase
+        game_phase = GameStateManager._get_game_phase(session)
+
+        # Get table information
+        table_info = GameStateManager._get_table_info(session)
+
+        # Send a countdown time_limit only when action timeouts are actually
+        # enabled. With timeouts off (the default), there is no auto-action, so
+        # a ticking countdown is misleading false pressure — the client just
+        # highlights whose turn it is instead.
+        try:
+            from flask import current_app
+
+            if current_app.config.get("ACTION_TIMEOUT_ENABLED", False):
+                time_limit = current_app.config.get("ACTION_TIMEOUT_SECONDS", 30)
+            else:
                 time_limit = None
+        except RuntimeError:
+            time_limit = None
 
-            # Create game state view
-            game_state_view = GameStateView(
-                table_id=table_id,
-                session_id=session.session_id,
-                viewer_id=viewer_id,
-                players=player_views,
-                community_cards=community_cards,
-                pot_info=pot_info,
-                current_player=current_player,
-                valid_actions=valid_actions,
-                game_phase=game_phase,
-                hand_number=session.hands_played + 1,  # Current hand number
-                is_spectator=is_spectator,
-                dealer_position=GameStateManager._get_dealer_position(session),
-                small_blind_position=GameStateManager._get_small_blind_position(session),
-                big_blind_position=GameStateManager._get_big_blind_position(session),
-                time_limit=time_limit,
-                table_info=table_info,
-            )
+        # Create game state view
+        game_state_view = GameStateView(
+            table_id=table_id,
+            session_id=session.session_id,
+            viewer_id="",
+            players=player_views,
+            community_cards=community_cards,
+            pot_info=pot_info,
+            current_player=current_player,
+            game_phase=game_phase,
+            hand_number=session.hands_played + 1,  # Current hand number
+            is_spectator=True,
+            dealer_position=GameStateManager._get_dealer_position(session),
+            small_blind_position=GameStateManager._get_small_blind_position(session),
+            big_blind_position=GameStateManager._get_big_blind_position(session),
+            time_limit=time_limit,
+            table_info=table_info,
+        )
 
-            return game_state_view
+        return game_state_view
 
-        except Exception as e:
-            logger.error(f"Failed to generate game state view for table {table_id}, viewer {viewer_id}: {e}")
-            return None
+    @staticmethod
+    def _personalize_view(base_view: GameStateView, session: GameSession | None, viewer_id: str) -> GameStateView:
+        """A seated player's view: the base view with their own cards and, on their turn, valid actions.
+
+        Only the viewer's own entry differs from the spectator view; every
+        other player's cards are redacted the same way for all viewers.
+        """
+        players = base_view.players
+        valid_actions = []
+        if session is not None:
+            players = [
+                replace(
+                    player,
+                    cards=GameStateManager._get_player_cards_with_visibility(session, viewer_id, viewer_id, False),
+                    card_subsets=GameStateManager._get_card_subsets(session, viewer_id, viewer_id, False),
+                )
+                if player.user_id == viewer_id
+                else player
+                for player in base_view.players
+            ]
+            if base_view.current_player == viewer_id:
+                # Import here to avoid circular imports
+                from ..services.player_action_manager import player_action_manager
+
+                action_options = player_action_manager.get_available_actions(base_view.table_id, viewer_id)
+                valid_actions = [GameStateManager._convert_action_option(opt, session) for opt in action_options]
+
+        return replace(base_view, viewer_id=viewer_id, is_spectator=False, players=players, valid_actions=valid_actions)
 
     @staticmethod
-    def _generate_waiting_state(table_id: str, viewer_id: str, is_spectator: bool) -> GameStateView | None:
+    def _generate_waiting_state(
+        table_id: str, viewer_id: str, is_spectator: bool, table_players: list[dict[str, Any]] | None = None
+    ) -> GameStateView | None:
         """Generate a game state view for when no active game session exists (waiting state).
 
         Args:
             table_id: ID of the table
             viewer_id: ID of the player/spectator viewing the state
             is_spectator: Whether the viewer is a spectator
+            table_players: Table roster if already loaded (see TableAccessManager.get_table_players)
 
         Returns:
             GameStateView with waiting state or None if table/players not found
         """
         try:
             # Get table players from database
-            table_players = TableAccessManager.get_table_players(table_id)
+            if table_players is None:
+                table_players = TableAccessManager.get_table_players(table_id)
             if not table_players:
                 logger.debug(f"No players found for table {table_id} in waiting state")
                 return None
@@ -1123,3 +1224,60 @@ class GameStateManager:
         except Exception as e:
             logger.error(f"Failed to detect state changes: {e}")
             return []
+
+    @staticmethod
+    def next_state_version(table_id: str) -> int:
+        """Assign the next game state version for a table.
+
+        Versions increase monotonically per table for the life of the process,
+        so a client can tell whether a delta applies to the state it holds.
+        """
+        with _state_versions_lock:
+            version = _state_versions.get(table_id, 0) + 1
+            _state_versions[table_id] = version
+            return version
+
+    @staticmethod
+    def diff_state_payloads(old: dict[str, Any], new: dict[str, Any]) -> list[dict[str, Any]]:
+        """Compute a JSON-patch-style list of operations turning one serialized view into another.
+
+        Dictionaries are compared key by key and lists of equal length item by
+        item; anything else that changed (including lists that grew or shrank)
+        is replaced whole. Paths are RFC 6901 JSON pointers.
+
+        Args:
+            old: Previously sent GameStateView.to_dict() output
+            new: Current GameStateView.to_dict() output
+
+        Returns:
+            List of {"op": "add" | "remove" | "replace", "path": ..., "value": ...} operations,
+            empty if the payloads are equal
+        """
+        ops: list[dict[str, Any]] = []
+        _diff_values(old, new, "", ops)
+        return ops
+
+
+def _diff_values(old: Any, new: Any, path: str, ops: list[dict[str, Any]]) -> None:
+    """Append the operations turning old into new at path."""
+    if old is new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, value in new.items():
+            child = f"{path}/{_escape_pointer(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                _diff_values(old[key], value, child, ops)
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape_pointer(key)}"})
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for index, (old_item, new_item) in enumerate(zip(old, new, strict=True)):
+            _diff_values(old_item, new_item, f"{path}/{index}", ops)
+    elif type(old) is not type(new) or old != new:
+        ops.append({"op": "replace", "path": path, "value": new})
+
+
+def _escape_pointer(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
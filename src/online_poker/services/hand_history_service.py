@@ -0,0 +1,109 @@
+"""Hand history queries, bulk export and compaction of legacy rows."""
+
+import json
+import logging
+from collections.abc import Iterator
+from datetime import datetime
+
+from ..database import db
+from ..models.game_history import GameHistory, GameHistoryPlayer
+
+logger = logging.getLogger(__name__)
+
+# Hands loaded per query while streaming an export or compacting
+EXPORT_BATCH_SIZE = 500
+
+
+class HandHistoryService:
+    """Service class for reading hand history in bulk."""
+
+    @staticmethod
+    def iter_hands(
+        table_id: str | None = None,
+        user_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[GameHistory]:
+        """Yield completed hands oldest first, one batch in memory at a time.
+
+        Pages by (completed_at, id) rather than offset, so each batch is an
+        index range scan: (table_id, completed_at) for a table, the
+        game_history_players (user_id, completed_at) index for a player.
+        Yielded records are detached from the session once their batch is done.
+
+        Args:
+            table_id: Only hands at this table
+            user_id: Only hands this player was dealt into
+            since: Only hands completed at or after this time
+            until: Only hands completed before this time
+            batch_size: Hands loaded per query
+        """
+        query = db.session.query(GameHistory)
+        if user_id:
+            query = query.join(GameHistoryPlayer).filter(GameHistoryPlayer.user_id == user_id)
+            completed_at = GameHistoryPlayer.completed_at
+        else:
+            completed_at = GameHistory.completed_at
+        if table_id:
+            query = query.filter(GameHistory.table_id == table_id)
+        if since:
+            query = query.filter(completed_at >= since)
+        if until:
+            query = query.filter(completed_at < until)
+
+        last = None
+        while True:
+            page = query
+            if last:
+                page = page.filter((completed_at > last[0]) | ((completed_at == last[0]) & (GameHistory.id > last[1])))
+            batch = page.order_by(completed_at, GameHistory.id).limit(batch_size).all()
+            if not batch:
+                return
+            yield from batch
+            last = (batch[-1].completed_at, batch[-1].id)
+            for record in batch:
+                db.session.expunge(record)
+            if len(batch) < batch_size:
+                return
+
+    @staticmethod
+    def export_ndjson(**filters) -> Iterator[str]:
+        """Yield hands as newline-delimited JSON, one line per hand (filters as for iter_hands)."""
+        for record in HandHistoryService.iter_hands(**filters):
+            yield json.dumps(record.to_dict(), separators=(",", ":")) + "\n"
+
+    @staticmethod
+    def count_player_hands(user_id: str) -> int:
+        """Number of hands a player was dealt into."""
+        return db.session.query(GameHistoryPlayer).filter(GameHistoryPlayer.user_id == user_id).count()
+
+    @staticmethod
+    def compact_legacy_hands(batch_size: int = EXPORT_BATCH_SIZE) -> tuple[int, int]:
+        """Re-encode hands stored as JSON text and index their players, a batch per commit.
+
+        Returns:
+            Tuple of (hands compacted, hands skipped because their JSON is unreadable)
+        """
+        compacted = skipped = 0
+        last_id = ""
+        while True:
+            batch = (
+                db.session.query(GameHistory)
+                .filter(GameHistory.payload.is_(None), GameHistory.id > last_id)
+                .order_by(GameHistory.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                return compacted, skipped
+            for record in batch:
+                try:
+                    record.compact()
+                    compacted += 1
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Skipping hand {record.id}: {e}")
+                    skipped += 1
+            last_id = batch[-1].id
+            db.session.commit()
+            db.session.expunge_all()
@@ -0,0 +1,251 @@
+"""Background persistence of completed hands.
+
+When a hand ends the server records it three ways: a GameHistory row for
+hand history, a GameSessionState upsert (dealer seat, hands played, mixed
+game rotation) for recovery after a restart, and each seated player's stack
+on their TableAccess row so cashouts pay what they actually hold. Done
+inline, that is two commits plus one per player inside the Socket.IO handler
+that processed the final action, and the next hand waits on all of it.
+
+The handler now snapshots the hand into a HandRecord (plain data, nothing
+tied to the live game) and submits it. A single background worker writes
+queued records in batches, each batch in one transaction: one GameHistory
+per hand, one upsert per table and the latest stacks per table. Records are
+written in the order they were submitted, so a table's hands land in order.
+
+Code that reads what a record writes — cashouts reading current_stack,
+deactivating a table's session state — calls flush(table_id) first, which
+returns at once when nothing is pending for the table. shutdown() drains
+the queue and is registered to run at interpreter exit.
+
+Until configure() is given an app, or with async_writes=False (tests and
+single-process tools), submit() writes the record immediately in the
+caller's app context.
+"""
+
+import atexit
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import Condition, Thread, current_thread
+from typing import Any
+
+from ..database import db
+from ..models.game_history import GameHistory
+from ..models.game_session_state import GameSessionState
+from ..models.table_access import TableAccess
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Hands written per transaction when the queue has backed up
+MAX_BATCH_HANDS = 50
+# How long a reader waits for a table's pending hands before reading anyway
+FLUSH_TIMEOUT_S = 5.0
+SHUTDOWN_TIMEOUT_S = 10.0
+
+
+@dataclass
+class HandRecord:
+    """Everything persisted for one completed hand."""
+
+    table_id: str
+    hand_number: int
+    # Per player: user_id, username, stack, position
+    players: list[dict[str, Any]]
+    actions: list[dict[str, Any]]
+    results: dict[str, Any]
+    variant: str
+    betting_structure: str
+    stakes: dict[str, Any]
+    session_id: str | None
+    dealer_seat: int
+    hands_played: int
+    # (current_variant_index, hands_in_current_variant, orbit_size) for mixed games
+    rotation: tuple[int, int, int] | None = None
+    # user_id -> chip stack, for players with a TableAccess row (not bots)
+    stacks: dict[str, int] = field(default_factory=dict)
+
+
+def write_hand_records(records: list[HandRecord]) -> None:
+    """Write records in one transaction (later records win for the same table)."""
+    user_ids = {player["user_id"] for record in records for player in record.players}
+    usernames = dict(db.session.query(User.id, User.username).filter(User.id.in_(user_ids))) if user_ids else {}
+
+    latest: dict[str, HandRecord] = {}
+    for record in records:
+        players = [
+            {**player, "username": usernames.get(player["user_id"], player["username"])} for player in record.players
+        ]
+        db.session.add(
+            GameHistory(
+                table_id=record.table_id,
+                hand_number=record.hand_number,
+                players=players,
+                actions=record.actions,
+                results=record.results,
+                variant=record.variant,
+                betting_structure=record.betting_structure,
+                stakes=record.stakes,
+            )
+        )
+        latest[record.table_id] = record
+
+    states = {
+        state.table_id: state
+        for state in db.session.query(GameSessionState).filter(GameSessionState.table_id.in_(latest))
+    }
+    for table_id, record in latest.items():
+        state = states.get(table_id)
+        if state is None:
+            state = GameSessionState(table_id=table_id)
+            db.session.add(state)
+        state.dealer_seat = record.dealer_seat
+        state.hands_played = record.hands_played
+        state.is_active = True
+        state.last_activity = datetime.utcnow()
+        state.session_id = record.session_id
+        if record.rotation:
+            state.current_variant_index, state.hands_in_current_variant, state.orbit_size = record.rotation
+
+    accesses = db.session.query(TableAccess).filter(
+        TableAccess.table_id.in_(latest),
+        TableAccess.is_active == True,
+        TableAccess.is_spectator == False,
+    )
+    for access in accesses:
+        stack = latest[access.table_id].stacks.get(access.user_id)
+        if stack is not None:
+            access.update_stack(stack)
+
+    db.session.commit()
+
+
+def _write_safely(records: list[HandRecord]) -> None:
+    """Write records, falling back to one transaction per hand if the batch fails."""
+    try:
+        write_hand_records(records)
+        return
+    except Exception as e:
+        db.session.rollback()
+        if len(records) == 1:
+            logger.error(f"Failed to save hand #{records[0].hand_number} for table {records[0].table_id}: {e}")
+            return
+        logger.warning(f"Failed to save batch of {len(records)} hands, retrying one at a time: {e}")
+
+    for record in records:
+        try:
+            write_hand_records([record])
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to save hand #{record.hand_number} for table {record.table_id}: {e}")
+
+
+class HandPersistenceQueue:
+    """Ordered queue of completed hands, written by one background worker."""
+
+    def __init__(self):
+        self._app = None
+        self._pending: deque[tuple[int, HandRecord]] = deque()
+        # Sequence numbers: last submitted, last written, last submitted per table
+        self._submitted = 0
+        self._written = 0
+        self._table_seqs: dict[str, int] = {}
+        self._worker: Thread | None = None
+        self._stopping = False
+        self._exit_hook_registered = False
+        self._condition = Condition()
+
+    @property
+    def is_async(self) -> bool:
+        return self._app is not None
+
+    def configure(self, app, async_writes: bool = True) -> None:
+        """Write hands in the background inside app's context, or inline if async_writes is False."""
+        self.shutdown()
+        with self._condition:
+            self._app = app if async_writes else None
+            if self._app is not None and not self._exit_hook_registered:
+                atexit.register(self.shutdown)
+                self._exit_hook_registered = True
+        logger.info(f"Hand persistence: {'background' if async_writes else 'inline'} writes")
+
+    def submit(self, record: HandRecord) -> None:
+        """Queue a completed hand for writing."""
+        with self._condition:
+            if self._app is not None:
+                self._submitted += 1
+                self._pending.append((self._submitted, record))
+                self._table_seqs[record.table_id] = self._submitted
+                self._ensure_worker_locked()
+                self._condition.notify_all()
+                return
+        _write_safely([record])
+
+    def pending_count(self) -> int:
+        with self._condition:
+            return self._submitted - self._written
+
+    def flush(self, table_id: str | None = None, timeout: float = FLUSH_TIMEOUT_S) -> bool:
+        """Wait until the hands submitted so far (for one table, or all) are written.
+
+        Returns:
+            True if they were written, False on timeout
+        """
+        with self._condition:
+            target = self._submitted if table_id is None else self._table_seqs.get(table_id, 0)
+            if self._written >= target:
+                return True
+            written = self._condition.wait_for(lambda: self._written >= target, timeout)
+        if not written:
+            logger.warning(f"Timed out waiting for pending hands{f' at table {table_id}' if table_id else ''}")
+        return written
+
+    def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT_S) -> None:
+        """Write every queued hand and stop the worker; the next submit restarts it."""
+        with self._condition:
+            worker = self._worker
+            if worker is None:
+                return
+            self._stopping = True
+            self._condition.notify_all()
+        worker.join(timeout)
+        with self._condition:
+            self._stopping = False
+            if worker.is_alive():
+                logger.error(
+                    f"Hand persistence worker still busy after {timeout:.0f}s; {len(self._pending)} hands unsaved"
+                )
+
+    def _ensure_worker_locked(self) -> None:
+        if self._worker is None:
+            self._worker = Thread(target=self._run, name="hand-persistence", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._stopping)
+                if not self._pending:
+                    if self._worker is current_thread():
+                        self._worker = None
+                    return
+                batch = [self._pending.popleft() for _ in range(min(len(self._pending), MAX_BATCH_HANDS))]
+                app = self._app
+
+            try:
+                with app.app_context():
+                    _write_safely([record for _, record in batch])
+            except Exception as e:
+                logger.error(f"Hand persistence worker failed on {len(batch)} hands: {e}", exc_info=True)
+
+            with self._condition:
+                self._written = batch[-1][0]
+                for table_id in [t for t, seq in self._table_seqs.items() if seq <= self._written]:
+                    del self._table_seqs[table_id]
+                self._condition.notify_all()
+
+
+# Global queue shared by every table; configured from HAND_PERSISTENCE_ASYNC at app startup
+hand_persistence_queue = HandPersistenceQueue()
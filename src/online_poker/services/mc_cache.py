@@ -0,0 +1,90 @@
+"""Per-table cache of Monte Carlo equity estimates.
+
+A bot often faces the same card state more than once: it checks, someone
+bets, and it decides again on the same street; or the pot odds change but
+the cards don't. Equity depends only on the cards and how opponents' hands
+are weighted, not on the betting, so the earlier estimate is still valid and
+estimate_equity_adaptive can resume from it (prior) rather than start over —
+keeping the rollouts already spent and, when the interval already settles
+the new decision, skipping the worker round trip altogether.
+
+Entries are keyed by everything in a RolloutSpec that changes the sampled
+deals: the bot and its cards, each opponent's visible cards and hidden count,
+the board, cards and draws to come, the unseen (live) cards — which covers
+folded and dead cards — and range weights. Estimates are per bot: another
+bot at the table has a different set of unknown cards (this bot's hole cards
+are hidden to it, its own are not), so its samples would be drawn from the
+wrong deck.
+
+Caches hang off the Game object and go away with it; each is a small LRU.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from weakref import WeakKeyDictionary
+
+from generic_poker.core.card import cards_to_codes
+
+from .mc_rollout import EquityEstimate, RolloutSpec
+
+# Decisions a bot faces per street are few; this covers a full table's hand
+CACHE_ENTRIES_PER_TABLE = 64
+
+
+def spec_key(spec: RolloutSpec) -> tuple:
+    """Hashable fingerprint of the card state a spec samples from."""
+    opponents = tuple((pid, tuple(cards_to_codes(visible)), hidden) for pid, visible, hidden in spec.opponents)
+    ranges = tuple(sorted(spec.ranges.weights.items())) if spec.ranges else ()
+    return (
+        spec.bot_id,
+        tuple(cards_to_codes(spec.bot_cards)),
+        opponents,
+        tuple(cards_to_codes(spec.community)),
+        spec.player_cards_to_come,
+        spec.community_cards_to_come,
+        tuple(sorted(cards_to_codes(spec.unseen))),
+        tuple(spec.draws),
+        ranges,
+        repr(spec.hand_configs),
+    )
+
+
+class RolloutCache:
+    """Bounded LRU of equity estimates for one table."""
+
+    def __init__(self, max_entries: int = CACHE_ENTRIES_PER_TABLE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, EquityEstimate] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, spec: RolloutSpec) -> EquityEstimate | None:
+        key = spec_key(spec)
+        with self._lock:
+            estimate = self._entries.get(key)
+            if estimate is not None:
+                self._entries.move_to_end(key)
+            return estimate
+
+    def put(self, spec: RolloutSpec, estimate: EquityEstimate) -> None:
+        key = spec_key(spec)
+        with self._lock:
+            self._entries[key] = estimate
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_table_caches: "WeakKeyDictionary[object, RolloutCache]" = WeakKeyDictionary()
+_table_caches_lock = Lock()
+
+
+def rollout_cache_for(game) -> RolloutCache:
+    """The cache for a game's table, created on first use."""
+    with _table_caches_lock:
+        cache = _table_caches.get(game)
+        if cache is None:
+            cache = _table_caches[game] = RolloutCache()
+        return cache
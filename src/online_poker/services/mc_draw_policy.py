@@ -0,0 +1,145 @@
+"""Standard pat/draw policies for simulating draw steps in Monte Carlo rollouts.
+
+A rollout that crosses a draw step must decide what every player keeps.
+Searching for the best draw is far too slow for that, so each supported
+evaluation type has a fixed "standard" policy — keep made hands and pairs
+for high, keep distinct low cards for lowball, keep the best partial badugi
+for badugi. The policy only looks at the hand's card codes, so its answer is
+cached per sorted hand and repeated hands across rollouts cost a dict lookup.
+
+A policy returns the hand ordered from most to least worth keeping, and how
+many of those cards it wants to keep; choose_keep then applies a draw step's
+min/max limits. The Monte Carlo bot uses the same policy for its own draws,
+so its rollouts model the way it actually plays.
+"""
+
+from collections import Counter
+from collections.abc import Callable
+from functools import lru_cache, partial
+from itertools import combinations
+
+from generic_poker.analysis.equity import HandConfigSpec
+from generic_poker.core.card import SUIT_CODE_BITS
+from generic_poker.evaluation.evaluator import EvaluationType
+
+# (sorted hand codes) -> (hand ordered by keep preference, cards to keep)
+DrawPolicy = Callable[[tuple[int, ...]], tuple[tuple[int, ...], int]]
+
+_SUIT_MASK = (1 << SUIT_CODE_BITS) - 1
+# Rank codes run from 0 (deuce) to 12 (ace); see core.card.RANK_CODES
+_ACE = 12
+_KING = 11
+# Lowball and badugi policies keep cards up to this pip value (8 or better)
+LOW_CUTOFF = 8
+POLICY_CACHE_SIZE = 1 << 16
+
+
+def _rank(code: int) -> int:
+    return code >> SUIT_CODE_BITS
+
+
+def _suit(code: int) -> int:
+    return code & _SUIT_MASK
+
+
+def _pip(code: int, ace_low: bool) -> int:
+    """Card value for low hands: A=1 when aces are low, else 2..14 with A=14."""
+    rank = _rank(code)
+    if ace_low and rank == _ACE:
+        return 1
+    return rank + 2
+
+
+def _is_straight(ranks: list[int]) -> bool:
+    distinct = sorted(set(ranks))
+    if len(distinct) != 5:
+        return False
+    return distinct[-1] - distinct[0] == 4 or distinct == [0, 1, 2, 3, _ACE]
+
+
+def high_policy(hand: tuple[int, ...]) -> tuple[tuple[int, ...], int]:
+    """Stand pat on straights and better, keep pairs and trips, else four to a flush, else an ace or king."""
+    ranks = [_rank(c) for c in hand]
+    counts = Counter(ranks)
+    suits = Counter(_suit(c) for c in hand)
+    # Made cards first (bigger groups, then higher ranks), then by rank
+    ordered = tuple(sorted(hand, key=lambda c: (-counts[_rank(c)], -_rank(c))))
+
+    if len(hand) == 5 and (suits.most_common(1)[0][1] == 5 or _is_straight(ranks)):
+        return ordered, 5
+    paired = sum(n for n in counts.values() if n >= 2)
+    if paired:
+        return ordered, paired
+    flush_suit, flush_count = suits.most_common(1)[0]
+    if flush_count >= 4:
+        flush_first = sorted(hand, key=lambda c: (_suit(c) != flush_suit, -_rank(c)))
+        return tuple(flush_first), 4
+    return ordered, 1 if ranks and max(ranks) >= _KING else 0
+
+
+def low_policy(hand: tuple[int, ...], ace_low: bool, straights_count: bool) -> tuple[tuple[int, ...], int]:
+    """Keep one card of each rank up to LOW_CUTOFF, breaking a straight or flush where those count."""
+    seen = set()
+    unique, rest = [], []
+    for code in sorted(hand, key=lambda c: _pip(c, ace_low)):
+        pip = _pip(code, ace_low)
+        (rest if pip in seen else unique).append(code)
+        seen.add(pip)
+    keep = sum(1 for c in unique[:5] if _pip(c, ace_low) <= LOW_CUTOFF)
+    if straights_count and keep == 5:
+        made = unique[:5]
+        if len({_suit(c) for c in made}) == 1 or _is_straight([_rank(c) for c in made]):
+            keep = 4
+    return tuple(unique + rest), keep
+
+
+def badugi_policy(hand: tuple[int, ...], ace_low: bool) -> tuple[tuple[int, ...], int]:
+    """Keep the best partial badugi (distinct ranks and suits), dropping cards above LOW_CUTOFF unless it is complete."""
+    best: tuple[int, ...] = ()
+    best_key: tuple = ()
+    for size in range(min(4, len(hand)), 0, -1):
+        for subset in combinations(hand, size):
+            if len({_rank(c) for c in subset}) < size or len({_suit(c) for c in subset}) < size:
+                continue
+            key = tuple(sorted((_pip(c, ace_low) for c in subset), reverse=True))
+            if not best or key < best_key:
+                best, best_key = subset, key
+        if best:
+            break
+    best = tuple(sorted(best, key=lambda c: _pip(c, ace_low)))
+    keep = len(best)
+    if keep < 4:
+        keep = sum(1 for c in best if _pip(c, ace_low) <= LOW_CUTOFF)
+    rest = sorted((c for c in hand if c not in best), key=lambda c: _pip(c, ace_low))
+    return best + tuple(rest), keep
+
+
+_cached = lru_cache(maxsize=POLICY_CACHE_SIZE)
+
+DRAW_POLICIES: dict[EvaluationType, DrawPolicy] = {
+    EvaluationType.HIGH: _cached(high_policy),
+    EvaluationType.LOW_27: _cached(partial(low_policy, ace_low=False, straights_count=True)),
+    EvaluationType.LOW_A5: _cached(partial(low_policy, ace_low=True, straights_count=False)),
+    EvaluationType.LOW_A6: _cached(partial(low_policy, ace_low=True, straights_count=True)),
+    EvaluationType.BADUGI: _cached(partial(badugi_policy, ace_low=True)),
+    EvaluationType.BADUGI_AH: _cached(partial(badugi_policy, ace_low=False)),
+}
+
+
+def draw_policy_for(hand_configs: list[HandConfigSpec]) -> DrawPolicy | None:
+    """The policy for a showdown with a single anyCards hand, or None if there is none.
+
+    Split and multi-hand showdowns (hi-lo, badugi/lowball splits, dramaha)
+    have no single standard draw, so they are not covered.
+    """
+    if len(hand_configs) != 1 or hand_configs[0].any_cards is None:
+        return None
+    return DRAW_POLICIES.get(hand_configs[0].eval_type)
+
+
+def choose_keep(policy: DrawPolicy, hand: list[int], max_discards: int, min_discards: int = 0) -> list[int]:
+    """Cards to keep from a hand at a draw step allowing min..max discards."""
+    ordered, keep = policy(tuple(sorted(hand)))
+    keep = max(keep, len(hand) - max_discards)
+    keep = min(keep, len(hand) - min_discards)
+    return list(ordered[:keep])
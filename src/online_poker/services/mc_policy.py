@@ -92,6 +92,29 @@ def decide(
     return BotDecision(action=first[0], amount=first[1] if len(first) > 1 else None)
 
 
+def decision_thresholds(valid_actions: list[tuple], pot: int, call_cost: int, players_in_hand: int) -> list[float]:
+    """Equity values at which decide() switches between actions.
+
+    Bluffs, the randomised value-raise frequency and bet sizing are ignored:
+    they move within an outcome rather than between outcomes. An empty list
+    means equity cannot change the decision at all.
+    """
+    options = {action_tuple[0] for action_tuple in valid_actions}
+    tighten = MULTIWAY_TIGHTEN * max(0, players_in_hand - 2)
+    can_raise = bool(options & {PlayerAction.RAISE, PlayerAction.BET, PlayerAction.COMPLETE})
+
+    if PlayerAction.BRING_IN in options:
+        return [BET_THRESHOLD + tighten] if PlayerAction.COMPLETE in options else []
+    if PlayerAction.CHECK in options:
+        return [BET_THRESHOLD + tighten] if can_raise else []
+
+    pot_odds = call_cost / (pot + call_cost) if call_cost > 0 else 0.0
+    thresholds = [pot_odds + tighten + FOLD_MARGIN]
+    if can_raise:
+        thresholds.append(pot_odds + tighten + VALUE_MARGIN)
+    return thresholds
+
+
 def _sized_bet(action_tuple: tuple, equity: float, pot: int, rng: Random, aggression: float) -> BotDecision:
     """Pick a bet/raise amount within [min, max] scaled by equity strength.
 
@@ -0,0 +1,109 @@
+"""Opponent range weighting for Monte Carlo rollouts.
+
+Uniform sampling gives an opponent who raised the same random hands as one
+who checked, so the bot overrates its equity against aggression and needs
+many rollouts to see through it. A RangeModel instead weights each
+opponent's hidden starting hand by its preflop strength, according to how
+the opponent has played the hand so far:
+
+- raised: made at least one voluntary bet or raise this hand
+- called: put chips in voluntarily, but never bet or raised
+- anyone else (blinds that checked, players yet to act) stays uniform
+
+Strength is the hand's percentile in the variant's preflop equity table
+(generic_poker.analysis.preflop), split into STRENGTH_BUCKETS buckets with a
+weight per action. Rollouts apply the weights by rejection: a deal is kept
+with probability equal to the product of its opponents' weights, so accepted
+deals follow the weighted range and the equity estimator is unchanged.
+
+Only opponents whose whole starting hand is hidden are weighted, and only in
+variants that have a preflop table; the weights model preflop play and do
+not read later board texture.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+from random import Random
+
+from generic_poker.analysis.equity import UnsupportedForEquity
+from generic_poker.analysis.preflop import PreflopEquityTable, canonical_hand, starting_hand_size
+from generic_poker.core.card import code_to_card
+
+STRENGTH_BUCKETS = 10
+# Rejection sampling gives up after this many deals and keeps the last one
+MAX_RANGE_ATTEMPTS = 50
+CANONICAL_CACHE_SIZE = 1 << 16
+
+
+class RangeAction(str, Enum):
+    """How an opponent has played the hand, as far as ranges are concerned."""
+
+    RAISED = "raised"
+    CALLED = "called"
+
+
+# Weight of each strength bucket, weakest to strongest
+RANGE_WEIGHTS: dict[RangeAction, tuple[float, ...]] = {
+    RangeAction.RAISED: (0.05, 0.05, 0.1, 0.15, 0.25, 0.4, 0.6, 0.8, 1.0, 1.0),
+    # Callers hold fewer trash hands, and often raise their very best ones
+    RangeAction.CALLED: (0.2, 0.3, 0.45, 0.6, 0.8, 1.0, 1.0, 1.0, 0.9, 0.7),
+}
+
+
+def classify(betting, player_id: str) -> RangeAction | None:
+    """The player's range action from the betting manager's per-hand tracking."""
+    if betting.hand_aggression.get(player_id):
+        return RangeAction.RAISED
+    if betting.hand_voluntary.get(player_id):
+        return RangeAction.CALLED
+    return None
+
+
+@lru_cache(maxsize=CANONICAL_CACHE_SIZE)
+def _canonical(codes: tuple[int, ...]) -> str:
+    return canonical_hand([code_to_card(code) for code in codes])
+
+
+@dataclass
+class RangeModel:
+    """Per-opponent strength-bucket weights for one decision."""
+
+    hand_size: int
+    # canonical starting hand -> strength percentile (see PreflopEquityTable.percentiles)
+    percentiles: dict[str, float]
+    # opponent id -> weight per strength bucket
+    weights: dict[str, tuple[float, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def for_game(cls, game, table: PreflopEquityTable, opponents: list[tuple[str, list, int]]) -> "RangeModel | None":
+        """Ranges for a decision's opponents (RolloutSpec.opponents), or None if none apply."""
+        try:
+            hand_size = starting_hand_size(game.rules)
+        except UnsupportedForEquity:
+            return None
+        weights = {}
+        for pid, visible, hidden in opponents:
+            action = classify(game.betting, pid)
+            if action is not None and not visible and hidden == hand_size:
+                weights[pid] = RANGE_WEIGHTS[action]
+        if not weights:
+            return None
+        return cls(hand_size=hand_size, percentiles=table.percentiles(), weights=weights)
+
+    def bucket(self, codes: tuple[int, ...]) -> int:
+        """Strength bucket of a starting hand given as sorted card codes."""
+        percentile = self.percentiles.get(_canonical(codes), 0.5)
+        return min(int(percentile * STRENGTH_BUCKETS), STRENGTH_BUCKETS - 1)
+
+    def accept(self, drawn: list[int], slots: list[tuple[int, tuple[float, ...]]], rng: Random) -> bool:
+        """Whether to keep a deal, with probability the product of the ranged opponents' weights.
+
+        slots gives, per ranged opponent, the offset of their starting hand
+        in drawn and their bucket weights.
+        """
+        for offset, weights in slots:
+            weight = weights[self.bucket(tuple(sorted(drawn[offset : offset + self.hand_size])))]
+            if weight < 1.0 and rng.random() >= weight:
+                return False
+        return True
@@ -1,10 +1,13 @@
-"""Monte Carlo rollout engine (Phase 1): snapshot a mid-hand game, simulate completions.
+"""Monte Carlo rollout engine: snapshot a mid-hand game, simulate completions.
 
-Phase 1 supports betting decisions in games whose remaining steps are only
-deals and bets — Hold'em, Omaha, stud games, and the post-final-draw betting
-rounds of draw games. Anything outside that (pending draws, wild cards,
-multi-board layouts, declarations, exotic showdown configs) raises
-UnsupportedForRollout and the bot falls back to SimpleBot.
+Supports betting decisions in games whose remaining steps are deals, bets
+and draws — Hold'em, Omaha, stud games, and every betting round of draw
+games. Remaining draws are played out with the standard pat/draw policy for
+the showdown's evaluation type (mc_draw_policy). Opponents' hidden starting
+hands can be weighted by how they have bet (mc_range). Anything outside that
+(draws without a policy, discards, wild cards, multi-board layouts,
+declarations, exotic showdown configs) raises UnsupportedForRollout and the
+bot falls back to SimpleBot.
 
 Equity is the bot's expected pot-share fraction: each showdown bestHand config
 is worth 1/N of the pot, configs with no qualifying hands redistribute their
@@ -14,39 +17,36 @@ This handles ties, hi-lo splits, and dramaha-style splits uniformly.
 
 import itertools
 import logging
+import math
 import time
 from dataclasses import dataclass, field
 from random import Random
 
+from generic_poker.analysis.equity import (
+    HandConfigSpec,
+    UnsupportedForEquity,
+    count_deals,
+    parse_showdown,
+    showdown_winners_codes,
+)
 from generic_poker.config.loader import GameActionType
-from generic_poker.core.card import Card, Visibility
+from generic_poker.core.card import Card, Visibility, cards_to_codes
 from generic_poker.core.deck import Deck
-from generic_poker.evaluation.evaluator import EvaluationType, HandEvaluator
 
-logger = logging.getLogger(__name__)
-
-_evaluator = HandEvaluator()
+from .mc_draw_policy import DrawPolicy, choose_keep, draw_policy_for
+from .mc_range import MAX_RANGE_ATTEMPTS, RangeModel
 
-# The full bestHand vocabulary used by the Phase 1 target variants (WSOP mix).
-PHASE1_BESTHAND_KEYS = {"name", "evaluationType", "anyCards", "holeCards", "communityCards", "qualifier"}
+logger = logging.getLogger(__name__)
 
-# Steps a rollout can simulate without a decision policy.
-SIMULATABLE_STEPS = {GameActionType.BET, GameActionType.DEAL, GameActionType.SHOWDOWN}
+# Adaptive estimation: never stop before this many rollouts, test the
+# interval every ADAPTIVE_CHECK_EVERY rollouts, at about 95% confidence.
+MIN_ADAPTIVE_ROLLOUTS = 50
+ADAPTIVE_CHECK_EVERY = 10
+CONFIDENCE_Z = 1.96
 
 
 class UnsupportedForRollout(Exception):
-    """Game rules or state are outside Phase 1 rollout support."""
-
-
-@dataclass
-class HandConfigSpec:
-    """One showdown bestHand entry, reduced to the Phase 1 vocabulary."""
-
-    eval_type: EvaluationType
-    any_cards: int | None = None
-    hole_cards: int | None = None
-    community_cards: int = 0
-    qualifier: list[int] | None = None
+    """Game rules or state are outside rollout support."""
 
 
 @dataclass
@@ -62,19 +62,18 @@ class RolloutSpec:
     community_cards_to_come: int
     unseen: list[Card]
     hand_configs: list[HandConfigSpec] = field(default_factory=list)
+    # Most cards each player may replace at each remaining draw step, in order
+    draws: list[int] = field(default_factory=list)
+    # Opponent range weights (mc_range); None samples hidden cards uniformly
+    ranges: RangeModel | None = None
 
     @classmethod
     def from_game(cls, game, bot_id: str) -> "RolloutSpec":
         """Build a snapshot from a live Game, or raise UnsupportedForRollout."""
-        showdown = game.rules.showdown
-        if showdown.declaration_mode not in (None, "cards_speak"):
-            raise UnsupportedForRollout("declaration mode")
-        if showdown.conditionalBestHands:
-            raise UnsupportedForRollout("conditional best hands")
-        if not showdown.best_hand:
-            raise UnsupportedForRollout("no bestHand configs")
-
-        hand_configs = [_parse_hand_config(cfg) for cfg in showdown.best_hand]
+        try:
+            hand_configs = parse_showdown(game.rules)
+        except UnsupportedForEquity as e:
+            raise UnsupportedForRollout(str(e)) from e
 
         if any(
             getattr(game, attr, None)
@@ -82,7 +81,9 @@ class RolloutSpec:
         ) or getattr(game, "player_wild_ranks", None):
             raise UnsupportedForRollout("wild card state active")
 
-        player_to_come, community_to_come = _count_remaining_deals(game)
+        player_to_come, community_to_come, draws = _count_remaining_steps(game)
+        if draws and draw_policy_for(hand_configs) is None:
+            raise UnsupportedForRollout("no draw policy for this showdown")
 
         bot_player = game.table.players.get(bot_id)
         if bot_player is None:
@@ -93,6 +94,8 @@ class RolloutSpec:
         if set(community_subsets) - {"default"}:
             raise UnsupportedForRollout("multi-board community cards")
         community = [_copy_card(c) for c in community_subsets.get("default", [])]
+        if draws and (community or community_to_come):
+            raise UnsupportedForRollout("draws with community cards")
 
         seen_keys = {str(c) for c in bot_cards} | {str(c) for c in community}
         if any(c.is_wild for c in bot_cards) or any(c.is_wild for c in community):
@@ -138,6 +141,7 @@ class RolloutSpec:
             community_cards_to_come=community_to_come,
             unseen=unseen,
             hand_configs=hand_configs,
+            draws=draws,
         )
 
 
@@ -145,153 +149,237 @@ def _copy_card(card: Card) -> Card:
     return Card(card.rank, card.suit, card.visibility)
 
 
-def _parse_hand_config(cfg: dict) -> HandConfigSpec:
-    if set(cfg) - PHASE1_BESTHAND_KEYS:
-        raise UnsupportedForRollout(f"bestHand fields beyond Phase 1: {set(cfg) - PHASE1_BESTHAND_KEYS}")
-    try:
-        eval_type = EvaluationType(cfg["evaluationType"])
-    except (KeyError, ValueError) as e:
-        raise UnsupportedForRollout(f"evaluation type: {cfg.get('evaluationType')}") from e
-
-    any_cards = cfg.get("anyCards")
-    hole_cards = cfg.get("holeCards")
-    community_cards = cfg.get("communityCards", 0)
-    if any_cards is not None:
-        if not isinstance(any_cards, int):
-            raise UnsupportedForRollout("non-integer anyCards")
-    else:
-        if not isinstance(hole_cards, int) or not isinstance(community_cards, int):
-            raise UnsupportedForRollout("non-integer holeCards/communityCards")
-    return HandConfigSpec(
-        eval_type=eval_type,
-        any_cards=any_cards,
-        hole_cards=hole_cards,
-        community_cards=community_cards,
-        qualifier=cfg.get("qualifier"),
-    )
-
-
-def _count_remaining_deals(game) -> tuple[int, int]:
-    """Count cards still to be dealt per player and to the community.
+def _count_remaining_steps(game) -> tuple[int, int, list[int]]:
+    """Count cards still to be dealt per player and to the community, and list the draws.
 
+    Returns (player cards, community cards, most cards replaced per draw).
     Raises UnsupportedForRollout if any remaining pre-showdown step needs a
-    decision policy (draw/discard/expose/...) or uses features we can't model.
+    decision policy we lack (discard/expose/...) or uses features we can't
+    model. Only plain draws are supported, and only after the last deal.
     """
-    player_to_come = 0
-    community_to_come = 0
+    player_cards = 0
+    community_cards = 0
+    draws: list[int] = []
     for step in game.rules.gameplay[game.current_step + 1 :]:
-        if step.action_type not in SIMULATABLE_STEPS:
-            raise UnsupportedForRollout(f"remaining step: {step.action_type.name}")
-        if step.action_type != GameActionType.DEAL:
+        if step.action_type == GameActionType.DRAW:
+            draws.append(_draw_limit(step.action_config))
             continue
-        config = step.action_config
-        if not isinstance(config, dict) or "conditional_state" in config:
-            raise UnsupportedForRollout("conditional deal step")
-        location = config.get("location")
-        for card_spec in config.get("cards", []):
-            number = card_spec.get("number", 0)
-            if not isinstance(number, int):
-                raise UnsupportedForRollout("non-integer deal count")
-            if location == "player":
-                player_to_come += number
-            elif location == "community":
-                if card_spec.get("subset", "default") != "default":
-                    raise UnsupportedForRollout("multi-board community deal")
-                community_to_come += number
-            else:
-                raise UnsupportedForRollout(f"deal location: {location}")
-    return player_to_come, community_to_come
+        try:
+            players, community = count_deals([step])
+        except UnsupportedForEquity as e:
+            raise UnsupportedForRollout(f"remaining {e}") from e
+        if draws and (players or community):
+            raise UnsupportedForRollout("deal after a draw")
+        player_cards += players
+        community_cards += community
+    return player_cards, community_cards, draws
+
+
+def _draw_limit(config) -> int:
+    """Most cards a player may replace at a plain face-down draw step."""
+    cards = config.get("cards", []) if isinstance(config, dict) else []
+    if len(cards) != 1 or set(cards[0]) != {"number", "state"} or cards[0]["state"] != "face down":
+        raise UnsupportedForRollout("remaining draw step with special rules")
+    return cards[0]["number"]
+
+
+@dataclass
+class RolloutPlan:
+    """The parts of a RolloutSpec that are fixed for a decision, as integer card codes.
+
+    Built once per estimate_equity call, so each rollout only samples and
+    scores the newly drawn cards: no Card objects, no re-encoding of known
+    cards, and hole-card combinations of hands that are already complete
+    (e.g. the bot's Hold'em or Omaha hole cards) are enumerated only once.
+
+    With draws remaining, every player's hand is completed first and then
+    each draw is played out with draw_policy, replacing discards from the
+    rest of the deck (reshuffling the discards if it runs out).
+    """
+
+    bot_id: str
+    # (player_id, known card codes, cards drawn per rollout), in draw order
+    players: list[tuple[str, list[int], int]]
+    community: list[int]
+    unseen: list[int]
+    needed: int
+    hand_configs: list[HandConfigSpec]
+    # (player_id, config index) -> hole-card combinations of a complete hand
+    hole_combos: dict[tuple[str, int], list[tuple[int, ...]]]
+    draws: list[int] = field(default_factory=list)
+    draw_policy: DrawPolicy | None = None
+    ranges: RangeModel | None = None
+    # (offset in the drawn cards, bucket weights) of each ranged opponent's starting hand
+    range_slots: list[tuple[int, tuple[float, ...]]] = field(default_factory=list)
+
+    @classmethod
+    def from_spec(cls, spec: RolloutSpec) -> "RolloutPlan":
+        players = [
+            (pid, cards_to_codes(visible), hidden + spec.player_cards_to_come)
+            for pid, visible, hidden in spec.opponents
+        ]
+        players.append((spec.bot_id, cards_to_codes(spec.bot_cards), spec.player_cards_to_come))
+
+        # Ranged opponents hold only hidden cards, and their starting hand is drawn first
+        range_slots = []
+        if spec.ranges is not None and not spec.draws:
+            offset = 0
+            for pid, _, to_draw in players:
+                if pid in spec.ranges.weights:
+                    range_slots.append((offset, spec.ranges.weights[pid]))
+                offset += to_draw
+
+        hole_combos = {}
+        for pid, known, to_draw in players:
+            if to_draw:
+                continue
+            for i, cfg in enumerate(spec.hand_configs):
+                if cfg.any_cards is None and cfg.community_cards and len(known) >= cfg.hole_cards:
+                    hole_combos[(pid, i)] = list(itertools.combinations(known, cfg.hole_cards))
+
+        return cls(
+            bot_id=spec.bot_id,
+            players=players,
+            community=cards_to_codes(spec.community),
+            unseen=cards_to_codes(spec.unseen),
+            needed=sum(to_draw for _, _, to_draw in players) + spec.community_cards_to_come,
+            hand_configs=spec.hand_configs,
+            hole_combos=hole_combos,
+            draws=spec.draws,
+            draw_policy=draw_policy_for(spec.hand_configs) if spec.draws else None,
+            ranges=spec.ranges if range_slots else None,
+            range_slots=range_slots,
+        )
+
+    def run(self, rng: Random) -> float:
+        """Run one rollout; return the bot's pot-share fraction (0.0 - 1.0)."""
+        if self.draws:
+            return self._share(self._play_draws(rng), self.community)
+        drawn = rng.sample(self.unseen, self.needed) if self.needed else []
+        if self.ranges is not None:
+            # Weighted rejection: redeal until the opponents' hands fit their ranges
+            for _ in range(MAX_RANGE_ATTEMPTS - 1):
+                if self.ranges.accept(drawn, self.range_slots, rng):
+                    break
+                drawn = rng.sample(self.unseen, self.needed)
+        pos = 0
+        hands: dict[str, list[int]] = {}
+        for pid, known, to_draw in self.players:
+            hands[pid] = known + drawn[pos : pos + to_draw] if to_draw else known
+            pos += to_draw
+        return self._share(hands, self.community + drawn[pos:])
+
+    def _play_draws(self, rng: Random) -> dict[str, list[int]]:
+        """Deal out every hand, then play each remaining draw with the draw policy."""
+        deck = rng.sample(self.unseen, len(self.unseen))
+        discards: list[int] = []
+        hands: dict[str, list[int]] = {}
+        for pid, known, to_draw in self.players:
+            hands[pid] = known + [deck.pop() for _ in range(to_draw)]
+        for max_discards in self.draws:
+            for pid, hand in hands.items():
+                keep = choose_keep(self.draw_policy, hand, max_discards)
+                replace = len(hand) - len(keep)
+                if replace > len(deck):
+                    rng.shuffle(discards)
+                    deck, discards = discards + deck, []
+                    # Still short (tiny deck, many players): keep what cannot be replaced
+                    if replace > len(deck):
+                        keep += [c for c in hand if c not in keep][: replace - len(deck)]
+                        replace = len(deck)
+                discards.extend(c for c in hand if c not in keep)
+                hands[pid] = keep + [deck.pop() for _ in range(replace)]
+        return hands
+
+    def _share(self, hands: dict[str, list[int]], community: list[int]) -> float:
+        """The bot's pot-share fraction at showdown with these hands."""
+        # Each config is worth an equal pot share; configs nobody qualifies for
+        # redistribute their share to the configs that do have winners.
+        winners_per_config = showdown_winners_codes(hands, community, self.hand_configs, self.hole_combos)
+        if not winners_per_config:
+            return 0.0
+        share_per_config = 1.0 / len(winners_per_config)
+        return sum(share_per_config / len(winners) for winners in winners_per_config if self.bot_id in winners)
 
 
 def run_rollout(spec: RolloutSpec, rng: Random) -> float:
-    """Run one rollout; return the bot's pot-share fraction (0.0 - 1.0)."""
-    needed = (
-        sum(h for _, _, h in spec.opponents)
-        + (len(spec.opponents) + 1) * spec.player_cards_to_come
-        + spec.community_cards_to_come
-    )
-    drawn = rng.sample(spec.unseen, needed) if needed else []
-    pos = 0
-
-    hands: dict[str, list[Card]] = {}
-    for pid, visible, hidden in spec.opponents:
-        hands[pid] = visible + drawn[pos : pos + hidden + spec.player_cards_to_come]
-        pos += hidden + spec.player_cards_to_come
-    hands[spec.bot_id] = spec.bot_cards + drawn[pos : pos + spec.player_cards_to_come]
-    pos += spec.player_cards_to_come
-    community = spec.community + drawn[pos:]
-
-    config_bests: list[dict[str, tuple[int, int]]] = []
-    for cfg in spec.hand_configs:
-        bests = {}
-        for pid, cards in hands.items():
-            rank = _best_hand_rank(cards, community, cfg)
-            if rank is not None:
-                bests[pid] = rank
-        config_bests.append(bests)
-
-    # Each config is worth an equal pot share; configs nobody qualifies for
-    # redistribute their share to the configs that do have winners.
-    winnable = [bests for bests in config_bests if bests]
-    if not winnable:
-        return 0.0
-    share_per_config = 1.0 / len(winnable)
-    bot_share = 0.0
-    for bests in winnable:
-        best_rank = min(bests.values())
-        winners = [pid for pid, rank in bests.items() if rank == best_rank]
-        if spec.bot_id in winners:
-            bot_share += share_per_config / len(winners)
-    return bot_share
-
-
-def _best_hand_rank(hole: list[Card], community: list[Card], cfg: HandConfigSpec) -> tuple[int, int] | None:
-    """Best (rank, ordered_rank) for one player under one config; None if no qualifying hand.
-
-    Lower tuples are better (rank 1 = best for both high and low games).
+    """Run one rollout; return the bot's pot-share fraction (0.0 - 1.0).
+
+    Loops should build a RolloutPlan once and call its run method instead.
     """
-    best: tuple[int, int] | None = None
-    if cfg.any_cards is not None:
-        pool = hole + community
-        if len(pool) < cfg.any_cards:
-            return None
-        for combo in itertools.combinations(pool, cfg.any_cards):
-            rank = _rank_of(combo, cfg.eval_type)
-            if rank is not None and (best is None or rank < best):
-                best = rank
-    else:
-        if len(hole) < cfg.hole_cards or len(community) < cfg.community_cards:
-            return None
-        for hole_combo in itertools.combinations(hole, cfg.hole_cards):
-            for community_combo in itertools.combinations(community, cfg.community_cards):
-                rank = _rank_of(hole_combo + community_combo, cfg.eval_type)
-                if rank is not None and (best is None or rank < best):
-                    best = rank
-
-    # Qualifier check on the best hand only — if the best doesn't qualify,
-    # nothing does. evaluate_hand's own qualifier handling returns rank=0
-    # which would incorrectly beat rank 1 in tuple comparison, so check here.
-    if best is not None and cfg.qualifier:
-        q_rank, q_ordered = cfg.qualifier[0], cfg.qualifier[1] if len(cfg.qualifier) > 1 else None
-        if best[0] > q_rank or (best[0] == q_rank and q_ordered is not None and best[1] > q_ordered):
-            return None
-    return best
-
-
-def _rank_of(cards, eval_type: EvaluationType) -> tuple[int, int] | None:
-    result = _evaluator.evaluate_hand(list(cards), eval_type)
-    if result is None or result.rank == 0:
-        return None
-    return (result.rank, result.ordered_rank if result.ordered_rank is not None else 0)
+    return RolloutPlan.from_spec(spec).run(rng)
+
+
+@dataclass
+class EquityEstimate:
+    """A Monte Carlo equity estimate with its confidence interval."""
+
+    equity: float
+    rollouts: int
+    low: float
+    high: float
+    # Sum of squared deviations from the mean (Welford), so an estimate can be resumed
+    m2: float = 0.0
+
+    def settles(self, thresholds: list[float]) -> bool:
+        """Whether the confidence interval already lies strictly between two thresholds."""
+        return not any(self.low <= t <= self.high for t in thresholds)
 
 
 def estimate_equity(spec: RolloutSpec, rng: Random, deadline: float, max_rollouts: int) -> tuple[float, int]:
     """Average pot-share over rollouts until max_rollouts or deadline. Always runs at least one."""
-    total = 0.0
-    completed = 0
+    estimate = estimate_equity_adaptive(spec, rng, deadline, max_rollouts)
+    return estimate.equity, estimate.rollouts
+
+
+def estimate_equity_adaptive(
+    spec: RolloutSpec,
+    rng: Random,
+    deadline: float,
+    max_rollouts: int,
+    thresholds: list[float] | None = None,
+    min_rollouts: int = MIN_ADAPTIVE_ROLLOUTS,
+    z: float = CONFIDENCE_Z,
+    prior: EquityEstimate | None = None,
+) -> EquityEstimate:
+    """Estimate equity, stopping early once the answer is decisive.
+
+    Tracks the running mean and variance of the pot-share (Welford). After
+    min_rollouts, sampling stops as soon as the z-sigma confidence interval
+    lies strictly between two thresholds (see mc_policy.decision_thresholds),
+    since more rollouts could not change the decision. With thresholds None
+    it runs until max_rollouts or the deadline like estimate_equity.
+
+    prior resumes an earlier estimate of the same spec: its rollouts count
+    towards min_rollouts and max_rollouts (see mc_cache).
+    """
+    plan = RolloutPlan.from_spec(spec)
+    mean = prior.equity if prior else 0.0
+    m2 = prior.m2 if prior else 0.0
+    completed = prior.rollouts if prior else 0
     while completed < max_rollouts:
         if completed > 0 and time.monotonic() > deadline:
             break
-        total += run_rollout(spec, rng)
+        share = plan.run(rng)
         completed += 1
-    return total / completed, completed
+        delta = share - mean
+        mean += delta / completed
+        m2 += delta * (share - mean)
+        if (
+            thresholds is not None
+            and completed >= min_rollouts
+            and completed % ADAPTIVE_CHECK_EVERY == 0
+            and not any(abs(mean - t) <= _half_width(m2, completed, z) for t in thresholds)
+        ):
+            break
+    half_width = _half_width(m2, completed, z)
+    return EquityEstimate(
+        equity=mean, rollouts=completed, low=max(0.0, mean - half_width), high=min(1.0, mean + half_width), m2=m2
+    )
+
+
+def _half_width(m2: float, count: int, z: float) -> float:
+    """z standard errors of the mean; unbounded until there are two samples."""
+    if count < 2:
+        return float("inf")
+    return z * math.sqrt(m2 / (count - 1) / count)
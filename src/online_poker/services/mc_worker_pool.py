@@ -0,0 +1,167 @@
+"""Off-process equity estimation for the Monte Carlo bot.
+
+Rollouts are pure-Python CPU work. Run inside the web process they hold the
+GIL (or, under eventlet, the hub) for the whole time budget and stall every
+Socket.IO handler. The pool ships the RolloutSpec snapshot to worker
+processes instead, so the web process only snapshots the game and maps the
+returned equity to an action.
+
+With workers=0 the pool runs rollouts in the calling process and hands back
+an already-completed future — the behaviour tests and single-process tools
+expect, and what the app falls back to when BOT_WORKERS is 0.
+
+A freshly spawned worker has no hand rankings loaded, and compiling them
+from CSV takes far longer than a decision's time budget. Each worker loads
+the rankings for WARM_EVAL_TYPES in its initializer, and warm() starts the
+workers at app startup so that happens before the first decision.
+"""
+
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from random import Random
+from threading import Lock
+
+from generic_poker.evaluation.evaluator import EvaluationType, evaluator
+
+from .mc_rollout import EquityEstimate, RolloutSpec, estimate_equity_adaptive
+
+logger = logging.getLogger(__name__)
+
+# How often a waiting bot loop checks its result. time.sleep yields to other
+# greenlets under eventlet and releases the GIL under threading.
+POLL_INTERVAL_S = 0.005
+
+# Rankings each worker loads at start: the showdowns of high games (Hold'em,
+# Omaha, stud), hi-lo and razz, and 2-7 lowball
+WARM_EVAL_TYPES = (EvaluationType.HIGH, EvaluationType.LOW_A5, EvaluationType.LOW_27)
+
+
+def _warm_worker(eval_types: tuple[EvaluationType, ...]) -> None:
+    """Worker initializer: load rankings before the first estimate arrives."""
+    for eval_type in eval_types:
+        try:
+            evaluator.get_evaluator(eval_type)
+        except Exception as e:
+            logger.warning(f"MC bot worker could not preload {eval_type.value} rankings: {e}")
+
+
+def _ready() -> bool:
+    return True
+
+
+def _estimate_in_worker(
+    spec: RolloutSpec,
+    seed: int,
+    time_budget_s: float,
+    max_rollouts: int,
+    thresholds: list[float] | None,
+    prior: EquityEstimate | None,
+) -> EquityEstimate:
+    """Worker entry point: the deadline starts when the worker picks the job up."""
+    deadline = time.monotonic() + time_budget_s
+    return estimate_equity_adaptive(spec, Random(seed), deadline, max_rollouts, thresholds, prior=prior)
+
+
+class EquityWorkerPool:
+    """Runs Monte Carlo equity estimates in a pool of worker processes."""
+
+    def __init__(self, workers: int = 0):
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = Lock()
+
+    def configure(self, workers: int) -> None:
+        """Resize the pool; 0 runs estimates in the calling process."""
+        with self._lock:
+            if workers == self.workers:
+                return
+            self._shutdown_locked()
+            self.workers = workers
+        logger.info(f"MC bot equity pool: {workers or 'in-process'} workers")
+
+    def submit(
+        self,
+        spec: RolloutSpec,
+        seed: int,
+        time_budget_s: float,
+        max_rollouts: int,
+        thresholds: list[float] | None = None,
+        prior: EquityEstimate | None = None,
+    ) -> Future:
+        """Start an estimate; the future resolves to an EquityEstimate.
+
+        thresholds enables early stopping and prior resumes an earlier
+        estimate, see estimate_equity_adaptive.
+        """
+        args = (spec, seed, time_budget_s, max_rollouts, thresholds, prior)
+        if self.workers <= 0:
+            future: Future = Future()
+            try:
+                future.set_result(_estimate_in_worker(*args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        with self._lock:
+            try:
+                return self._get_executor().submit(_estimate_in_worker, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed); start a fresh pool and retry once
+                logger.warning("MC bot equity pool broken; restarting it")
+                self._shutdown_locked()
+                return self._get_executor().submit(_estimate_in_worker, *args)
+
+    def warm(self) -> list[Future]:
+        """Start every worker now, loading its rankings ahead of the first decision.
+
+        Returns one future per worker, done once that worker is ready (none in-process).
+        """
+        if self.workers <= 0:
+            return []
+        with self._lock:
+            executor = self._get_executor()
+            # Submitted together, before any worker is idle, so each one spawns a process
+            return [executor.submit(_ready) for _ in range(self.workers)]
+
+    @staticmethod
+    def wait(future: Future, timeout_s: float) -> EquityEstimate:
+        """Wait for an estimate without blocking other handlers.
+
+        Raises:
+            TimeoutError: If the estimate is not ready in time (the job is cancelled)
+        """
+        deadline = time.monotonic() + timeout_s
+        while not future.done():
+            if time.monotonic() > deadline:
+                future.cancel()
+                raise TimeoutError(f"equity estimate not ready after {timeout_s:.1f}s")
+            time.sleep(POLL_INTERVAL_S)
+        return future.result()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; the pool restarts on the next submit."""
+        with self._lock:
+            self._shutdown_locked()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a threaded (or eventlet-patched) web process is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+                initargs=(WARM_EVAL_TYPES,),
+            )
+        return self._executor
+
+    def _shutdown_locked(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Global pool shared by every MonteCarloBot; sized from BOT_WORKERS at app startup
+equity_worker_pool = EquityWorkerPool()
@@ -1,28 +1,52 @@
 """Monte Carlo equity bot — variant-agnostic via the engine's hand evaluator.
 
-Phase 1: Monte Carlo for betting decisions when the rest of the hand is
-deal-only (Hold'em, Omaha, stud, and post-final-draw rounds of draw games).
-Everything else — draw/discard/expose/pass/declare/choose actions, and betting
-decisions in states the rollout engine can't model — falls back to SimpleBot.
+Monte Carlo for betting decisions when the rest of the hand is deals and
+draws the rollout engine can model (Hold'em, Omaha, stud, and draw games with
+a standard draw policy). Draws use that same policy (mc_draw_policy).
+Everything else — discard/expose/pass/declare/choose actions, and decisions
+in states the rollout engine can't model — falls back to SimpleBot.
 
 Drop-in compatible with SimpleBot: same choose_action_full signature, same
-BotDecision return type, same BotManager integration.
+BotDecision return type, same BotManager integration. Rollouts run in the
+shared equity worker pool (mc_worker_pool), off the web process. Before the
+first card is seen, equity comes from the precomputed preflop tables
+(generic_poker.analysis.preflop) when the variant has one. The same tables
+weight opponents' hands by how they have bet (mc_range). Estimates are kept
+per table and resumed when the bot faces the same cards again (mc_cache).
 """
 
 import logging
 import time
+from functools import cache
 from random import Random
 
+from generic_poker.analysis.equity import UnsupportedForEquity, parse_showdown
+from generic_poker.analysis.preflop import PreflopEquityTable, load_preflop_tables
+from generic_poker.core.card import cards_to_codes
+from generic_poker.core.deck import Deck
 from generic_poker.game.game_state import PlayerAction
 
-from .mc_policy import BETTING_ACTIONS, decide
-from .mc_rollout import RolloutSpec, UnsupportedForRollout, estimate_equity
+from .mc_cache import rollout_cache_for
+from .mc_draw_policy import choose_keep, draw_policy_for
+from .mc_policy import BETTING_ACTIONS, decide, decision_thresholds
+from .mc_range import RangeModel
+from .mc_rollout import MIN_ADAPTIVE_ROLLOUTS, EquityEstimate, RolloutSpec, UnsupportedForRollout
+from .mc_worker_pool import EquityWorkerPool, equity_worker_pool
 from .simple_bot import BotDecision, SimpleBot
 
 logger = logging.getLogger(__name__)
 
 # Absolute wall-clock cap per decision regardless of configured budget.
 HARD_CAP_MS = 3000
+# Extra wait for a worker result beyond the budget (queueing, pickling). The
+# budget is clamped so that budget and grace together stay within HARD_CAP_MS.
+RESULT_GRACE_MS = 500
+
+
+@cache
+def default_preflop_tables() -> dict[str, PreflopEquityTable]:
+    """Preflop tables shipped in data/preflop_equity, loaded on first use."""
+    return load_preflop_tables()
 
 
 class MonteCarloBot:
@@ -36,15 +60,23 @@ class MonteCarloBot:
         max_rollouts: int = 500,
         aggression: float = 1.0,
         seed: int | None = None,
+        worker_pool: EquityWorkerPool | None = None,
+        preflop_tables: dict[str, PreflopEquityTable] | None = None,
+        use_ranges: bool = True,
+        use_cache: bool = True,
     ):
         self.player_id = player_id
         self.username = username
         self.is_bot = True
-        self.time_budget_ms = min(time_budget_ms, HARD_CAP_MS)
+        self.time_budget_ms = min(time_budget_ms, HARD_CAP_MS - RESULT_GRACE_MS)
         self.max_rollouts = max_rollouts
         self.aggression = aggression
         self._rng = Random(seed)
         self._fallback = SimpleBot(player_id, username)
+        self._worker_pool = worker_pool
+        self._preflop_tables = preflop_tables
+        self.use_ranges = use_ranges
+        self.use_cache = use_cache
 
     def choose_action_full(self, valid_actions: list[tuple], game=None, player_id: str | None = None) -> BotDecision:
         """Choose an action; same contract as SimpleBot.choose_action_full."""
@@ -54,23 +86,40 @@ class MonteCarloBot:
 
         pid = player_id or self.player_id
         action_types = {a[0] for a in valid_actions}
+        if game is not None and PlayerAction.DRAW in action_types:
+            decision = self._choose_draw(valid_actions, game, pid)
+            if decision is not None:
+                return decision
         if game is None or not (action_types & BETTING_ACTIONS):
             return self._fallback.choose_action_full(valid_actions, game, player_id)
 
         try:
             spec = RolloutSpec.from_game(game, pid)
-            deadline = time.monotonic() + self.time_budget_ms / 1000
-            started = time.monotonic()
-            equity, rollouts = estimate_equity(spec, self._rng, deadline, self.max_rollouts)
-            elapsed_ms = (time.monotonic() - started) * 1000
-
             pot = game.betting.get_total_pot()
             call_cost = game.betting.get_additional_required(pid)
             players_in_hand = sum(1 for p in game.table.players.values() if p.is_active)
+            # Stop rolling out once more samples could not change the action
+            thresholds = decision_thresholds(valid_actions, pot, call_cost, players_in_hand)
+
+            started = time.monotonic()
+            table = self._preflop_table(game)
+            if table is not None and self.use_ranges:
+                spec.ranges = RangeModel.for_game(game, table, spec.opponents)
+            # The tables assume random opponent hands, so ranged decisions roll out
+            equity = self._table_equity(spec, game) if spec.ranges is None else None
+            if equity is not None:
+                source = "from preflop table"
+            else:
+                estimate, cached = self._estimate(spec, game, thresholds)
+                equity = estimate.equity
+                source = f"[{estimate.low:.3f}, {estimate.high:.3f}] over {estimate.rollouts} rollouts"
+                if cached:
+                    source += f" ({cached} cached)"
+            elapsed_ms = (time.monotonic() - started) * 1000
 
             decision = decide(equity, valid_actions, pot, call_cost, players_in_hand, self._rng, self.aggression)
             logger.info(
-                f"MC bot {self.username}: equity={equity:.3f} ({rollouts} rollouts, {elapsed_ms:.0f}ms) "
+                f"MC bot {self.username}: equity={equity:.3f} {source} ({elapsed_ms:.0f}ms) "
                 f"pot={pot} call={call_cost} -> {decision.action.value}"
                 f"{' ' + str(decision.amount) if decision.amount else ''}"
             )
@@ -82,6 +131,70 @@ class MonteCarloBot:
             logger.warning(f"MC bot {self.username}: rollout failed, falling back to SimpleBot", exc_info=True)
             return self._fallback.choose_action_full(valid_actions, game, player_id)
 
+    def _estimate(self, spec: RolloutSpec, game, thresholds: list[float]) -> tuple[EquityEstimate, int]:
+        """Roll out, resuming the table's cached estimate for this card state.
+
+        Returns the estimate and how many of its rollouts came from the cache.
+        """
+        cache = rollout_cache_for(game) if self.use_cache else None
+        prior = cache.get(spec) if cache is not None else None
+        if prior is not None and (
+            prior.rollouts >= self.max_rollouts
+            or (prior.rollouts >= MIN_ADAPTIVE_ROLLOUTS and prior.settles(thresholds))
+        ):
+            return prior, prior.rollouts
+
+        pool = self._worker_pool or equity_worker_pool
+        future = pool.submit(
+            spec, self._rng.randrange(2**32), self.time_budget_ms / 1000, self.max_rollouts, thresholds, prior=prior
+        )
+        estimate = pool.wait(future, (self.time_budget_ms + RESULT_GRACE_MS) / 1000)
+        if cache is not None:
+            cache.put(spec, estimate)
+        return estimate, prior.rollouts if prior is not None else 0
+
+    def _choose_draw(self, valid_actions: list[tuple], game, player_id: str) -> BotDecision | None:
+        """Discard with the variant's standard draw policy; None if it has none."""
+        try:
+            policy = draw_policy_for(parse_showdown(game.rules))
+        except UnsupportedForEquity:
+            return None
+        player = game.table.players.get(player_id)
+        if policy is None or player is None:
+            return None
+        hand = player.hand.get_cards()
+        if any(card.is_wild for card in hand):
+            return None
+
+        action = next(a for a in valid_actions if a[0] == PlayerAction.DRAW)
+        min_cards = (action[1] if len(action) > 1 else 0) or 0
+        max_cards = (action[2] if len(action) > 2 else 0) or 0
+        codes = cards_to_codes(hand)
+        keep = set(choose_keep(policy, codes, max_cards, min_cards))
+        discards = [card for card, code in zip(hand, codes, strict=True) if code not in keep]
+        logger.info(f"MC bot {self.username} draw: discarding {len(discards)} cards")
+        return BotDecision(action=PlayerAction.DRAW, amount=0, cards=discards)
+
+    def _preflop_table(self, game) -> PreflopEquityTable | None:
+        tables = self._preflop_tables if self._preflop_tables is not None else default_preflop_tables()
+        return tables.get(game.rules.game)
+
+    def _table_equity(self, spec: RolloutSpec, game) -> float | None:
+        """Equity from the variant's preflop table, if the decision is still preflop.
+
+        Only used while nothing but the bot's own starting hand is known: no
+        community or opponent cards seen, no cards dead or to come to players.
+        """
+        table = self._preflop_table(game)
+        if table is None or spec.community or spec.player_cards_to_come:
+            return None
+        if any(known for _, known, _ in spec.opponents):
+            return None
+        deck_size = len(Deck(deck_type=game.table.deck_type).cards)
+        if len(spec.unseen) + len(spec.bot_cards) != deck_size:
+            return None
+        return table.lookup(spec.bot_cards, len(spec.opponents))
+
     @staticmethod
     def is_bot_player(player_id: str) -> bool:
         """Check if a player ID represents a bot/demo player."""
@@ -10,6 +10,7 @@ from generic_poker.game.game_state import GameState, PlayerAction
 
 from ..services.disconnect_manager import disconnect_manager
 from ..services.game_orchestrator import GameSession, game_orchestrator
+from ..services.hand_persistence import HandRecord, hand_persistence_queue
 from ..services.websocket_manager import GameEvent, get_websocket_manager
 
 logger = logging.getLogger(__name__)
@@ -1107,16 +1108,12 @@ class PlayerActionManager:
             else:
                 logger.warning("WebSocket manager not available for broadcasting hand completion")
 
-            # Save hand to database
-            self._save_hand_to_database(table_id, session, results_dict, hand_number)
-
-            # Save session state for recovery after server restart
-            self._save_session_state(table_id, session)
-
-            # Sync player chip stacks to the DB. This must happen here (the
-            # single completion point) — completion via _next_step() after the
-            # final action never passes through process_player_action's sync.
-            self._sync_player_stacks(table_id, session)
+            # Queue the hand history, session state (for recovery after a
+            # server restart) and chip stacks for the background writer. This
+            # must happen here (the single completion point) — completion via
+            # _next_step() after the final action never passes through
+            # process_player_action. Cashouts flush the table's queue first.
+            hand_persistence_queue.submit(self._build_hand_record(table_id, session, results_dict, hand_number))
 
             # Process any pending leaves now that the hand is complete
             if session.pending_leaves:
@@ -1144,151 +1141,74 @@ class PlayerActionManager:
         except Exception as e:
             logger.error(f"Failed to handle hand completion for table {table_id}: {e}", exc_info=True)
 
-    def _sync_player_stacks(self, table_id: str, session: GameSession) -> None:
-        """Persist in-game chip stacks to table_access so cashouts pay the real stack."""
-        try:
-            from ..services.simple_bot import bot_manager
-            from ..services.table_access_manager import TableAccessManager
-
-            for player in session.game.table.players.values():
-                if bot_manager.is_bot(player.id):
-                    continue  # bots have no DB records
-                TableAccessManager.update_player_stack(player.id, table_id, player.stack)
-        except Exception as e:
-            logger.error(f"Failed to sync player stacks for table {table_id}: {e}")
-
-    def _save_hand_to_database(self, table_id: str, session: GameSession, results_dict: dict, hand_number: int) -> None:
-        """Save completed hand to the database for hand history.
+    def _build_hand_record(
+        self, table_id: str, session: GameSession, results_dict: dict, hand_number: int
+    ) -> HandRecord:
+        """Snapshot a completed hand for the persistence queue.
 
         Args:
             table_id: ID of the table
             session: Game session that completed
             results_dict: Serialized hand results
             hand_number: Hand number
-        """
-        try:
-            from ..database import db
-            from ..models.game_history import GameHistory
-            from ..services.user_manager import UserManager
-
-            user_manager = UserManager()
-
-            # Build players list with stacks
-            players_data = []
-            if session.game and hasattr(session.game, "table"):
-                for player_id, player in session.game.table.players.items():
-                    user = user_manager.get_user_by_id(player_id)
-                    players_data.append(
-                        {
-                            "user_id": player_id,
-                            "username": user.username if user else player.name,
-                            "stack": player.stack,
-                            "position": player.position.value if player.position else "NA",
-                        }
-                    )
-
-            # Build actions from in-memory history
-            actions_data = self.action_history.get(table_id, [])
-
-            # Extract winner IDs from results
-            winner_ids = []
-            for pot in results_dict.get("pots", []):
-                for winner_id in pot.get("winners", []):
-                    if winner_id not in winner_ids:
-                        winner_ids.append(winner_id)
-
-            # Add winners to results for the model's get_winner_ids()
-            results_with_winners = dict(results_dict)
-            results_with_winners["winners"] = winner_ids
-
-            # Get stakes from table
-            stakes = {}
-            if session.table:
-                stakes = session.table.get_stakes() if hasattr(session.table, "get_stakes") else {}
-
-            # Get variant and betting structure
-            variant = session.table.variant if session.table else "unknown"
-            betting_structure = session.table.betting_structure if session.table else "unknown"
-
-            history = GameHistory(
-                table_id=table_id,
-                hand_number=hand_number,
-                players=players_data,
-                actions=actions_data,
-                results=results_with_winners,
-                variant=variant,
-                betting_structure=betting_structure,
-                stakes=stakes,
-            )
-
-            db.session.add(history)
-            db.session.commit()
-            logger.info(f"Saved hand #{hand_number} to database for table {table_id}")
-
-        except Exception as e:
-            logger.error(f"Failed to save hand to database for table {table_id}: {e}")
-            try:
-                from ..database import db
-
-                db.session.rollback()
-            except Exception as rollback_err:
-                logger.error(f"Failed to rollback after hand save error: {rollback_err}")
-
-    def _save_session_state(self, table_id: str, session: GameSession) -> None:
-        """Save session state to database for recovery after server restart.
 
-        Upserts a GameSessionState record with current dealer position and hands played.
-
-        Args:
-            table_id: ID of the table
-            session: Game session that just completed a hand
+        Returns:
+            HandRecord holding copies of everything written for the hand
         """
-        try:
-            from ..database import db
-            from ..models.game_session_state import GameSessionState
-
-            # Read current dealer seat from the game engine
-            dealer_seat = 1
-            if session.game and hasattr(session.game, "table"):
-                dealer_seat = session.game.table.button_seat
-
-            hands_played = getattr(session, "hands_played", 0)
-
-            # Upsert: find existing record or create new one
-            state = db.session.query(GameSessionState).filter_by(table_id=table_id).first()
-            if state:
-                state.dealer_seat = dealer_seat
-                state.hands_played = hands_played
-                state.is_active = True
-                state.last_activity = datetime.utcnow()
-                state.session_id = session.session_id
-            else:
-                state = GameSessionState(
-                    table_id=table_id,
-                    dealer_seat=dealer_seat,
-                    hands_played=hands_played,
-                    is_active=True,
-                    session_id=session.session_id,
+        from ..services.simple_bot import bot_manager
+
+        players_data = []
+        stacks = {}
+        dealer_seat = 1
+        if session.game and hasattr(session.game, "table"):
+            dealer_seat = session.game.table.button_seat
+            for player_id, player in session.game.table.players.items():
+                players_data.append(
+                    {
+                        "user_id": player_id,
+                        "username": player.name,
+                        "stack": player.stack,
+                        "position": player.position.value if player.position else "NA",
+                    }
                 )
-                db.session.add(state)
-
-            # Persist mixed game rotation state
-            if session.mixed_game_config:
-                state.current_variant_index = session.current_variant_index
-                state.hands_in_current_variant = session.hands_in_current_variant
-                state.orbit_size = session.orbit_size
-
-            db.session.commit()
-            logger.info(f"Saved session state for table {table_id}: dealer_seat={dealer_seat}, hands={hands_played}")
+                if not bot_manager.is_bot(player_id):  # bots have no DB records
+                    stacks[player_id] = player.stack
 
-        except Exception as e:
-            logger.error(f"Failed to save session state for table {table_id}: {e}")
-            try:
-                from ..database import db
-
-                db.session.rollback()
-            except Exception as rollback_err:
-                logger.error(f"Failed to rollback after session state save error: {rollback_err}")
+        # Copy the in-memory history; the next hand keeps appending to it
+        with self.lock:
+            actions_data = [dict(action) for action in self.action_history.get(table_id, [])]
+
+        # Add winners to results for the model's get_winner_ids()
+        winner_ids = []
+        for pot in results_dict.get("pots", []):
+            for winner_id in pot.get("winners", []):
+                if winner_id not in winner_ids:
+                    winner_ids.append(winner_id)
+        results_with_winners = {**results_dict, "winners": winner_ids}
+
+        stakes = {}
+        if session.table and hasattr(session.table, "get_stakes"):
+            stakes = session.table.get_stakes()
+
+        rotation = None
+        if session.mixed_game_config:
+            rotation = (session.current_variant_index, session.hands_in_current_variant, session.orbit_size)
+
+        return HandRecord(
+            table_id=table_id,
+            hand_number=hand_number,
+            players=players_data,
+            actions=actions_data,
+            results=results_with_winners,
+            variant=session.table.variant if session.table else "unknown",
+            betting_structure=session.table.betting_structure if session.table else "unknown",
+            stakes=stakes,
+            session_id=session.session_id,
+            dealer_seat=dealer_seat,
+            hands_played=getattr(session, "hands_played", 0),
+            rotation=rotation,
+            stacks=stacks,
+        )
 
     def _auto_fold_pending_players(self, table_id: str, session: GameSession) -> None:
         """Auto-fold any pending-leave players who are now current to act.
@@ -270,20 +270,9 @@ class PlayerSessionManager:
             Player information dictionary or None if not found
         """
         try:
-            # Get access record
-            access_record = (
-                db.session.query(TableAccess)
-                .filter(TableAccess.table_id == table_id, TableAccess.user_id == user_id, TableAccess.is_active == True)
-                .first()
-            )
-
-            if not access_record:
-                return None
-
-            # Get user info
-            user_manager = UserManager()
-            user = user_manager.get_user_by_id(user_id)
-            if not user:
+            # Get the player's roster entry (active access, active user)
+            player = next((p for p in TableAccessManager.get_table_players(table_id) if p["user_id"] == user_id), None)
+            if not player:
                 return None
 
             # Get game session info
@@ -300,16 +289,9 @@ class PlayerSessionManager:
                     game_status = "not_in_game"
 
             return {
-                "user_id": user_id,
-                "username": user.username,
-                "seat_number": access_record.seat_number,
-                "is_spectator": access_record.is_spectator,
-                "buy_in_amount": access_record.buy_in_amount,
-                "current_stack": access_record.current_stack,
-                "joined_at": access_record.access_granted_at.isoformat(),
-                "last_activity": access_record.last_activity.isoformat(),
+                **player,
                 "game_status": game_status,
-                "session_duration": (datetime.utcnow() - access_record.access_granted_at).total_seconds(),
+                "session_duration": (datetime.utcnow() - datetime.fromisoformat(player["joined_at"])).total_seconds(),
             }
 
         except Exception as e:
@@ -7,7 +7,10 @@ from flask import current_app
 from ..database import db
 from ..models.table_access import TableAccess
 from ..models.transaction import Transaction
+from ..models.user import User
+from ..services.hand_persistence import hand_persistence_queue
 from ..services.table_manager import TableManager
+from ..services.table_roster_cache import table_roster_cache
 from ..services.user_manager import UserManager
 
 
@@ -198,10 +201,14 @@ class TableAccessManager:
             Tuple of (success, error_message)
         """
         try:
+            # Cash out the stack from the table's last hand, which may still be queued
+            hand_persistence_queue.flush(table_id)
+
             # Get active access record
             access_record = (
                 db.session.query(TableAccess)
                 .filter(TableAccess.table_id == table_id, TableAccess.user_id == user_id, TableAccess.is_active == True)
+                .populate_existing()
                 .first()
             )
 
@@ -252,6 +259,9 @@ class TableAccessManager:
     def get_table_players(table_id: str) -> list[dict[str, Any]]:
         """Get list of active players at a table.
 
+        Served from the in-memory roster cache, which reloads after any
+        change to the table's access records (see table_roster_cache).
+
         Args:
             table_id: ID of table to get players for
 
@@ -259,36 +269,37 @@ class TableAccessManager:
             List of player information dictionaries
         """
         try:
-            access_records = (
-                db.session.query(TableAccess)
-                .filter(TableAccess.table_id == table_id, TableAccess.is_active == True)
-                .order_by(TableAccess.seat_number.asc())
-                .all()
-            )
-
-            players = []
-            for access in access_records:
-                user_manager = UserManager()
-                user = user_manager.get_user_by_id(access.user_id)
-                if user:
-                    player_info = {
-                        "user_id": access.user_id,
-                        "username": user.username,
-                        "seat_number": access.seat_number,
-                        "is_spectator": access.is_spectator,
-                        "buy_in_amount": access.buy_in_amount,
-                        "current_stack": access.current_stack,
-                        "joined_at": access.access_granted_at.isoformat(),
-                        "last_activity": access.last_activity.isoformat(),
-                    }
-                    players.append(player_info)
-
-            return players
+            return table_roster_cache.get(table_id, TableAccessManager._load_table_players)
 
         except Exception as e:
             current_app.logger.error(f"Failed to get table players: {e}")
             return []
 
+    @staticmethod
+    def _load_table_players(table_id: str) -> list[dict[str, Any]]:
+        """Load a table's active players, with their usernames, in one query."""
+        rows = (
+            db.session.query(TableAccess, User.username)
+            .join(User, User.id == TableAccess.user_id)
+            .filter(TableAccess.table_id == table_id, TableAccess.is_active == True, User.is_active == True)
+            .order_by(TableAccess.seat_number.asc())
+            .all()
+        )
+
+        return [
+            {
+                "user_id": access.user_id,
+                "username": username,
+                "seat_number": access.seat_number,
+                "is_spectator": access.is_spectator,
+                "buy_in_amount": access.buy_in_amount,
+                "current_stack": access.current_stack,
+                "joined_at": access.access_granted_at.isoformat(),
+                "last_activity": access.last_activity.isoformat(),
+            }
+            for access, username in rows
+        ]
+
     @staticmethod
     def update_player_stack(user_id: str, table_id: str, new_stack: int) -> bool:
         """Update a player's chip stack.
@@ -375,6 +386,8 @@ class TableAccessManager:
             TableAccess record if found, None otherwise
         """
         try:
+            # Callers read current_stack, which the table's last hand may still have queued
+            hand_persistence_queue.flush(table_id)
             return (
                 db.session.query(TableAccess)
                 .filter(
@@ -383,6 +396,7 @@ class TableAccessManager:
                     TableAccess.is_active == True,
                     TableAccess.is_spectator == False,
                 )
+                .populate_existing()
                 .first()
             )
         except Exception as e:
@@ -509,8 +523,11 @@ class TableAccessManager:
             Number of access records cleaned up
         """
         try:
-            # Get all access records for this table
-            access_records = db.session.query(TableAccess).filter(TableAccess.table_id == table_id).all()
+            # Get all access records for this table, with stacks from any queued hands
+            hand_persistence_queue.flush(table_id)
+            access_records = (
+                db.session.query(TableAccess).filter(TableAccess.table_id == table_id).populate_existing().all()
+            )
 
             cleaned_count = 0
             for record in access_records:
@@ -548,7 +565,10 @@ class TableAccessManager:
             Number of records cleaned up
         """
         try:
-            inactive_records = db.session.query(TableAccess).filter(TableAccess.is_active == True).all()
+            hand_persistence_queue.flush()
+            inactive_records = (
+                db.session.query(TableAccess).filter(TableAccess.is_active == True).populate_existing().all()
+            )
 
             cleaned_count = 0
             for record in inactive_records:
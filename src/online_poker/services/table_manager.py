@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any
 
 from flask import current_app
+from sqlalchemy.orm import selectinload
 
 from generic_poker.config.loader import GameActionType, GameRules
 from generic_poker.config.mixed_game_loader import MixedGameConfig
@@ -454,6 +455,7 @@ class TableManager:
         try:
             tables = (
                 db.session.query(PokerTable)
+                .options(selectinload(PokerTable.access_records))
                 .filter(PokerTable.is_private == False)
                 .order_by(PokerTable.created_at.desc())
                 .all()
@@ -0,0 +1,114 @@
+"""In-memory cache of table rosters.
+
+Every game state broadcast, player action and state request needs the
+table's roster (who sits where, usernames, spectator flags, stacks), which
+otherwise costs a TableAccess query plus a User lookup per player. The roster
+only changes when someone joins, leaves, is kicked, changes seat or has their
+stack synced, so it is cached per table and reloaded after such a change.
+
+Invalidation hangs off the database session rather than each write path:
+any flushed insert, update or delete of a TableAccess row drops its table's
+roster, and a change to a User drops every roster that lists them. Rosters
+touched in a transaction are dropped again when it commits or rolls back, so
+nothing read mid-transaction outlives it.
+
+The cache is per process, like the game sessions it serves; writes made by
+another process (e.g. a maintenance script) show up once the table's roster
+is next invalidated here or after a restart.
+"""
+
+from collections.abc import Callable
+from copy import copy
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..models.table_access import TableAccess
+from ..models.user import User
+
+Roster = list[dict[str, Any]]
+
+
+class TableRosterCache:
+    """Per-table cache of TableAccessManager.get_table_players results."""
+
+    def __init__(self):
+        self._rosters: dict[str, Roster] = {}
+        # Bumped on every invalidation, so a load that raced one isn't stored
+        self._generation = 0
+        self._lock = Lock()
+
+    def get(self, table_id: str, load: Callable[[str], Roster]) -> Roster:
+        """Return the table's roster, loading it on a miss.
+
+        Callers get their own copies of the entries and may modify them.
+        """
+        with self._lock:
+            roster = self._rosters.get(table_id)
+            generation = self._generation
+        if roster is None:
+            roster = load(table_id)
+            with self._lock:
+                if generation == self._generation:
+                    self._rosters[table_id] = roster
+        return [copy(entry) for entry in roster]
+
+    def invalidate(self, table_id: str) -> None:
+        """Drop a table's roster so the next read reloads it."""
+        with self._lock:
+            self._generation += 1
+            self._rosters.pop(table_id, None)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop every roster that lists a user."""
+        with self._lock:
+            self._generation += 1
+            stale = [
+                table_id
+                for table_id, roster in self._rosters.items()
+                if any(entry["user_id"] == user_id for entry in roster)
+            ]
+            for table_id in stale:
+                del self._rosters[table_id]
+
+    def clear(self) -> None:
+        """Drop every cached roster."""
+        with self._lock:
+            self._generation += 1
+            self._rosters.clear()
+
+
+table_roster_cache = TableRosterCache()
+
+# session.info keys for rosters touched in the current transaction. Keyed by
+# cache, since the module can be imported twice (as online_poker.* and as
+# src.online_poker.*) and both copies listen on the same Session class.
+_PENDING_TABLES = f"roster_cache_tables_{id(table_roster_cache)}"
+_PENDING_USERS = f"roster_cache_users_{id(table_roster_cache)}"
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed_rosters(session: Session, flush_context) -> None:
+    tables = session.info.setdefault(_PENDING_TABLES, set())
+    users = session.info.setdefault(_PENDING_USERS, set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, TableAccess):
+            tables.add(instance.table_id)
+        elif isinstance(instance, User):
+            users.add(instance.id)
+    _drop(tables, users)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_soft_rollback")
+def _invalidate_transaction_rosters(session: Session, *args) -> None:
+    _drop(session.info.pop(_PENDING_TABLES, ()), session.info.pop(_PENDING_USERS, ()))
+
+
+def _drop(table_ids, user_ids) -> None:
+    for table_id in table_ids:
+        table_roster_cache.invalidate(table_id)
+    for user_id in user_ids:
+        table_roster_cache.invalidate_user(user_id)
@@ -15,6 +15,9 @@ from ..services.player_session_manager import PlayerSessionManager
 
 logger = logging.getLogger(__name__)
 
+# A delta with more operations than this is sent as a full snapshot instead
+MAX_DELTA_OPS = 64
+
 
 class GameEvent:
     """Event types for real-time communication."""
@@ -22,6 +25,7 @@ class GameEvent:
     PLAYER_JOINED = "player_joined"
     PLAYER_LEFT = "player_left"
     GAME_STATE_UPDATE = "game_state_update"
+    GAME_STATE_DELTA = "game_state_delta"
     PLAYER_ACTION = "player_action"
     HAND_COMPLETE = "hand_complete"
     CHAT_MESSAGE = "chat_message"
@@ -52,6 +56,11 @@ class WebSocketManager:
         # Stud street chat announcements (BACKLOG 8.4): announce each new
         # betting street's up-cards once. Keyed table_id -> (hands_played, step).
         self._last_stud_announce: dict[str, tuple] = {}
+        # Delta-encoded game state, for clients that ask for it when joining a
+        # table room: session_id -> (table_id, version, payload) of the last
+        # state sent, which the next delta is computed against.
+        self.delta_sessions: set[str] = set()
+        self.sent_game_states: dict[str, tuple[str, int, dict[str, Any]]] = {}
 
         # Register event handlers
         self._register_handlers()
@@ -123,6 +132,8 @@ class WebSocketManager:
                     self.user_sessions.pop(user_id, None)
                     self.session_users.pop(session_id, None)
                     self.user_tables.pop(user_id, None)
+                    self.delta_sessions.discard(session_id)
+                    self.sent_game_states.pop(session_id, None)
 
                     logger.info(f"User {user_id} disconnected")
 
@@ -138,14 +149,22 @@ class WebSocketManager:
                     emit("error", {"message": "Table ID required"})
                     return
 
+                from flask import request
+
                 user_id = current_user.id
                 success = self.join_table_room(user_id, table_id)
 
                 if success:
+                    # Clients that can apply game_state_delta opt in here
+                    if data.get("deltas"):
+                        self.delta_sessions.add(request.sid)
+                    else:
+                        self.delta_sessions.discard(request.sid)
+
                     # Send current game state
                     game_state = GameStateManager.generate_game_state_view(table_id, user_id)
                     if game_state:
-                        emit("game_state_update", game_state.to_dict())
+                        self.send_game_state(request.sid, table_id, game_state.to_dict(), full=True)
 
                     emit("table_joined", {"table_id": table_id, "timestamp": datetime.utcnow().isoformat() + "Z"})
                 else:
@@ -363,6 +382,8 @@ class WebSocketManager:
                     emit("error", {"message": "Table ID required"})
                     return
 
+                from flask import request
+
                 user_id = current_user.id
 
                 # Check access
@@ -373,7 +394,10 @@ class WebSocketManager:
                 game_state = GameStateManager.generate_game_state_view(table_id, user_id, is_spectator)
 
                 if game_state:
-                    emit("game_state_update", game_state.to_dict())
+                    # A delta only if the client still holds the state we last sent it
+                    sent = self.sent_game_states.get(request.sid)
+                    resync = not sent or sent[1] != data.get("since_version")
+                    self.send_game_state(request.sid, table_id, game_state.to_dict(), full=resync)
                 # If no game state, silently skip - game may not have started yet
 
             except Exception as e:
@@ -912,6 +936,7 @@ class WebSocketManager:
             leave_room(f"table_{table_id}", sid=session_id)
 
             # Update tracking
+            self.sent_game_states.pop(session_id, None)
             if table_id in self.table_rooms:
                 self.table_rooms[table_id].discard(session_id)
                 if not self.table_rooms[table_id]:
@@ -1073,20 +1098,20 @@ class WebSocketManager:
         """
         try:
             # Get all participants in the table room
-            room_sessions = self.table_rooms.get(table_id, set())
-
-            for session_id in room_sessions:
-                user_id = self.session_users.get(session_id)
-                if user_id:
-                    # Get player info to determine if spectator
-                    player_info = PlayerSessionManager.get_player_info(user_id, table_id)
-                    is_spectator = player_info["is_spectator"] if player_info else True
+            room_users = {
+                session_id: self.session_users.get(session_id) for session_id in self.table_rooms.get(table_id, set())
+            }
 
-                    # Generate personalized game state
-                    game_state = GameStateManager.generate_game_state_view(table_id, user_id, is_spectator)
+            # One shared snapshot for the room, redacted per viewer
+            payloads = GameStateManager.generate_game_state_payloads(
+                table_id, {user_id for user_id in room_users.values() if user_id}
+            )
 
-                    if game_state:
-                        self.socketio.emit(GameEvent.GAME_STATE_UPDATE, game_state.to_dict(), room=session_id)
+            version = GameStateManager.next_state_version(table_id)
+            for session_id, user_id in room_users.items():
+                payload = payloads.get(user_id)
+                if payload:
+                    self.send_game_state(session_id, table_id, payload, version=version)
 
             logger.debug(f"Broadcasted game state update to table {table_id}")
 
@@ -1096,6 +1121,47 @@ class WebSocketManager:
         except Exception as e:
             logger.error(f"Failed to broadcast game state update: {e}")
 
+    def send_game_state(
+        self,
+        session_id: str,
+        table_id: str,
+        payload: dict[str, Any],
+        version: int | None = None,
+        full: bool = False,
+    ) -> None:
+        """Send a game state to one session, as a delta when the client supports it.
+
+        Sessions that opted in to deltas get a game_state_delta against the
+        last state sent to them, unless full is set (join, resync), that state
+        was for another table, or the delta would be too large; nothing is
+        sent if the state is unchanged. Everyone else gets the full
+        game_state_update, stamped with its state_version.
+
+        Args:
+            session_id: Socket.IO session to send to
+            table_id: ID of the table the state belongs to
+            payload: GameStateView.to_dict() output for the session's user
+            version: State version; a new one is assigned if not given
+            full: Whether to send a full snapshot regardless
+        """
+        if version is None:
+            version = GameStateManager.next_state_version(table_id)
+        sent = self.sent_game_states.get(session_id)
+
+        if session_id in self.delta_sessions and not full and sent and sent[0] == table_id:
+            patch = GameStateManager.diff_state_payloads(sent[2], payload)
+            if not patch:
+                # The client's state is already current
+                return
+            if len(patch) <= MAX_DELTA_OPS:
+                self.sent_game_states[session_id] = (table_id, version, payload)
+                delta = {"table_id": table_id, "base_version": sent[1], "version": version, "patch": patch}
+                self.socketio.emit(GameEvent.GAME_STATE_DELTA, delta, room=session_id)
+                return
+
+        self.sent_game_states[session_id] = (table_id, version, payload)
+        self.socketio.emit(GameEvent.GAME_STATE_UPDATE, {**payload, "state_version": version}, room=session_id)
+
     def _maybe_announce_stud_street(self, table_id: str) -> None:
         """Announce the up-cards for a stud street, once, when it begins.
 
@@ -150,7 +150,7 @@ class PokerTable {
             PokerModals.hideLoadingOverlay();
             // Re-join the table room (needed after reconnect)
             if (this.store.tableId) {
-                this.socket.emit('connect_to_table_room', { table_id: this.store.tableId });
+                this.socket.emit('connect_to_table_room', { table_id: this.store.tableId, deltas: true });
             }
         });
 
@@ -245,6 +245,16 @@ class PokerTable {
             this.updateGameState(data);
         });
 
+        this.socket.on('game_state_delta', (data) => {
+            const state = this.store.applyDelta(data);
+            if (state) {
+                this.updateGameState(state);
+            } else {
+                // Missed an update: ask for a full snapshot
+                this.socket.emit('request_game_state', { table_id: this.store.tableId });
+            }
+        });
+
         this.socket.on('variant_changed', (data) => {
             const mixed = data.mixed_game;
             if (mixed) {
@@ -300,7 +310,7 @@ class PokerTable {
     // Touch/responsive methods delegated to this.responsive (PokerResponsive)
 
     connectToTable() {
-        this.socket.emit('connect_to_table_room', { table_id: this.store.tableId });
+        this.socket.emit('connect_to_table_room', { table_id: this.store.tableId, deltas: true });
 
         // Start periodic game state updates
         this.startGameUpdateTimer();
@@ -422,10 +432,18 @@ class PokerTable {
     startGameUpdateTimer() {
         // Request game updates every 5 seconds to handle bot actions
         this.gameUpdateInterval = setInterval(() => {
-            this.socket.emit('request_game_state', { table_id: this.store.tableId });
+            this.requestGameState();
         }, 5000);
     }
 
+    requestGameState() {
+        // The server answers with a delta against our version when it can
+        this.socket.emit('request_game_state', {
+            table_id: this.store.tableId,
+            since_version: this.store.stateVersion
+        });
+    }
+
     stopGameUpdateTimer() {
         if (this.gameUpdateInterval) {
             clearInterval(this.gameUpdateInterval);
@@ -1746,7 +1764,7 @@ class PokerTable {
             timestamp: new Date().toISOString()
         });
         // Request game state update to refresh player list
-        this.socket.emit('request_game_state', { table_id: this.store.tableId });
+        this.requestGameState();
     }
 
     handlePlayerLeft(data) {
@@ -1758,7 +1776,7 @@ class PokerTable {
             timestamp: new Date().toISOString()
         });
         // Request game state update to refresh player list
-        this.socket.emit('request_game_state', { table_id: this.store.tableId });
+        this.requestGameState();
     }
 
     handlePlayerLeaving(data) {
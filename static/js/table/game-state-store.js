@@ -2,6 +2,7 @@
 class GameStateStore {
     constructor() {
         this.gameState = null;     // Raw server data
+        this.stateVersion = null;  // Server state version of gameState
         this.currentUser = null;
         this.players = {};
         this.isMyTurn = false;
@@ -13,6 +14,7 @@ class GameStateStore {
 
     update(data) {
         this.gameState = data;
+        this.stateVersion = data.state_version ?? null;
         this.currentUser = data.current_user;
 
         // Convert players array to seat-indexed object for proper rendering
@@ -34,6 +36,28 @@ class GameStateStore {
         this.handNumber = data.hand_number != null ? data.hand_number : this.handNumber;
     }
 
+    // Apply a game_state_delta (JSON-patch-style operations) to the current
+    // state. Returns the new state, or null if the delta was computed against
+    // a version we don't hold and a full snapshot is needed.
+    applyDelta(delta) {
+        if (!this.gameState || this.stateVersion === null || delta.base_version !== this.stateVersion) {
+            return null;
+        }
+        const state = structuredClone(this.gameState);
+        for (const op of delta.patch) {
+            const keys = op.path.split('/').slice(1).map(k => k.replace(/~1/g, '/').replace(/~0/g, '~'));
+            const last = keys.pop();
+            const target = keys.reduce((node, key) => node[key], state);
+            if (op.op === 'remove') {
+                delete target[last];
+            } else {
+                target[last] = op.value;
+            }
+        }
+        state.state_version = delta.version;
+        return state;
+    }
+
     findPlayerByUserId(userId) {
         const key = Object.keys(this.players).find(k => this.players[k].user_id === userId);
         return key ? this.players[key] : null;
@@ -402,3 +402,23 @@ def test_raise_and_calls(test_hands):
     # Others should have lost their bets
     assert game.table.players["SB"].stack == initial_stacks["SB"] - 20
     assert game.table.players["BB"].stack == initial_stacks["BB"] - 20
+
+
+def test_voluntary_action_tracking(test_hands):
+    """Bets/raises and voluntary chips are tracked per hand; blinds are not voluntary."""
+    game = create_test_game(test_hands)
+    game.start_hand()
+    game._next_step()  # Deal Hole Cards
+    game._next_step()  # Initial Bet
+    assert game.betting.hand_voluntary == {}
+
+    assert game.player_action("BTN", PlayerAction.RAISE, 20).success
+    assert game.player_action("SB", PlayerAction.CALL, 20).success
+    assert game.player_action("BB", PlayerAction.CALL, 20).success
+
+    assert game.betting.hand_aggression == {"BTN": 1}
+    assert game.betting.hand_voluntary == {"BTN": 20, "SB": 15, "BB": 10}
+
+    game.betting.new_hand()
+    assert game.betting.hand_aggression == {}
+    assert game.betting.hand_voluntary == {}
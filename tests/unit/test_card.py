@@ -1,7 +1,7 @@
 """Tests for card module."""
 import pytest
 from generic_poker.core.card import (
-    Card, Rank, Suit, Visibility, WildType
+    Card, Rank, Suit, Visibility, WildType, card_to_code, cards_to_codes, code_to_card
 )
 
 
@@ -309,3 +309,23 @@ class TestDeckJokerCount:
         jokers = [c for c in deck.cards if c.rank == Rank.JOKER]
         assert len(jokers) == 0
 
+
+
+def test_card_code_round_trip():
+    """Integer card codes decode back to the same rank and suit."""
+    from generic_poker.core.deck import Deck
+    deck = Deck(include_jokers=1)
+    codes = cards_to_codes(deck.cards)
+    assert len(set(codes)) == len(deck.cards)
+    for card, code in zip(deck.cards, codes, strict=True):
+        assert code == card_to_code(card)
+        assert code_to_card(code) == card
+
+
+def test_card_code_ignores_wild_status():
+    """Codes describe rank and suit only; decoded cards are natural."""
+    card = Card(Rank.TWO, Suit.CLUBS)
+    card.make_wild(WildType.NAMED)
+    decoded = code_to_card(card_to_code(card))
+    assert decoded == card
+    assert not decoded.is_wild
@@ -221,6 +221,7 @@ class TestDisconnectManager:
         
         # Mock WebSocket manager
         mock_ws_manager = MagicMock()
+        mock_ws_manager.user_sessions = {user_id: "session789"}
         mock_get_ws.return_value = mock_ws_manager
         
         with patch.object(disconnected_player, 'cancel_timers') as mock_cancel:
@@ -242,7 +243,9 @@ class TestDisconnectManager:
             
             # Verify WebSocket notifications
             mock_ws_manager.broadcast_to_table.assert_called()
-            mock_ws_manager.send_to_user.assert_called()
+            mock_ws_manager.send_game_state.assert_called_once_with(
+                "session789", table_id, {"game": "state"}, full=True
+            )
     
     def test_handle_player_reconnect_not_disconnected(self, disconnect_manager):
         """Test reconnect for player who wasn't disconnected."""
@@ -0,0 +1,94 @@
+"""Tests for the showdown equity calculator."""
+
+from pathlib import Path
+
+import pytest
+
+from generic_poker.analysis import UnsupportedForEquity, calculate_equity
+from generic_poker.config.loader import GameRules
+from generic_poker.core.card import Card
+
+CONFIG_DIR = Path(__file__).parent.parent.parent / "data" / "game_configs"
+
+
+def cards(*strs):
+    return [Card.from_string(s) for s in strs]
+
+
+def rules(name):
+    return GameRules.from_file(CONFIG_DIR / f"{name}.json")
+
+
+def test_river_is_exact():
+    result = calculate_equity(
+        rules("hold_em"),
+        {"p1": cards("As", "Ks"), "p2": cards("2h", "2d")},
+        community=cards("Qs", "Js", "Ts", "2c", "3d"),
+    )
+    assert result.exhaustive
+    assert result.trials == 1
+    assert result.players["p1"].scoop == 1.0
+    assert result.players["p2"].equity == 0.0
+
+
+def test_turn_enumerates_every_river():
+    result = calculate_equity(
+        rules("hold_em"),
+        {"p1": cards("Ah", "Kh"), "p2": cards("Qc", "Qd")},
+        community=cards("2h", "7h", "9s", "3c"),
+    )
+    assert result.exhaustive
+    assert result.trials == 44
+    # 9 hearts, 3 aces and 3 kings give p1 the pot
+    assert result.players["p1"].win == pytest.approx(15 / 44)
+    assert result.players["p1"].equity + result.players["p2"].equity == pytest.approx(1.0)
+
+
+def test_chop_counts_as_tie():
+    result = calculate_equity(
+        rules("hold_em"),
+        {"p1": cards("2c", "3d"), "p2": cards("2h", "3s")},
+        community=cards("As", "Ks", "Qh", "Jd", "Tc"),
+    )
+    assert result.players["p1"].tie == 1.0
+    assert result.players["p1"].win == 0.0
+    assert result.players["p1"].equity == pytest.approx(0.5)
+
+
+def test_preflop_samples_in_process():
+    result = calculate_equity(
+        rules("hold_em"), {"p1": cards("As", "Ah"), "p2": cards("7s", "2h")}, samples=2000, workers=1, seed=7
+    )
+    assert not result.exhaustive
+    assert result.trials == 2000
+    assert 0.82 <= result.players["p1"].equity <= 0.92  # true value ~0.87
+
+
+def test_sampling_is_reproducible_across_workers():
+    kwargs = {"samples": 400, "workers": 2, "seed": 3}
+    hands = {"p1": cards("As", "Ah"), "p2": cards("Kd", "Kc")}
+    first = calculate_equity(rules("hold_em"), hands, **kwargs)
+    second = calculate_equity(rules("hold_em"), hands, **kwargs)
+    assert first.trials == 400
+    assert first.players == second.players
+
+
+def test_dead_cards_leave_the_deck():
+    # With every other ace and king dead, p2 can't catch up on the river
+    result = calculate_equity(
+        rules("hold_em"),
+        {"p1": cards("Qc", "Qd"), "p2": cards("Ah", "Kh")},
+        community=cards("2h", "7c", "9s", "3c"),
+        dead=cards("As", "Ad", "Ac", "Ks", "Kd", "Kc") + [Card.from_string(f"{r}h") for r in "345689TJQ"],
+    )
+    assert result.players["p1"].scoop == 1.0
+
+
+def test_duplicate_cards_rejected():
+    with pytest.raises(ValueError):
+        calculate_equity(rules("hold_em"), {"p1": cards("As", "Ks"), "p2": cards("As", "2d")})
+
+
+def test_draw_games_unsupported():
+    with pytest.raises(UnsupportedForEquity):
+        calculate_equity(rules("5_card_draw"), {"p1": cards("As"), "p2": []})
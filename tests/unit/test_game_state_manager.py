@@ -203,6 +203,74 @@ class TestGameStateManager:
         assert game_state.is_spectator is True
         assert len(game_state.valid_actions) == 0  # Spectators can't act
     
+    @patch('online_poker.services.game_state_manager.game_orchestrator.get_session')
+    @patch('online_poker.services.game_state_manager.TableAccessManager.get_table_players')
+    def test_generate_game_state_payloads_shares_base_view(self, mock_get_players, mock_get_session,
+                                                           app_context, mock_game_session):
+        """Test one roster query and one shared snapshot, with each seat's own cards revealed."""
+        mock_get_session.return_value = mock_game_session
+        mock_get_players.return_value = [
+            {'user_id': 'user1', 'username': 'Alice', 'seat_number': 1, 'is_spectator': False, 'current_stack': 500},
+            {'user_id': 'user2', 'username': 'Bob', 'seat_number': 2, 'is_spectator': False, 'current_stack': 300},
+            {'user_id': 'spectator1', 'username': 'Carol', 'seat_number': None, 'is_spectator': True,
+             'current_stack': None},
+        ]
+        hole_cards = {'user1': ['As', 'Ks'], 'user2': ['7d', '2c']}
+
+        def cards_for(session, user_id, viewer_id, is_spectator):
+            return hole_cards[user_id] if user_id == viewer_id and not is_spectator else []
+
+        with patch.object(GameStateManager, '_get_player_cards_with_visibility', side_effect=cards_for):
+            payloads = GameStateManager.generate_game_state_payloads(
+                "table1", ["user1", "user2", "spectator1", "lurker"]
+            )
+
+        mock_get_players.assert_called_once_with("table1")
+        assert set(payloads) == {"user1", "user2", "spectator1", "lurker"}
+
+        def cards_seen(payload):
+            return {p['user_id']: p['cards'] for p in payload['players']}
+
+        assert cards_seen(payloads['user1']) == {'user1': ['As', 'Ks'], 'user2': []}
+        assert cards_seen(payloads['user2']) == {'user1': [], 'user2': ['7d', '2c']}
+        assert payloads['user1']['current_user'] == {'id': 'user1', 'username': 'Alice'}
+        assert payloads['user1']['is_spectator'] is False
+
+        # Spectators and unseated viewers share one serialized snapshot
+        assert cards_seen(payloads['spectator1']) == {'user1': [], 'user2': []}
+        assert payloads['spectator1']['is_spectator'] is True
+        assert payloads['spectator1']['viewer_id'] == 'spectator1'
+        assert payloads['lurker']['current_user'] == {'id': 'lurker', 'username': None}
+        assert payloads['spectator1']['players'] is payloads['lurker']['players']
+
+    @patch('online_poker.services.game_state_manager.game_orchestrator.get_session')
+    @patch('online_poker.services.game_state_manager.TableAccessManager.get_table_players')
+    def test_generate_game_state_payloads_matches_single_views(self, mock_get_players, mock_get_session,
+                                                              app_context, mock_game_session):
+        """Test payloads match what generate_game_state_view gives each viewer."""
+        mock_get_session.return_value = mock_game_session
+        mock_get_players.return_value = [
+            {'user_id': 'user1', 'username': 'Alice', 'seat_number': 1, 'is_spectator': False, 'current_stack': 500},
+        ]
+
+        payloads = GameStateManager.generate_game_state_payloads("table1", ["user1", "spectator1"])
+        seated = GameStateManager.generate_game_state_view("table1", "user1", False).to_dict()
+        spectator = GameStateManager.generate_game_state_view("table1", "spectator1", True).to_dict()
+
+        for payload, view in ((payloads['user1'], seated), (payloads['spectator1'], spectator)):
+            payload.pop('timestamp')
+            view.pop('timestamp')
+            assert payload == view
+
+    @patch('online_poker.services.game_state_manager.game_orchestrator.get_session')
+    @patch('online_poker.services.game_state_manager.TableAccessManager.get_table_players')
+    def test_generate_game_state_payloads_no_players(self, mock_get_players, mock_get_session, app_context):
+        """Test no payloads when the table has no players."""
+        mock_get_session.return_value = None
+        mock_get_players.return_value = []
+
+        assert GameStateManager.generate_game_state_payloads("table1", ["user1"]) == {}
+
     def test_create_player_view(self, app_context, mock_game_session):
         """Test creating a player view."""
         player_info = {
@@ -602,4 +670,37 @@ class TestGameStateManager:
         pot_changes = [c for c in changes if c.update_type == "pot_change"]
         assert len(pot_changes) == 1
         assert pot_changes[0].data["old_pot"] == 100
-        assert pot_changes[0].data["new_pot"] == 150
\ No newline at end of file
+        assert pot_changes[0].data["new_pot"] == 150
+
+    def test_next_state_version_increases_per_table(self):
+        """Test state versions are monotonic and independent per table."""
+        first = GameStateManager.next_state_version("version-table-a")
+        assert GameStateManager.next_state_version("version-table-a") == first + 1
+        assert GameStateManager.next_state_version("version-table-b") == 1
+
+    def test_diff_state_payloads(self):
+        """Test nested changes become JSON-patch-style operations."""
+        old = {
+            "pot_info": {"total_pot": 10},
+            "players": [{"user_id": "u1", "cards": ["As", None]}, {"user_id": "u2", "cards": []}],
+            "valid_actions": [{"action_type": "check"}],
+            "last/action": "bet",
+        }
+        new = {
+            "pot_info": {"total_pot": 30},
+            "players": [{"user_id": "u1", "cards": ["As", "Kd"]}, {"user_id": "u2", "cards": ["2c"]}],
+            "valid_actions": [],
+            "hand_history": [],
+        }
+
+        patch = GameStateManager.diff_state_payloads(old, new)
+
+        assert patch == [
+            {"op": "replace", "path": "/pot_info/total_pot", "value": 30},
+            {"op": "replace", "path": "/players/0/cards/1", "value": "Kd"},
+            {"op": "replace", "path": "/players/1/cards", "value": ["2c"]},
+            {"op": "replace", "path": "/valid_actions", "value": []},
+            {"op": "add", "path": "/hand_history", "value": []},
+            {"op": "remove", "path": "/last~1action"},
+        ]
+        assert GameStateManager.diff_state_payloads(new, dict(new)) == []
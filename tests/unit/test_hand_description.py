@@ -271,6 +271,28 @@ def test_a5_description():
     assert describer.describe_hand(cards) == "High Card"
     assert describer.describe_hand_detailed(cards) == "King High"
 
+def test_describer_registry_and_memo():
+    """for_type shares one describer per type, and repeat hands reuse the memoised result."""
+    describer = HandDescriber.for_type(EvaluationType.HIGH)
+    assert HandDescriber.for_type(EvaluationType.HIGH) is describer
+
+    cards = [
+        Card(Rank.ACE, Suit.HEARTS),
+        Card(Rank.ACE, Suit.DIAMONDS),
+        Card(Rank.KING, Suit.CLUBS),
+        Card(Rank.QUEEN, Suit.SPADES),
+        Card(Rank.JACK, Suit.HEARTS)
+    ]
+    assert describer.describe_hand(cards) == "One Pair"
+    memo_size = len(describer._memo)
+    # Card order does not matter for the basic description
+    assert describer.describe_hand(list(reversed(cards))) == "One Pair"
+    assert len(describer._memo) == memo_size
+
+    # Describers for types sharing a description file share the parsed table
+    HandDescriber.for_type(EvaluationType.QUICK_QUADS)._get_description(1)
+    assert HandDescriber.for_type(EvaluationType.QUICK_QUADS)._description_table is describer._description_table
+
 # don't have the evaluators for these yet 
 
 # def test_pip_hand_description():
@@ -0,0 +1,246 @@
+"""Unit tests for compact hand history storage and bulk export."""
+
+import json
+import zlib
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+from src.online_poker.database import db
+from src.online_poker.models.game_history import GameHistory, GameHistoryPlayer
+from src.online_poker.models.hand_encoding import HandEncodingError, decode_hand, encode_hand
+from src.online_poker.models.table import PokerTable
+from src.online_poker.services.hand_history_service import HandHistoryService
+
+from generic_poker.game.betting import BettingStructure
+
+ALICE = "11111111-1111-1111-1111-111111111111"
+BOB = "22222222-2222-2222-2222-222222222222"
+
+PLAYERS = [
+    {"user_id": ALICE, "username": "alice", "stack": 140, "position": "BTN"},
+    {"user_id": BOB, "username": "bob", "stack": 60, "position": "BB"},
+]
+ACTIONS = [
+    {"user_id": ALICE, "action": "raise", "amount": 6, "timestamp": "2026-03-01T12:00:00.123456"},
+    {"user_id": BOB, "action": "call", "amount": 6, "timestamp": "2026-03-01T12:00:02.5"},
+    {"user_id": BOB, "action": "check", "amount": None, "timestamp": "2026-03-01T12:00:05"},
+    {"user_id": ALICE, "action": "bet", "amount": 40, "timestamp": "2026-03-01T12:00:07.000010"},
+    {"user_id": BOB, "action": "fold", "amount": 0, "timestamp": "2026-03-01T12:00:09.250000"},
+]
+RESULTS = {
+    "is_complete": True,
+    "total_pot": 52,
+    "pots": [{"amount": 52, "winners": [ALICE], "split": False, "eligible_players": [ALICE, BOB]}],
+    "hands": {
+        ALICE: [
+            {
+                "cards": ["As", "Kd"],
+                "community_cards": ["Th", "9c", "2s"],
+                "used_hole_cards": [],
+                "hand_name": "High Card",
+            }
+        ],
+    },
+    "winning_hands": [{"player_id": ALICE, "cards": ["As", "Kd", "Th", "9c", "2s"]}],
+    "player_hole_cards": {ALICE: ["As", "Kd"], BOB: ["7h", "*j"]},
+    "winners": [ALICE],
+}
+STAKES = {"small_blind": 1, "big_blind": 2}
+
+
+def roundtrip(players=PLAYERS, actions=ACTIONS, results=RESULTS, stakes=STAKES):
+    return decode_hand(encode_hand(players, actions, results, stakes))
+
+
+class TestHandEncoding:
+    """Test the compact hand payload."""
+
+    def test_roundtrip_and_size(self):
+        """Test a hand decodes to its input and is much smaller than its JSON."""
+        hand = roundtrip()
+        assert hand == {"players": PLAYERS, "actions": ACTIONS, "results": RESULTS, "stakes": STAKES}
+
+        legacy = sum(len(json.dumps(part)) for part in (PLAYERS, ACTIONS, RESULTS, STAKES))
+        assert len(encode_hand(PLAYERS, ACTIONS, RESULTS, STAKES)) < legacy / 2
+
+    @pytest.mark.parametrize(
+        "odd_action",
+        [
+            {"user_id": ALICE, "action": "shove", "amount": 1, "timestamp": "2026-03-01T12:00:00"},
+            {"user_id": "spectator", "action": "call", "amount": 1, "timestamp": "2026-03-01T12:00:00"},
+            {"user_id": ALICE, "action": "call", "amount": 1, "timestamp": "2026-03-01T12:00:00Z"},
+            {"user_id": ALICE, "action": "call", "amount": 1.5, "timestamp": "2026-03-01T12:00:00"},
+            {"user_id": ALICE, "action": "call", "amount": 1, "timestamp": "2026-03-01T12:00:00", "note": "x"},
+        ],
+    )
+    def test_actions_outside_the_columns_are_kept_as_json(self, odd_action):
+        """Test actions the binary columns can't hold come back unchanged."""
+        actions = [*ACTIONS, odd_action]
+        assert roundtrip(actions=actions)["actions"] == actions
+
+    def test_empty_hand(self):
+        """Test a hand with no actions or cards."""
+        assert roundtrip(players=[], actions=[], results={}, stakes={}) == {
+            "players": [],
+            "actions": [],
+            "results": {},
+            "stakes": {},
+        }
+
+    @pytest.mark.parametrize(
+        "odd_cards",
+        [0, 3, "As", None, {"$cards": [0]}, {"$cards": 0, "note": "x"}, [["As"]]],
+    )
+    def test_non_list_card_values_roundtrip(self, odd_cards):
+        """Test values under card-list keys that are not card lists come back unchanged."""
+        results = {
+            "hands": {ALICE: [{"cards": odd_cards, "community_cards": ["Th"]}]},
+            "player_hole_cards": {ALICE: odd_cards, BOB: ["7h"]},
+        }
+        assert roundtrip(results=results)["results"] == results
+
+    def test_refuses_values_that_look_like_card_references(self):
+        """Test a value the decoder would read as a card list reference is not encoded."""
+        with pytest.raises(ValueError):
+            encode_hand(PLAYERS, [], {"hands": {ALICE: [{"cards": {"$cards": 0}}]}}, {})
+
+    def test_decodes_version_1_payloads(self):
+        """Test payloads written before card references were marked still decode."""
+        document = {"players": [], "stakes": {}, "results": {"cards": 0, "player_hole_cards": {ALICE: 1}}}
+        body = json.dumps(document).encode()
+        # No actions; two card lists: [As, Kd] and [7h]
+        data = b"HH\x01\x00\x02\x02\x33\x2d\x01\x16" + bytes([len(body)]) + body
+        assert decode_hand(zlib.compress(data))["results"] == {
+            "cards": ["As", "Kd"],
+            "player_hole_cards": {ALICE: ["7h"]},
+        }
+
+    def test_rejects_foreign_payloads(self):
+        """Test garbage and legacy JSON are not mistaken for hands."""
+        with pytest.raises(HandEncodingError):
+            decode_hand(b'{"players": []}')
+
+
+@pytest.fixture
+def app():
+    """Create test Flask app."""
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+
+    with app.app_context():
+        db.init_app(app)
+        db.create_all()
+        yield app
+        db.drop_all()
+
+
+@pytest.fixture
+def tables(app):
+    """Two tables created by a test user."""
+    from src.online_poker.services.user_manager import UserManager
+
+    creator = UserManager.create_user("creator", "creator@example.com", "password123", 1000)
+    tables = []
+    for name in ("Table A", "Table B"):
+        table = PokerTable(
+            name=name,
+            variant="hold_em",
+            betting_structure=BettingStructure.NO_LIMIT.value,
+            stakes=STAKES,
+            max_players=6,
+            creator_id=creator.id,
+            is_private=False,
+        )
+        db.session.add(table)
+        tables.append(table)
+    db.session.commit()
+    return tables
+
+
+def add_hand(table, hand_number, completed_at, players=PLAYERS):
+    hand = GameHistory(table.id, hand_number, players, ACTIONS, RESULTS, "hold_em", "No Limit", STAKES)
+    hand.completed_at = completed_at
+    for participant in hand.participants:
+        participant.completed_at = completed_at
+    db.session.add(hand)
+    return hand
+
+
+class TestHandHistoryStorage:
+    """Test GameHistory storage, per-player lookup and export."""
+
+    def test_hand_is_stored_as_payload_with_player_index(self, tables):
+        """Test new hands fill the payload, not the legacy JSON columns."""
+        add_hand(tables[0], 1, datetime(2026, 3, 1))
+        db.session.commit()
+        db.session.expunge_all()
+
+        hand = db.session.query(GameHistory).one()
+        assert hand.players is None and hand.results is None
+        assert hand.get_actions() == ACTIONS
+        assert hand.to_dict()["winners"] == [ALICE]
+        assert hand.was_player_involved(BOB)
+        assert {p.user_id for p in hand.participants} == {ALICE, BOB}
+        assert HandHistoryService.count_player_hands(BOB) == 1
+
+    def test_legacy_rows_are_read_and_compacted(self, tables):
+        """Test rows written as JSON text still read, and compact into payloads."""
+        legacy = add_hand(tables[0], 1, datetime(2026, 3, 1))
+        legacy.payload = None
+        legacy.participants = []
+        legacy.players, legacy.actions = json.dumps(PLAYERS), json.dumps(ACTIONS)
+        legacy.results, legacy.stakes = json.dumps(RESULTS), json.dumps(STAKES)
+        db.session.commit()
+        db.session.expunge_all()
+        assert db.session.query(GameHistory).one().get_results() == RESULTS
+        assert HandHistoryService.count_player_hands(ALICE) == 0
+
+        assert HandHistoryService.compact_legacy_hands() == (1, 0)
+
+        hand = db.session.query(GameHistory).one()
+        assert hand.payload is not None and hand.players is None
+        assert hand.get_results() == RESULTS
+        assert HandHistoryService.count_player_hands(ALICE) == 1
+
+    def test_iter_hands_pages_in_completion_order(self, tables):
+        """Test keyset paging returns every hand once, oldest first, across batches."""
+        start = datetime(2026, 3, 1)
+        for i in range(7):
+            # Hands 2 and 3 share a timestamp, so paging must break ties by id
+            add_hand(tables[i % 2], i, start + timedelta(minutes=min(i, 2) if i < 4 else i))
+        db.session.commit()
+
+        hands = list(HandHistoryService.iter_hands(batch_size=2))
+        assert sorted(h.hand_number for h in hands) == list(range(7))
+        assert [h.completed_at for h in hands] == sorted(h.completed_at for h in hands)
+
+        at_a = [h.hand_number for h in HandHistoryService.iter_hands(table_id=tables[0].id, batch_size=2)]
+        assert sorted(at_a) == [0, 2, 4, 6]
+        recent = HandHistoryService.iter_hands(since=start + timedelta(minutes=4), until=start + timedelta(minutes=6))
+        assert [h.hand_number for h in recent] == [4, 5]
+
+    def test_iter_hands_by_player(self, tables):
+        """Test per-player export uses the player index."""
+        add_hand(tables[0], 1, datetime(2026, 3, 1))
+        add_hand(tables[1], 2, datetime(2026, 3, 2), players=PLAYERS[:1] + [dict(PLAYERS[1], user_id="bot_3")])
+        db.session.commit()
+
+        assert [h.hand_number for h in HandHistoryService.iter_hands(user_id=ALICE, batch_size=1)] == [1, 2]
+        assert [h.hand_number for h in HandHistoryService.iter_hands(user_id=BOB)] == [1]
+        assert db.session.query(GameHistoryPlayer).filter_by(user_id="bot_3").count() == 1
+
+    def test_export_ndjson(self, tables):
+        """Test the export writes one JSON document per line."""
+        add_hand(tables[0], 1, datetime(2026, 3, 1))
+        add_hand(tables[1], 2, datetime(2026, 3, 2))
+        db.session.commit()
+
+        lines = list(HandHistoryService.export_ndjson(batch_size=1))
+        assert all(line.endswith("\n") for line in lines)
+        exported = [json.loads(line) for line in lines]
+        assert [hand["hand_number"] for hand in exported] == [1, 2]
+        assert exported[0]["actions"] == ACTIONS
+        assert exported[1]["table_id"] == tables[1].id
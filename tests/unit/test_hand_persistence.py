@@ -0,0 +1,171 @@
+"""Unit tests for the background hand persistence queue."""
+
+import pytest
+from flask import Flask
+from sqlalchemy.pool import StaticPool
+from src.online_poker.database import db
+from src.online_poker.models.game_history import GameHistory
+from src.online_poker.models.game_session_state import GameSessionState
+from src.online_poker.models.table import PokerTable
+from src.online_poker.models.table_access import TableAccess
+from src.online_poker.models.user import User
+from src.online_poker.services.hand_persistence import HandPersistenceQueue, HandRecord, hand_persistence_queue
+from src.online_poker.services.table_access_manager import TableAccessManager
+from src.online_poker.services.table_roster_cache import table_roster_cache
+
+from generic_poker.game.betting import BettingStructure
+
+
+@pytest.fixture
+def app():
+    """Create test Flask app whose in-memory database the worker thread can share."""
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "connect_args": {"check_same_thread": False},
+        "poolclass": StaticPool,
+    }
+
+    with app.app_context():
+        db.init_app(app)
+        db.create_all()
+        yield app
+        db.drop_all()
+    table_roster_cache.clear()
+
+
+@pytest.fixture
+def queue(app):
+    """A queue writing in the background, drained after the test."""
+    queue = HandPersistenceQueue()
+    queue.configure(app)
+    yield queue
+    queue.shutdown()
+
+
+@pytest.fixture
+def test_user(app):
+    from src.online_poker.services.user_manager import UserManager
+
+    return UserManager.create_user("testuser", "test@example.com", "password123", 1000)
+
+
+@pytest.fixture
+def test_table(app, test_user):
+    """Create a test table with the test user seated for 100."""
+    table = PokerTable(
+        name="History Table",
+        variant="hold_em",
+        betting_structure=BettingStructure.NO_LIMIT.value,
+        stakes={"small_blind": 1, "big_blind": 2},
+        max_players=6,
+        creator_id=test_user.id,
+        is_private=False,
+    )
+    db.session.add(table)
+    db.session.commit()
+    db.session.add(TableAccess(table.id, test_user.id, seat_number=1, buy_in_amount=100))
+    db.session.commit()
+    return table
+
+
+def make_record(table, user, hand_number, stack, **overrides):
+    fields = dict(
+        table_id=table.id,
+        hand_number=hand_number,
+        players=[{"user_id": user.id, "username": "stale", "stack": stack, "position": "BTN"}],
+        actions=[{"user_id": user.id, "action": "call", "amount": 2}],
+        results={"total_pot": 4, "winners": [user.id]},
+        variant="hold_em",
+        betting_structure="No Limit",
+        stakes={"small_blind": 1, "big_blind": 2},
+        session_id="session-1",
+        dealer_seat=hand_number % 6 + 1,
+        hands_played=hand_number,
+        stacks={user.id: stack},
+    )
+    fields.update(overrides)
+    return HandRecord(**fields)
+
+
+def stored_stack(table, user):
+    db.session.expire_all()
+    return db.session.query(TableAccess).filter_by(table_id=table.id, user_id=user.id).one().current_stack
+
+
+class TestHandPersistenceQueue:
+    """Test batching, ordering and flushing of completed hands."""
+
+    def test_unconfigured_queue_writes_inline(self, app, test_user, test_table):
+        """Test the global queue writes immediately until the app enables the worker."""
+        assert not hand_persistence_queue.is_async
+        hand_persistence_queue.submit(make_record(test_table, test_user, 1, 150))
+
+        history = db.session.query(GameHistory).one()
+        assert history.get_players()[0]["username"] == "testuser"
+        assert history.get_winner_ids() == [test_user.id]
+        state = db.session.query(GameSessionState).one()
+        assert (state.hands_played, state.dealer_seat, state.is_active) == (1, 2, True)
+        assert stored_stack(test_table, test_user) == 150
+
+    def test_hands_written_in_order_after_flush(self, queue, test_user, test_table):
+        """Test a table's queued hands land in submission order, latest state and stack winning."""
+        for hand_number, stack in [(1, 120), (2, 90), (3, 130)]:
+            queue.submit(make_record(test_table, test_user, hand_number, stack))
+
+        assert queue.flush(test_table.id)
+        assert queue.pending_count() == 0
+        db.session.expire_all()
+        hands = [h.hand_number for h in db.session.query(GameHistory).order_by(GameHistory.id)]
+        assert sorted(hands) == [1, 2, 3]
+        assert db.session.query(GameSessionState).one().hands_played == 3
+        assert stored_stack(test_table, test_user) == 130
+
+    def test_mixed_game_rotation_is_saved(self, queue, test_user, test_table):
+        """Test mixed game rotation state is part of the upsert."""
+        queue.submit(make_record(test_table, test_user, 1, 100, rotation=(2, 3, 6)))
+        queue.flush(test_table.id)
+
+        db.session.expire_all()
+        state = db.session.query(GameSessionState).one()
+        assert (state.current_variant_index, state.hands_in_current_variant, state.orbit_size) == (2, 3, 6)
+
+    def test_failed_hand_does_not_lose_the_batch(self, app, test_user, test_table):
+        """Test a hand that cannot be written is dropped without its batch-mates."""
+        queue = HandPersistenceQueue()
+        queue.configure(app)
+        with queue._condition:  # hold the worker so all three go in one batch
+            queue.submit(make_record(test_table, test_user, 1, 110))
+            queue.submit(make_record(test_table, test_user, 2, 0, results={"bad": object()}))
+            queue.submit(make_record(test_table, test_user, 3, 140))
+        queue.shutdown()
+
+        db.session.expire_all()
+        assert sorted(h.hand_number for h in db.session.query(GameHistory)) == [1, 3]
+        assert stored_stack(test_table, test_user) == 140
+
+    def test_leave_table_cashes_out_queued_stack(self, queue, monkeypatch, test_user, test_table):
+        """Test leaving waits for the table's queued hands before cashing out."""
+        monkeypatch.setattr("src.online_poker.services.table_access_manager.hand_persistence_queue", queue)
+        queue.submit(make_record(test_table, test_user, 1, 175))
+
+        success, _ = TableAccessManager.leave_table(test_user.id, test_table.id)
+
+        assert success
+        assert db.session.get(User, test_user.id).bankroll == 1000 + 175  # not the 100 bought in
+
+    def test_shutdown_drains_queue(self, app, test_user, test_table):
+        """Test shutdown writes everything queued and a later submit restarts the worker."""
+        queue = HandPersistenceQueue()
+        queue.configure(app)
+        queue.submit(make_record(test_table, test_user, 1, 80))
+        queue.shutdown()
+        assert queue.pending_count() == 0
+        assert db.session.query(GameHistory).count() == 1
+
+        queue.submit(make_record(test_table, test_user, 2, 60))
+        assert queue.flush()
+        assert stored_stack(test_table, test_user) == 60
+        queue.shutdown()
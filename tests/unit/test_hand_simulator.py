@@ -0,0 +1,86 @@
+"""Tests for the headless hand simulator."""
+
+from pathlib import Path
+
+import pytest
+
+from generic_poker.config.loader import BettingStructure, GameRules
+from generic_poker.game.game import Game
+from generic_poker.game.pot import ActivePot
+from generic_poker.sim import HandSimulator, PassivePolicy, RandomPolicy
+
+CONFIG_DIR = Path(__file__).parent.parent.parent / "data" / "game_configs"
+
+
+def rules(name):
+    return GameRules.from_file(CONFIG_DIR / f"{name}.json")
+
+
+@pytest.mark.parametrize("variant", ["hold_em", "omaha_8", "7_card_stud", "27_triple_draw"])
+def test_hands_complete_and_chips_are_conserved(variant):
+    sim = HandSimulator(rules(variant), num_players=3, seed=7)
+    stats = sim.run(30)
+
+    assert stats.hands == stats.completed == 30
+    assert stats.stalled == 0
+    assert sum(stats.profit.values()) == 0
+    assert stats.hands_per_sec > 0
+
+
+def test_same_seed_same_results():
+    first = HandSimulator(rules("hold_em"), num_players=3, seed=3).run(40)
+    second = HandSimulator(rules("hold_em"), num_players=3, seed=3).run(40)
+    assert first.profit == second.profit
+
+
+def test_custom_policies_and_player_limits():
+    sim = HandSimulator(rules("hold_em"), policies=[RandomPolicy(1), RandomPolicy(2)])
+    assert list(sim.policies) == ["sim_0", "sim_1"]
+    assert sim.play_hand() is not None
+
+    with pytest.raises(ValueError, match="players"):
+        HandSimulator(rules("hold_em"), policies=[RandomPolicy(1)])
+
+
+@pytest.mark.parametrize("variant", ["hold_em", "27_triple_draw"])
+def test_passive_policy_reaches_showdown_every_hand(variant):
+    sim = HandSimulator(rules(variant), policies=[PassivePolicy(i) for i in range(3)], seed=2)
+    for _ in range(5):
+        assert sim.play_hand() is not None
+        results = sim.game.get_hand_results()
+        assert all(hand.cards for hands in results.hands.values() for hand in hands)
+        assert len(results.hands) == 3
+
+
+def test_simulated_hands_skip_descriptions():
+    sim = HandSimulator(rules("hold_em"), num_players=2, seed=1)
+    # Play until a hand reaches showdown
+    for _ in range(20):
+        sim.play_hand()
+        hands = [hand for hands in sim.game.get_hand_results().hands.values() for hand in hands if hand.cards]
+        if hands:
+            break
+    assert hands and all(hand.hand_name == "" for hand in hands)
+
+
+def test_games_describe_hands_by_default():
+    game = Game(rules("hold_em"), BettingStructure.LIMIT, small_bet=2, big_bet=4)
+    assert game.showdown_manager.describe_hands
+
+
+def test_active_pot_copy_is_independent():
+    pot = ActivePot(
+        amount=10,
+        current_bet=5,
+        eligible_players={"a", "b"},
+        active_players={"a"},
+        excluded_players=set(),
+        player_bets={"a": 5},
+        player_antes={},
+    )
+    copy = pot.copy()
+    copy.eligible_players.add("c")
+    copy.player_bets["a"] = 7
+    assert copy.amount == 10
+    assert pot.eligible_players == {"a", "b"}
+    assert pot.player_bets == {"a": 5}
@@ -209,14 +209,10 @@ def test_invalid_hand_size():
 def test_five_card_high_beats_two_card_high(evaluator):
     """Test a strong 5-card high hand beating a weak 2-card high hand."""
     # Mock comparison table: 2-card high card maps to a weak 5-card rank
-    mock_table = [
-        {
-            'two_card_rank': '2',  # High card rank for 2-card
-            'two_card_ordered_rank': '67',
-            'five_card_rank': '10',  # Maps to 5-card high card
-            'five_card_ordered_rank': '1279'
-        }
-    ]
+    mock_table = {
+        # High card rank for 2-card -> Maps to 5-card high card
+        (2, 67): (10, 1279.0),
+    }
 
     with patch.object(evaluator, '_load_comparison_table', return_value=mock_table):
         # Strong 5-card hand: Straight Flush (rank typically 1)
@@ -243,14 +239,10 @@ def test_five_card_high_beats_two_card_high(evaluator):
 def test_two_card_high_beats_five_card_high(evaluator):
     """Test a strong 2-card high hand beating a weak 5-card high hand."""
     # Mock comparison table: 2-card pair maps to a strong 5-card rank
-    mock_table = [
-        {
-            'two_card_rank': '1',  # Pair rank for 2-card
-            'two_card_ordered_rank': '1',
-            'five_card_rank': '9',  # Maps to 5-card pair
-            'five_card_ordered_rank': '1'
-        }
-    ]
+    mock_table = {
+        # Pair rank for 2-card -> Maps to 5-card pair
+        (1, 1): (9, 1.0),
+    }
 
     with patch.object(evaluator, '_load_comparison_table', return_value=mock_table):
         # Weak 5-card hand: High Card (rank typically 10)
@@ -277,14 +269,10 @@ def test_two_card_high_beats_five_card_high(evaluator):
 def test_five_card_high_ties_two_card_high(evaluator):
     """Test a tie between a 5-card high hand and a 2-card high hand."""
     # Mock comparison table: 2-card high card maps to the same rank as 5-card high card
-    mock_table = [
-        {
-            'two_card_rank': '2',  # High card rank for 2-card
-            'two_card_ordered_rank': '65',
-            'five_card_rank': '10',  # Maps to 5-card high card
-            'five_card_ordered_rank': '1277'
-        }
-    ]
+    mock_table = {
+        # High card rank for 2-card -> Maps to 5-card high card
+        (2, 65): (10, 1277.0),
+    }
 
     with patch.object(evaluator, '_load_comparison_table', return_value=mock_table):
         # 5-card hand: High Card with rank 10 (simplified assumption)
@@ -305,4 +293,128 @@ def test_five_card_high_ties_two_card_high(evaluator):
         result = evaluator.compare_hands_with_offset(
             five_card_hand, two_card_hand, EvaluationType.HIGH, EvaluationType.TWO_CARD_HIGH
         )
-        assert result == 0, "5-card high card should tie with mapped 2-card high card"        
\ No newline at end of file
+        assert result == 0, "5-card high card should tie with mapped 2-card high card"        
+
+def test_evaluate_codes_matches_evaluate_hand(evaluator, sample_hands):
+    """The integer-code path ranks hands identically to the Card path."""
+    from generic_poker.core.card import cards_to_codes
+
+    for name, hand in sample_hands.items():
+        expected = evaluator.evaluate_hand(hand, EvaluationType.HIGH)
+        result = evaluator.evaluate_codes(cards_to_codes(hand), EvaluationType.HIGH)
+        assert (result.rank, result.ordered_rank) == (expected.rank, expected.ordered_rank), name
+
+
+def test_evaluate_codes_rejects_wrong_size(evaluator, sample_hands):
+    """Code evaluation validates hand size like evaluate_hand."""
+    from generic_poker.core.card import cards_to_codes
+
+    with pytest.raises(ValueError):
+        evaluator.evaluate_codes(cards_to_codes(sample_hands['flush'][:4]), EvaluationType.HIGH)
+
+
+def test_best_hand_picks_best_combination(evaluator):
+    """best_hand evaluates hole/community combinations and returns hole cards first."""
+    hole = [Card(Rank.ACE, Suit.SPADES), Card(Rank.KING, Suit.SPADES), Card(Rank.TWO, Suit.CLUBS), Card(Rank.THREE, Suit.DIAMONDS)]
+    community = [
+        Card(Rank.QUEEN, Suit.SPADES),
+        Card(Rank.JACK, Suit.SPADES),
+        Card(Rank.TEN, Suit.SPADES),
+        Card(Rank.TWO, Suit.HEARTS),
+        Card(Rank.TWO, Suit.DIAMONDS),
+    ]
+
+    cards, result = evaluator.best_hand(hole, community, 2, 3, EvaluationType.HIGH)
+    assert result.rank == 1  # Royal flush
+    assert cards[:2] == [Card(Rank.ACE, Suit.SPADES), Card(Rank.KING, Suit.SPADES)]
+    assert sorted(str(c) for c in cards[2:]) == ["Js", "Qs", "Ts"]
+
+
+def test_best_hand_not_enough_cards(evaluator):
+    """best_hand returns None when no combination can be formed."""
+    hole = [Card(Rank.ACE, Suit.SPADES)]
+    assert evaluator.best_hand(hole, [], 2, 3, EvaluationType.HIGH) is None
+
+
+def test_best_of_keeps_first_on_tie(evaluator):
+    """best_of returns the index of the first of equally ranked hands."""
+    straight_a = [Card(r, Suit.HEARTS if i else Suit.CLUBS) for i, r in enumerate(
+        [Rank.NINE, Rank.EIGHT, Rank.SEVEN, Rank.SIX, Rank.FIVE])]
+    straight_b = [Card(r, Suit.SPADES if i else Suit.DIAMONDS) for i, r in enumerate(
+        [Rank.NINE, Rank.EIGHT, Rank.SEVEN, Rank.SIX, Rank.FIVE])]
+    pair = [Card(Rank.ACE, Suit.HEARTS), Card(Rank.ACE, Suit.DIAMONDS), Card(Rank.KING, Suit.HEARTS),
+            Card(Rank.QUEEN, Suit.CLUBS), Card(Rank.JACK, Suit.SPADES)]
+
+    index, result = evaluator.best_of([pair, straight_a, straight_b], EvaluationType.HIGH)
+    assert index == 1
+    assert result.rank == 6
+
+
+def test_best_of_applies_qualifier(evaluator, sample_hands):
+    """A best hand that misses the qualifier comes back with rank 0."""
+    _, result = evaluator.best_of([sample_hands['high_card']], EvaluationType.HIGH, qualifier=[9, 2860])
+    assert result.rank == 0
+
+
+def test_best_any_matches_enumeration(evaluator):
+    """The direct best-of-N path agrees with ranking every 5-card combination."""
+    import itertools
+    import random
+
+    deck = [Card(r, s) for r in list(Rank)[:13] for s in (Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS)]
+    rng = random.Random(7)
+    for _ in range(200):
+        pool = rng.sample(deck, 7)
+        _, expected = evaluator.best_of(list(itertools.combinations(pool, 5)), EvaluationType.HIGH)
+        cards, result = evaluator.best_any(pool, 5, EvaluationType.HIGH)
+        assert (result.rank, result.ordered_rank) == (expected.rank, expected.ordered_rank)
+        assert evaluator.evaluate_hand(cards, EvaluationType.HIGH).rank == expected.rank
+
+
+def test_best_any_prefers_flush_over_straight(evaluator):
+    """A flush available alongside a straight is chosen, and its cards returned."""
+    pool = [
+        Card(Rank.NINE, Suit.HEARTS),
+        Card(Rank.EIGHT, Suit.SPADES),
+        Card(Rank.SEVEN, Suit.HEARTS),
+        Card(Rank.SIX, Suit.HEARTS),
+        Card(Rank.FIVE, Suit.CLUBS),
+        Card(Rank.TWO, Suit.HEARTS),
+        Card(Rank.KING, Suit.HEARTS),
+    ]
+    cards, result = evaluator.best_any(pool, 5, EvaluationType.HIGH)
+    assert result.rank == 5  # Flush
+    assert all(card.suit == Suit.HEARTS for card in cards)
+
+
+def test_comparison_table_is_indexed_and_shared(evaluator):
+    """Comparison tables are parsed once into a (rank, ordered_rank) index shared across evaluators."""
+    path = evaluator._get_comparison_file(EvaluationType.TWO_CARD_HIGH, EvaluationType.HIGH)
+    table = evaluator._load_comparison_table(path)
+    assert table[(1, 1)] == (9, 1.0)  # AA maps to the best one-pair hand
+    assert HandEvaluator()._load_comparison_table(path) is table
+    assert evaluator._load_comparison_table(path.with_name("missing_comparison.csv")) is None
+
+
+def test_evaluate_batch_matches_evaluate_codes(evaluator, sample_hands):
+    """Vectorized batch evaluation agrees with single-hand evaluation, row by row."""
+    np = pytest.importorskip("numpy")
+    from generic_poker.core.card import cards_to_codes
+
+    hands = [cards_to_codes(cards) for cards in sample_hands.values()]
+    ranks, ordered_ranks = evaluator.evaluate_batch(np.array(hands, dtype=np.int8), EvaluationType.HIGH)
+    for hand, rank, ordered_rank in zip(hands, ranks, ordered_ranks, strict=True):
+        result = evaluator.evaluate_codes(hand, EvaluationType.HIGH)
+        assert (rank, ordered_rank) == (result.rank, result.ordered_rank)
+
+
+def test_evaluate_batch_rejects_bad_rows(evaluator, sample_hands):
+    """Batches with the wrong hand size or an impossible hand raise ValueError."""
+    np = pytest.importorskip("numpy")
+    from generic_poker.core.card import cards_to_codes
+
+    codes = cards_to_codes(sample_hands['high_card'])
+    with pytest.raises(ValueError):
+        evaluator.evaluate_batch(np.array([codes[:4]], dtype=np.int8), EvaluationType.HIGH)
+    with pytest.raises(ValueError):
+        evaluator.evaluate_batch(np.array([codes[:4] + codes[:1]], dtype=np.int8), EvaluationType.HIGH)
@@ -129,3 +129,47 @@ def test_a6_low_hand_comparison():
 
     comparison = evaluator.compare_hands(pair_threes_642, pair_threes_65a, EvaluationType.LOW_A6)
     assert comparison == 1    
+
+
+# Pools for the direct best-of-N path: five or more of a suit (2-7 falls back to
+# enumeration, A-5 ignores the flush) and paired boards.
+CRAFTED_LOW_POOLS = [
+    ['2h', '3h', '4h', '5h', '7h', '8h', '9h'],
+    ['2h', '3h', '4h', '5h', '7h', 'Kh', '8c'],
+    ['2d', '3d', '4d', '5d', '7d', '7c', '2s'],
+    ['As', '2s', '3s', '4s', '5s', '6s', 'Kh'],
+    ['2s', '2h', '3d', '3c', '4s', 'Kh', 'Kd'],
+    ['5s', '5h', '5d', '9c', '9h', 'Ts', 'Js'],
+    ['7s', '7h', '7d', '7c', '2s', '2h', 'Kc'],
+    ['2c', '3c', '4c', '6c', '8c', '8d'],
+    ['As', 'Ah', '2s', '2h', '3s', '3h', '4s', '5s'],
+]
+
+
+@pytest.mark.parametrize("eval_type", [EvaluationType.LOW_27, EvaluationType.LOW_A5])
+def test_best_any_low_matches_enumeration(eval_type):
+    """The direct best-of-N path agrees with ranking every 5-card combination."""
+    import itertools
+    import random
+
+    evaluator = HandEvaluator()
+    deck = [Card(r, s) for r in list(Rank)[:13] for s in (Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS)]
+    rng = random.Random(11)
+    pools = [create_cards(pool) for pool in CRAFTED_LOW_POOLS] + [rng.sample(deck, 7) for _ in range(150)]
+    for pool in pools:
+        _, expected = evaluator.best_of(list(itertools.combinations(pool, 5)), eval_type)
+        cards, result = evaluator.best_any(pool, 5, eval_type)
+        assert (result.rank, result.ordered_rank) == (expected.rank, expected.ordered_rank), pool
+        # The chosen cards come from the pool and rank as reported
+        assert len(cards) == 5 and all(card in pool for card in cards)
+        again = evaluator.evaluate_hand(cards, eval_type)
+        assert (again.rank, again.ordered_rank) == (result.rank, result.ordered_rank), pool
+
+
+def test_27_low_avoids_flush_when_possible():
+    """With six of a suit, 2-7 takes the off-suit card rather than a flush."""
+    evaluator = HandEvaluator()
+    pool = create_cards(['2h', '3h', '4h', '5h', '7h', 'Kh', '8c'])
+    cards, _ = evaluator.best_any(pool, 5, EvaluationType.LOW_27)
+    assert len({card.suit for card in cards}) > 1
+    assert Card(Rank.EIGHT, Suit.CLUBS) in cards
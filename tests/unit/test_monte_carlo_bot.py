@@ -4,21 +4,30 @@ import time
 from pathlib import Path
 from random import Random
 
+import pytest
+
+from generic_poker.analysis.equity import best_hand_rank
+from generic_poker.analysis.preflop import PreflopEquityTable, canonical_hand, load_preflop_tables
 from generic_poker.config.loader import BettingStructure, GameRules
-from generic_poker.core.card import Card
+from generic_poker.core.card import Card, cards_to_codes
 from generic_poker.core.deck import Deck
 from generic_poker.evaluation.evaluator import EvaluationType
 from generic_poker.game.game import Game
 from generic_poker.game.game_state import GameState, PlayerAction
-from online_poker.services.mc_policy import decide
+from online_poker.services.mc_cache import RolloutCache, rollout_cache_for, spec_key
+from online_poker.services.mc_draw_policy import DRAW_POLICIES, choose_keep
+from online_poker.services.mc_policy import decide, decision_thresholds
+from online_poker.services.mc_range import RANGE_WEIGHTS, RangeAction, RangeModel, classify
 from online_poker.services.mc_rollout import (
     HandConfigSpec,
+    RolloutPlan,
     RolloutSpec,
     UnsupportedForRollout,
-    _best_hand_rank,
     estimate_equity,
+    estimate_equity_adaptive,
     run_rollout,
 )
+from online_poker.services.mc_worker_pool import EquityWorkerPool
 from online_poker.services.monte_carlo_bot import MonteCarloBot
 from online_poker.services.simple_bot import BotDecision, BotManager
 
@@ -101,11 +110,11 @@ class TestEquityEstimation:
 class TestQualifierAndSplit:
     def test_low_qualifier_rejects_nine_high(self):
         cfg = HandConfigSpec(eval_type=EvaluationType.LOW_A5, any_cards=5, qualifier=[1, 56])
-        assert _best_hand_rank(cards("9s", "7h", "5d", "3c", "2s"), [], cfg) is None
+        assert best_hand_rank(cards("9s", "7h", "5d", "3c", "2s"), [], cfg) is None
 
     def test_low_qualifier_accepts_wheel(self):
         cfg = HandConfigSpec(eval_type=EvaluationType.LOW_A5, any_cards=5, qualifier=[1, 56])
-        assert _best_hand_rank(cards("As", "2h", "3d", "4c", "5s"), [], cfg) is not None
+        assert best_hand_rank(cards("As", "2h", "3d", "4c", "5s"), [], cfg) is not None
 
     def test_hilo_split_half_pot_each(self):
         """Stud8-style deterministic split: bot wins high, opponent wins qualifying low."""
@@ -146,11 +155,74 @@ class TestQualifierAndSplit:
         """Board quads don't make an Omaha hand quads — only 3 board cards may be used."""
         cfg = HandConfigSpec(eval_type=EvaluationType.HIGH, hole_cards=2, community_cards=3)
         board = cards("9s", "9h", "9d", "9c", "2s")
-        rank = _best_hand_rank(cards("As", "Kh", "5d", "4c"), board, cfg)
+        rank = best_hand_rank(cards("As", "Kh", "5d", "4c"), board, cfg)
         assert rank is not None
         assert rank[0] > 2  # best is trip nines + two hole kickers, never quads (rank 2)
 
 
+def codes(*strs):
+    return cards_to_codes(cards(*strs))
+
+
+class TestDrawPolicy:
+    def test_high_keeps_pairs(self):
+        keep = choose_keep(DRAW_POLICIES[EvaluationType.HIGH], codes("Kd", "2c", "Kh", "7s", "9d"), 5)
+        assert sorted(keep) == sorted(codes("Kd", "Kh"))
+
+    def test_high_stands_pat_on_flush(self):
+        hand = codes("2h", "7h", "9h", "Jh", "4h")
+        assert len(choose_keep(DRAW_POLICIES[EvaluationType.HIGH], hand, 5)) == 5
+
+    def test_27_breaks_straight(self):
+        keep = choose_keep(DRAW_POLICIES[EvaluationType.LOW_27], codes("2c", "3d", "4h", "5s", "6c"), 5)
+        assert sorted(keep) == sorted(codes("2c", "3d", "4h", "5s"))
+
+    def test_27_keeps_distinct_low_cards(self):
+        keep = choose_keep(DRAW_POLICIES[EvaluationType.LOW_27], codes("Ac", "3d", "3h", "7s", "Kc"), 5)
+        assert len(keep) == 2 and set(keep) >= set(codes("7s"))
+
+    def test_a5_stands_pat_on_wheel(self):
+        hand = codes("Ac", "2c", "3c", "4c", "5c")
+        assert len(choose_keep(DRAW_POLICIES[EvaluationType.LOW_A5], hand, 5)) == 5
+
+    def test_badugi_keeps_best_partial_badugi(self):
+        keep = choose_keep(DRAW_POLICIES[EvaluationType.BADUGI], codes("Ac", "2c", "3d", "Kh"), 4)
+        assert sorted(keep) == sorted(codes("Ac", "3d"))
+
+    def test_draw_limits_are_respected(self):
+        policy = DRAW_POLICIES[EvaluationType.LOW_27]
+        hand = codes("Kc", "Qd", "Jh", "Ts", "9c")
+        assert len(choose_keep(policy, hand, max_discards=3)) == 2
+        assert len(choose_keep(policy, codes("2c", "3d", "4h", "7s", "8c"), 5, min_discards=1)) == 4
+
+    def test_draw_rollouts_favour_the_made_hand(self):
+        bot_cards = cards("7s", "5d", "4c", "3h", "2s")
+        spec = RolloutSpec(
+            bot_id="bot_1",
+            bot_cards=bot_cards,
+            opponents=[("opp_0", [], 5)],
+            community=[],
+            player_cards_to_come=0,
+            community_cards_to_come=0,
+            unseen=unseen_from(bot_cards),
+            hand_configs=[HandConfigSpec(eval_type=EvaluationType.LOW_27, any_cards=5)],
+            draws=[5, 5, 5],
+        )
+        equity, _ = estimate_equity(spec, Random(42), far_deadline(), 300)
+        assert equity > 0.9
+
+    def test_bot_draws_with_policy(self):
+        game = _create_game("5_card_draw")
+        bot_id = game.current_player.id
+        bot = MonteCarloBot(bot_id, "MC Bot", seed=42)
+        hand = game.table.players[bot_id].hand.get_cards()
+        decision = bot.choose_action_full([(PlayerAction.DRAW, 0, 5)], game, bot_id)
+        assert decision.action == PlayerAction.DRAW
+        kept = [c for c in hand if c not in decision.cards]
+        expected = choose_keep(DRAW_POLICIES[EvaluationType.HIGH], cards_to_codes(hand), 5)
+        assert sorted(cards_to_codes(kept)) == sorted(expected)
+
+
 class TestPolicy:
     def test_never_folds_when_check_available(self):
         actions = [(PlayerAction.CHECK, None, None), (PlayerAction.FOLD, None, None)]
@@ -245,14 +317,288 @@ class TestFromGame:
             assert len(visible) == 1
             assert hidden == 2
 
-    def test_draw_game_pre_draw_unsupported(self):
-        game = _create_game("5_card_draw")
-        bot_id = game.current_player.id
+    def test_draw_game_snapshot_lists_remaining_draws(self):
+        game = _create_game("27_triple_draw", structure="Limit")
+        spec = RolloutSpec.from_game(game, game.current_player.id)
+        assert len(spec.bot_cards) == 5
+        assert spec.draws == [5, 5, 5]
+        assert spec.player_cards_to_come == 0
+
+    def test_split_draw_game_unsupported(self):
+        game = _create_game("a5_draw_hilo_8", structure="Limit")
+        with pytest.raises(UnsupportedForRollout):
+            RolloutSpec.from_game(game, game.current_player.id)
+
+
+class TestRolloutPlan:
+    def test_plan_precomputes_complete_hole_combos(self):
+        omaha_high = HandConfigSpec(eval_type=EvaluationType.HIGH, hole_cards=2, community_cards=3)
+        spec = holdem_spec(cards("As", "Ah", "Ks", "Kh"))
+        spec.hand_configs = [omaha_high]
+        plan = RolloutPlan.from_spec(spec)
+        assert len(plan.hole_combos[("bot_1", 0)]) == 6
+        assert ("opp_0", 0) not in plan.hole_combos  # opponent cards are drawn per rollout
+        assert plan.needed == 2 + 5
+
+    def test_plan_matches_per_rollout_scoring(self):
+        spec = holdem_spec(cards("Ah", "Kh"), community=cards("2h", "7h", "9s"), community_to_come=2)
+        plan = RolloutPlan.from_spec(spec)
+        plan_rng, spec_rng = Random(5), Random(5)
+        for _ in range(50):
+            assert plan.run(plan_rng) == run_rollout(spec, spec_rng)
+
+
+class TestAdaptiveEstimation:
+    def test_no_thresholds_runs_to_max_rollouts(self):
+        spec = holdem_spec(cards("As", "Ah"))
+        estimate = estimate_equity_adaptive(spec, Random(42), far_deadline(), 300)
+        assert estimate.rollouts == 300
+        assert estimate.low < estimate.equity < estimate.high
+
+    def test_decisive_spot_stops_early(self):
+        spec = holdem_spec(cards("As", "Ah"))
+        estimate = estimate_equity_adaptive(spec, Random(42), far_deadline(), 2000, thresholds=[0.3])
+        assert estimate.rollouts < 2000
+        assert estimate.low > 0.3
+
+    def test_close_spot_uses_full_budget(self):
+        spec = holdem_spec(cards("As", "Ah"))
+        estimate = estimate_equity_adaptive(spec, Random(42), far_deadline(), 400, thresholds=[0.85])
+        assert estimate.rollouts == 400
+
+    def test_decision_free_spot_stops_at_minimum(self):
+        spec = holdem_spec(cards("7s", "2h"))
+        estimate = estimate_equity_adaptive(spec, Random(42), far_deadline(), 2000, thresholds=[], min_rollouts=50)
+        assert estimate.rollouts == 50
+
+    def test_thresholds_follow_policy(self):
+        facing_bet = [(PlayerAction.FOLD, None, None), (PlayerAction.CALL, 10, 10), (PlayerAction.RAISE, 20, 20)]
+        fold_line, value_line = decision_thresholds(facing_bet, pot=30, call_cost=10, players_in_hand=2)
+        assert fold_line == pytest.approx(0.25 - 0.05)
+        assert value_line == pytest.approx(0.25 + 0.15)
+        check_only = [(PlayerAction.FOLD, None, None), (PlayerAction.CHECK, None, None)]
+        assert decision_thresholds(check_only, pot=30, call_cost=0, players_in_hand=2) == []
+
+
+class RecordingPool(EquityWorkerPool):
+    """In-process pool that remembers which bots submitted estimates."""
+
+    def __init__(self):
+        super().__init__(workers=0)
+        self.submitted = []
+        self.specs = []
+        self.priors = []
+
+    def submit(self, spec, seed, time_budget_s, max_rollouts, thresholds=None, prior=None):
+        self.submitted.append(spec.bot_id)
+        self.specs.append(spec)
+        self.priors.append(prior)
+        return super().submit(spec, seed, time_budget_s, max_rollouts, thresholds, prior=prior)
+
+
+class TestEquityWorkerPool:
+    def test_in_process_pool_matches_direct_estimate(self):
+        spec = holdem_spec(cards("As", "Ah"))
+        pool = EquityWorkerPool(workers=0)
+        future = pool.submit(spec, 42, 60.0, 200)
+        assert future.done()
+        estimate = pool.wait(future, 1.0)
+        assert (estimate.equity, estimate.rollouts) == estimate_equity(spec, Random(42), far_deadline(), 200)
+
+    def test_worker_processes_match_in_process(self):
+        spec = holdem_spec(cards("7s", "2h"))
+        pool = EquityWorkerPool(workers=1)
         try:
-            RolloutSpec.from_game(game, bot_id)
-            raise AssertionError("expected UnsupportedForRollout")
-        except UnsupportedForRollout:
-            pass
+            # Spawning and loading rankings is slow on a cold tree; the estimate itself is not
+            for ready in pool.warm():
+                assert ready.result(timeout=300)
+            result = pool.wait(pool.submit(spec, 7, 60.0, 100, thresholds=[0.5]), 10.0)
+        finally:
+            pool.shutdown()
+        assert result == EquityWorkerPool(workers=0).submit(spec, 7, 60.0, 100, thresholds=[0.5]).result()
+
+    def test_bot_uses_given_pool(self):
+        game = _create_game("hold_em")
+        bot_id = game.current_player.id
+        pool = RecordingPool()
+        bot = MonteCarloBot(bot_id, "MC Bot", max_rollouts=50, seed=42, worker_pool=pool, preflop_tables={})
+        bot.choose_action_full(game.get_valid_actions(bot_id), game, bot_id)
+        assert pool.submitted == [bot_id]
+
+
+class TestPreflopTable:
+    def _table_for(self, game, bot_id, equity):
+        hand = game.table.players[bot_id].hand.get_cards()
+        return PreflopEquityTable(
+            game=game.rules.game, samples=1, max_opponents=1, equity={canonical_hand(hand): [equity]}
+        )
+
+    def test_preflop_decision_uses_table(self):
+        game = _create_game("hold_em")
+        bot_id = game.current_player.id
+        pool = RecordingPool()
+        tables = {game.rules.game: self._table_for(game, bot_id, 0.0)}
+        bot = MonteCarloBot(bot_id, "MC Bot", seed=42, worker_pool=pool, preflop_tables=tables)
+        decision = bot.choose_action_full(game.get_valid_actions(bot_id), game, bot_id)
+        assert pool.submitted == []
+        # Zero equity facing the big blind: fold
+        assert decision.action == PlayerAction.FOLD
+
+    def test_rolls_out_when_hand_not_in_table(self):
+        game = _create_game("hold_em")
+        bot_id = game.current_player.id
+        pool = RecordingPool()
+        tables = {game.rules.game: PreflopEquityTable(game=game.rules.game, samples=1, max_opponents=1)}
+        bot = MonteCarloBot(bot_id, "MC Bot", max_rollouts=50, seed=42, worker_pool=pool, preflop_tables=tables)
+        bot.choose_action_full(game.get_valid_actions(bot_id), game, bot_id)
+        assert pool.submitted == [bot_id]
+
+    def test_rolls_out_once_community_cards_are_seen(self):
+        game = _create_game("hold_em")
+        bot_id = game.current_player.id
+        tables = {game.rules.game: self._table_for(game, bot_id, 0.0)}
+        spec = RolloutSpec.from_game(game, bot_id)
+        spec.community = spec.unseen[:3]
+        bot = MonteCarloBot(bot_id, "MC Bot", preflop_tables=tables)
+        assert bot._table_equity(spec, game) is None
+
+
+def holdem_table():
+    return load_preflop_tables()["Hold'em"]
+
+
+class TestRanges:
+    def ranged_spec(self, bot_cards, action):
+        spec = holdem_spec(bot_cards)
+        spec.ranges = RangeModel(2, holdem_table().percentiles(), {"opp_0": RANGE_WEIGHTS[action]})
+        return spec
+
+    def test_buckets_follow_preflop_strength(self):
+        model = RangeModel(2, holdem_table().percentiles())
+        assert model.bucket(tuple(sorted(codes("As", "Ah")))) == 9
+        assert model.bucket(tuple(sorted(codes("7s", "2h")))) == 0
+
+    def test_raiser_range_lowers_equity_of_medium_hand(self):
+        uniform, _ = estimate_equity(holdem_spec(cards("Qs", "Jh")), Random(3), far_deadline(), 1500)
+        ranged, _ = estimate_equity(
+            self.ranged_spec(cards("Qs", "Jh"), RangeAction.RAISED), Random(3), far_deadline(), 1500
+        )
+        assert ranged < uniform - 0.04
+
+    def test_plan_only_ranges_hidden_starting_hands(self):
+        spec = self.ranged_spec(cards("Qs", "Jh"), RangeAction.CALLED)
+        assert RolloutPlan.from_spec(spec).range_slots == [(0, RANGE_WEIGHTS[RangeAction.CALLED])]
+        spec.draws = [3]
+        assert RolloutPlan.from_spec(spec).ranges is None
+
+    def test_bot_ranges_a_raiser_and_skips_the_table(self):
+        game = _create_game("hold_em")
+        raiser = game.current_player.id
+        raise_action = next(a for a in game.get_valid_actions(raiser) if a[0] == PlayerAction.RAISE)
+        assert game.player_action(raiser, PlayerAction.RAISE, raise_action[1]).success
+        assert classify(game.betting, raiser) == RangeAction.RAISED
+
+        bot_id = game.current_player.id
+        pool = RecordingPool()
+        bot = MonteCarloBot(bot_id, "MC Bot", max_rollouts=50, seed=42, worker_pool=pool)
+        bot.choose_action_full(game.get_valid_actions(bot_id), game, bot_id)
+        assert pool.submitted == [bot_id]
+        assert pool.specs[0].ranges.weights == {raiser: RANGE_WEIGHTS[RangeAction.RAISED]}
+
+    def test_bot_without_ranges_samples_uniformly(self):
+        game = _create_game("hold_em")
+        raiser = game.current_player.id
+        raise_action = next(a for a in game.get_valid_actions(raiser) if a[0] == PlayerAction.RAISE)
+        game.player_action(raiser, PlayerAction.RAISE, raise_action[1])
+
+        bot_id = game.current_player.id
+        pool = RecordingPool()
+        bot = MonteCarloBot(
+            bot_id, "MC Bot", max_rollouts=50, seed=42, worker_pool=pool, preflop_tables={}, use_ranges=False
+        )
+        bot.choose_action_full(game.get_valid_actions(bot_id), game, bot_id)
+        assert pool.specs[0].ranges is None
+
+
+class TestRolloutCache:
+    def test_resumed_estimate_continues_the_count(self):
+        spec = holdem_spec(cards("As", "Ah"))
+        first = estimate_equity_adaptive(spec, Random(1), far_deadline(), 200)
+        resumed = estimate_equity_adaptive(spec, Random(2), far_deadline(), 500, prior=first)
+        assert resumed.rollouts == 500
+        assert resumed.high - resumed.low < first.high - first.low
+        assert abs(resumed.equity - 0.85) < 0.06
+        # Nothing left to do: the prior comes back unchanged
+        assert estimate_equity_adaptive(spec, Random(3), far_deadline(), 200, prior=first) == first
+
+    def test_key_tracks_card_state(self):
+        spec = holdem_spec(cards("As", "Ah"))
+        assert spec_key(spec) == spec_key(holdem_spec(cards("As", "Ah")))
+        assert spec_key(spec) != spec_key(holdem_spec(cards("As", "Ad")))
+        dead = holdem_spec(cards("As", "Ah"))
+        dead.unseen = dead.unseen[1:]
+        assert spec_key(spec) != spec_key(dead)
+        ranged = holdem_spec(cards("As", "Ah"))
+        ranged.ranges = RangeModel(2, {}, {"opp_0": RANGE_WEIGHTS[RangeAction.RAISED]})
+        assert spec_key(spec) != spec_key(ranged)
+
+    def test_cache_evicts_least_recently_used(self):
+        cache = RolloutCache(max_entries=2)
+        specs = [holdem_spec(cards("As", rank + "h")) for rank in ("K", "Q", "J")]
+        estimate = estimate_equity_adaptive(specs[0], Random(1), far_deadline(), 50)
+        cache.put(specs[0], estimate)
+        cache.put(specs[1], estimate)
+        assert cache.get(specs[0]) is estimate
+        cache.put(specs[2], estimate)
+        assert len(cache) == 2
+        assert cache.get(specs[1]) is None
+        assert cache.get(specs[0]) is estimate
+
+    def test_bot_reuses_estimate_for_same_cards(self):
+        game = _create_game("hold_em")
+        bot_id = game.current_player.id
+        pool = RecordingPool()
+        # Below MIN_ADAPTIVE_ROLLOUTS, so a cached estimate never settles the decision early
+        bot = MonteCarloBot(bot_id, "MC Bot", max_rollouts=20, seed=42, worker_pool=pool, preflop_tables={})
+        valid_actions = game.get_valid_actions(bot_id)
+        bot.choose_action_full(valid_actions, game, bot_id)
+        assert pool.priors == [None]
+        assert rollout_cache_for(game).get(pool.specs[0]).rollouts == 20
+
+        # Same cards again: the cached estimate already reached max_rollouts
+        bot.choose_action_full(valid_actions, game, bot_id)
+        assert len(pool.submitted) == 1
+
+        # A bigger budget resumes from it
+        bot.max_rollouts = 40
+        bot.choose_action_full(valid_actions, game, bot_id)
+        assert pool.priors[1].rollouts == 20
+        assert rollout_cache_for(game).get(pool.specs[1]).rollouts == 40
+
+    def test_bots_do_not_share_estimates(self):
+        game = _create_game("hold_em")
+        pool = RecordingPool()
+        first_id = game.current_player.id
+        first = MonteCarloBot(first_id, "MC 1", max_rollouts=50, seed=1, worker_pool=pool, preflop_tables={})
+        first.choose_action_full(game.get_valid_actions(first_id), game, first_id)
+        assert game.player_action(first_id, PlayerAction.CALL, 2).success
+
+        second_id = game.current_player.id
+        second = MonteCarloBot(second_id, "MC 2", max_rollouts=50, seed=2, worker_pool=pool, preflop_tables={})
+        second.choose_action_full(game.get_valid_actions(second_id), game, second_id)
+        assert pool.submitted == [first_id, second_id]
+        assert pool.priors == [None, None]
+
+    def test_cache_can_be_disabled(self):
+        game = _create_game("hold_em")
+        bot_id = game.current_player.id
+        pool = RecordingPool()
+        bot = MonteCarloBot(
+            bot_id, "MC Bot", max_rollouts=50, seed=42, worker_pool=pool, preflop_tables={}, use_cache=False
+        )
+        for _ in range(2):
+            bot.choose_action_full(game.get_valid_actions(bot_id), game, bot_id)
+        assert pool.priors == [None, None]
 
 
 class TestMonteCarloBot:
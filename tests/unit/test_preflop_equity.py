@@ -0,0 +1,81 @@
+"""Tests for precomputed preflop equity tables."""
+
+from pathlib import Path
+
+import pytest
+
+from generic_poker.analysis import UnsupportedForEquity
+from generic_poker.analysis.preflop import (
+    PreflopEquityTable,
+    build_preflop_table,
+    canonical_hand,
+    load_preflop_tables,
+    starting_hand_size,
+    starting_hands,
+)
+from generic_poker.config.loader import GameRules
+from generic_poker.core.card import Card
+
+CONFIG_DIR = Path(__file__).parent.parent.parent / "data" / "game_configs"
+
+
+def cards(*strs):
+    return [Card.from_string(s) for s in strs]
+
+
+def rules(name):
+    return GameRules.from_file(CONFIG_DIR / f"{name}.json")
+
+
+def test_canonical_hand_ignores_suit_labels_and_order():
+    assert canonical_hand(cards("Kd", "Ad")) == canonical_hand(cards("As", "Ks")) == "AsKs"
+    assert canonical_hand(cards("Ah", "Kd", "Qh", "2c")) == canonical_hand(cards("2d", "Qs", "As", "Kh"))
+    assert canonical_hand(cards("Ah", "Kh")) != canonical_hand(cards("Ah", "Kd"))
+
+
+def test_holdem_has_169_starting_hands():
+    assert len(starting_hands(2)) == 169
+
+
+def test_starting_hand_size():
+    assert starting_hand_size(rules("hold_em")) == 2
+    assert starting_hand_size(rules("omaha")) == 4
+    with pytest.raises(UnsupportedForEquity):
+        starting_hand_size(rules("7_card_stud"))
+
+
+def test_table_round_trip(tmp_path):
+    table = PreflopEquityTable(game="Hold'em", samples=10, max_opponents=2, equity={"AsAh": [0.85, 0.73]})
+    table.save(tmp_path / "hold_em.json")
+    assert (tmp_path / "hold_em.json").read_text().endswith("}\n")
+    (tmp_path / "broken.json").write_text("{")
+
+    loaded = load_preflop_tables(tmp_path)
+    assert list(loaded) == ["Hold'em"]
+    assert loaded["Hold'em"] == table
+    assert loaded["Hold'em"].lookup(cards("Ad", "Ac"), 2) == 0.73
+    assert loaded["Hold'em"].lookup(cards("Ac", "Ad"), 3) is None
+    assert loaded["Hold'em"].lookup(cards("Kc", "Kd"), 1) is None
+
+
+def test_build_orders_hands_by_strength():
+    table = build_preflop_table(rules("hold_em"), max_opponents=2, samples=100, workers=1, seed=1)
+    assert len(table.equity) == 169
+    aces, trash = table.equity["AsAh"], table.equity["7s2h"]
+    assert aces[0] > 0.75 and trash[0] < 0.45
+    # More opponents, less equity
+    assert aces[1] < aces[0]
+
+
+def test_build_rejects_draw_games():
+    with pytest.raises(UnsupportedForEquity):
+        build_preflop_table(rules("5_card_draw"), max_opponents=1, samples=10, workers=1)
+
+
+def test_percentiles_weight_hands_by_combos():
+    table = PreflopEquityTable(
+        game="Hold'em", samples=1, max_opponents=1, equity={"AsAh": [0.85], "AsKs": [0.67], "7s2h": [0.35]}
+    )
+    percentiles = table.percentiles()
+    # 12 offsuit, 4 suited and 6 paired combos, ranked weakest first
+    assert percentiles == {"7s2h": 6 / 22, "AsKs": 14 / 22, "AsAh": 19 / 22}
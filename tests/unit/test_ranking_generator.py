@@ -0,0 +1,77 @@
+"""Tests for the sharded, resumable hand rankings generator."""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "tools", "generate_rankings"))
+
+from generate_high_hand_rankings import classify_high  # noqa: E402
+from ranking_generator import (  # noqa: E402
+    RankingSpec,
+    _prepare_shard_dir,
+    _shard_path,
+    generate,
+    generate_shard,
+    standard_deck,
+)
+
+SPEC = RankingSpec(name="tiny_high", deck=standard_deck("AKQ"), hand_size=2, classify=classify_high)
+
+
+def read_output(path):
+    if path.suffix == ".db":
+        with sqlite3.connect(path) as conn:
+            return sorted(conn.execute("SELECT hand_str, rank, ordered_rank FROM hand_rankings"))
+    return path.read_bytes()
+
+
+@pytest.fixture
+def single_pass(tmp_path):
+    """Output of each format from one uninterrupted run."""
+    return {
+        output_format: read_output(
+            generate(SPEC, output_format, tmp_path / "single", tmp_path / f"work_{output_format}", workers=1)
+        )
+        for output_format in ("csv", "binary", "sqlite")
+    }
+
+
+def test_csv_ranks_pairs_then_high_cards(tmp_path):
+    lines = generate(SPEC, "csv", tmp_path, tmp_path / "work", workers=2).read_text().splitlines()
+    assert lines[:3] == ["Hand,Rank,OrderedRank", "As,Ah,1,1", "As,Ad,1,1"]
+    assert len(lines) == 1 + 66
+    assert lines[-1] == "Kc,Qc,2,3"
+
+
+@pytest.mark.parametrize("output_format", ["csv", "binary", "sqlite"])
+def test_resumed_run_matches_single_pass(tmp_path, single_pass, output_format, capsys):
+    # What an interrupted run leaves behind: the manifest, one finished shard
+    # and a half-written one
+    work_dir = tmp_path / "work"
+    shard_dir = _prepare_shard_dir(SPEC, work_dir, fresh=False)
+    generate_shard(SPEC, SPEC.shards()[0], _shard_path(shard_dir, 0))
+    _shard_path(shard_dir, 1).with_suffix(".tsv.tmp").write_text("1\t-13\tKs,Kh\n")
+    finished = _shard_path(shard_dir, 0).stat().st_mtime_ns
+
+    output = generate(SPEC, output_format, tmp_path / "resumed", work_dir, workers=2, keep_shards=True)
+
+    assert f"1 of {len(SPEC.shards())} shards already done" in capsys.readouterr().out
+    assert _shard_path(shard_dir, 0).stat().st_mtime_ns == finished
+    assert read_output(output) == single_pass[output_format]
+
+
+def test_different_spec_refuses_old_shards(tmp_path):
+    work_dir = tmp_path / "work"
+    _prepare_shard_dir(SPEC, work_dir, fresh=False)
+    generate_shard(SPEC, SPEC.shards()[0], _shard_path(work_dir / SPEC.name, 0))
+
+    other = RankingSpec(name=SPEC.name, deck=standard_deck("AKJ"), hand_size=2, classify=classify_high)
+    with pytest.raises(ValueError, match="different run"):
+        generate(other, "csv", tmp_path, work_dir, workers=2)
+
+    # --fresh discards them instead
+    generate(other, "csv", tmp_path, work_dir, workers=2, fresh=True)
+    assert "Js,Jh,1,3" in (tmp_path / "all_card_hands_ranked_tiny_high.csv").read_text()
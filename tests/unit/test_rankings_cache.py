@@ -0,0 +1,121 @@
+"""Tests for the packed in-memory hand rankings backend."""
+
+import pytest
+
+from generic_poker.evaluation.cache import (
+    HandRankingsCache,
+    PackedRankings,
+    SQLiteRankings,
+    decode_hand_key,
+    encode_hand_key,
+    read_rankings_csv,
+    write_sqlite_rankings,
+)
+
+
+@pytest.fixture
+def rankings_csv(tmp_path):
+    path = tmp_path / "all_card_hands_ranked_test.csv"
+    path.write_text("Hand,Rank,OrderedRank\nAs,Ah,1,1\nKs,Kh,1,2\nW1,As,1,1\nAs,Ks,2,1\nKs,Kh,1,3\n")
+    return path
+
+
+def test_key_round_trip():
+    for hand_str in ["AsKsQsJsTs", "W1W2AsKh", "B1Ah", "AAAT8", "5432X", "Rj2c"]:
+        assert decode_hand_key(encode_hand_key(hand_str)) == hand_str
+
+
+def test_keys_of_different_lengths_do_not_collide():
+    assert encode_hand_key("As") != encode_hand_key("AsAs")
+
+
+@pytest.mark.parametrize("hand_str", ["", "As_Ks", "AsKsQ", "asks", "As Ks", "Az"])
+def test_malformed_keys_are_rejected(hand_str, rankings_csv):
+    with pytest.raises(ValueError):
+        encode_hand_key(hand_str)
+    assert PackedRankings.from_csv(rankings_csv).get(hand_str) is None
+
+
+def test_get_and_contains(rankings_csv):
+    rankings = PackedRankings.from_csv(rankings_csv)
+    ranking = rankings.get("AsKs")
+    assert (ranking.rank, ranking.ordered_rank) == (2, 1)
+    assert ranking.hand_str == "AsKs"
+    assert "W1As" in rankings
+    assert "QsQh" not in rankings
+    assert rankings.get("QsQh") is None
+    assert rankings.get("") is None
+
+
+def test_duplicate_rows_keep_last(rankings_csv):
+    rankings = PackedRankings.from_csv(rankings_csv)
+    assert len(rankings) == 4
+    assert rankings.get("KsKh").ordered_rank == 3
+
+
+def test_find_by_rank_returns_first_row(rankings_csv):
+    rankings = PackedRankings.from_csv(rankings_csv)
+    assert rankings.find_by_rank(1, 1) == "AsAh"
+    assert rankings.find_by_rank(9, 9) is None
+
+
+def test_items(rankings_csv):
+    rankings = PackedRankings.from_csv(rankings_csv)
+    assert {hand: r.rank for hand, r in rankings.items()} == {"AsAh": 1, "KsKh": 1, "W1As": 1, "AsKs": 2}
+
+
+def test_unpackable_hand_raises(tmp_path):
+    path = tmp_path / "long.csv"
+    path.write_text("Hand,Rank,OrderedRank\nAs,Ks,Qs,Js,Ts,9s,8s,1,1\n")
+    with pytest.raises(ValueError):
+        PackedRankings.from_csv(path)
+
+
+def test_binary_round_trip(rankings_csv, tmp_path):
+    compiled = PackedRankings.from_csv(rankings_csv)
+    binary_file = tmp_path / "rankings.rnk"
+    compiled.write_binary(binary_file)
+
+    mapped = PackedRankings.from_binary(binary_file)
+    assert len(mapped) == len(compiled)
+    assert dict(mapped.items()) == dict(compiled.items())
+    assert mapped.find_by_rank(1, 1) == "AsAh"
+    assert mapped.find_by_rank(9, 9) is None
+    assert mapped.lookup_key(encode_hand_key("AsKs")) == (2, 1)
+
+
+def test_binary_rejects_bad_files(tmp_path):
+    path = tmp_path / "bad.rnk"
+    path.write_bytes(b"not a rankings file at all")
+    with pytest.raises(ValueError):
+        PackedRankings.from_binary(path)
+    with pytest.raises(ValueError):
+        PackedRankings.from_binary(tmp_path / "missing.rnk")
+
+
+def test_cache_prefers_up_to_date_binary(rankings_csv):
+    PackedRankings.from_csv(rankings_csv).write_binary(rankings_csv.with_suffix(".rnk"))
+    rankings = HandRankingsCache()._load_rankings("test", rankings_csv)
+    assert rankings._mapped is not None
+    assert rankings.get("AsKs").rank == 2
+
+
+def test_cache_saves_compiled_csv_as_binary(rankings_csv):
+    compiled = HandRankingsCache()._load_rankings("test", rankings_csv)
+    assert compiled._mapped is None
+    assert dict(PackedRankings.from_binary(rankings_csv.with_suffix(".rnk")).items()) == dict(compiled.items())
+    assert HandRankingsCache()._load_rankings("test", rankings_csv)._mapped is not None
+
+
+def test_from_rows_matches_from_csv(rankings_csv):
+    from_rows = PackedRankings.from_rows(read_rankings_csv(rankings_csv))
+    assert dict(from_rows.items()) == dict(PackedRankings.from_csv(rankings_csv).items())
+    assert from_rows.find_by_rank(1, 1) == "AsAh"
+
+
+def test_cache_opens_generated_sqlite_without_csv(tmp_path):
+    rankings_file = tmp_path / "all_card_hands_ranked_generated.csv"
+    write_sqlite_rankings([("AsAh", 1, 1), ("AsKs", 2, 1), ("AsKs", 2, 2)], rankings_file.with_suffix(".db"))
+    rankings = HandRankingsCache()._load_rankings("generated", rankings_file)
+    assert isinstance(rankings, SQLiteRankings)
+    assert rankings.get("AsKs").ordered_rank == 2
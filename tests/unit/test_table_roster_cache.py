@@ -0,0 +1,151 @@
+"""Unit tests for the in-memory table roster cache."""
+
+import importlib
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from src.online_poker.database import db
+from src.online_poker.models.table import PokerTable
+from src.online_poker.models.table_access import TableAccess
+from src.online_poker.services import table_roster_cache as roster_module
+from src.online_poker.services.player_session_manager import PlayerSessionManager
+from src.online_poker.services.table_access_manager import TableAccessManager
+from src.online_poker.services.table_roster_cache import table_roster_cache
+
+from generic_poker.game.betting import BettingStructure
+
+
+@pytest.fixture
+def app():
+    """Create test Flask app."""
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+
+    with app.app_context():
+        db.init_app(app)
+        db.create_all()
+        yield app
+        db.drop_all()
+    table_roster_cache.clear()
+
+
+@pytest.fixture
+def app_context(app):
+    """Create app context for tests."""
+    with app.app_context():
+        yield
+
+
+@pytest.fixture
+def test_user(app_context):
+    """Create a test user."""
+    from src.online_poker.services.user_manager import UserManager
+
+    user = UserManager.create_user("testuser", "test@example.com", "password123", 1000)
+    return user
+
+
+@pytest.fixture
+def test_table(app_context, test_user):
+    """Create a test table with the test user seated."""
+    table = PokerTable(
+        name="Roster Table",
+        variant="hold_em",
+        betting_structure=BettingStructure.NO_LIMIT.value,
+        stakes={"small_blind": 1, "big_blind": 2},
+        max_players=6,
+        creator_id=test_user.id,
+        is_private=False,
+    )
+    db.session.add(table)
+    db.session.commit()
+    db.session.add(TableAccess(table.id, test_user.id, seat_number=1, buy_in_amount=100))
+    db.session.commit()
+    return table
+
+
+def count_loads():
+    return patch.object(TableAccessManager, "_load_table_players", wraps=TableAccessManager._load_table_players)
+
+
+class TestTableRosterCache:
+    """Test the roster cache and its invalidation."""
+
+    def test_roster_is_loaded_once(self, app_context, test_user, test_table):
+        """Test repeated reads are served from memory."""
+        with count_loads() as load:
+            first = TableAccessManager.get_table_players(test_table.id)
+            second = TableAccessManager.get_table_players(test_table.id)
+            info = PlayerSessionManager.get_player_info(test_user.id, test_table.id)
+
+        assert load.call_count == 1
+        assert first == second
+        assert first[0]["username"] == "testuser"
+        assert first[0]["current_stack"] == 100
+        assert info["seat_number"] == 1
+
+    def test_callers_get_copies(self, app_context, test_user, test_table):
+        """Test modifying a returned roster does not change the cache."""
+        TableAccessManager.get_table_players(test_table.id)[0]["current_stack"] = 0
+        assert TableAccessManager.get_table_players(test_table.id)[0]["current_stack"] == 100
+
+    def test_stack_update_invalidates(self, app_context, test_user, test_table):
+        """Test a stack sync shows up on the next read."""
+        TableAccessManager.get_table_players(test_table.id)
+        assert TableAccessManager.update_player_stack(test_user.id, test_table.id, 250)
+        assert TableAccessManager.get_table_players(test_table.id)[0]["current_stack"] == 250
+
+    def test_join_and_leave_invalidate(self, app_context, test_user, test_table):
+        """Test joining and leaving change the roster."""
+        from src.online_poker.services.user_manager import UserManager
+
+        other = UserManager.create_user("other", "other@example.com", "password123", 1000)
+        assert len(TableAccessManager.get_table_players(test_table.id)) == 1
+
+        db.session.add(TableAccess(test_table.id, other.id, seat_number=2, buy_in_amount=80))
+        db.session.commit()
+        assert [p["username"] for p in TableAccessManager.get_table_players(test_table.id)] == ["testuser", "other"]
+
+        access = db.session.query(TableAccess).filter_by(table_id=test_table.id, user_id=other.id).first()
+        access.leave_table()
+        db.session.commit()
+        assert [p["username"] for p in TableAccessManager.get_table_players(test_table.id)] == ["testuser"]
+        assert PlayerSessionManager.get_player_info(other.id, test_table.id) is None
+
+    def test_username_change_invalidates(self, app_context, test_user, test_table):
+        """Test a user change drops the rosters that list them."""
+        TableAccessManager.get_table_players(test_table.id)
+        test_user.username = "renamed"
+        db.session.commit()
+        assert TableAccessManager.get_table_players(test_table.id)[0]["username"] == "renamed"
+
+    def test_rollback_discards_uncommitted_roster(self, app_context, test_user, test_table):
+        """Test a roster read mid-transaction does not outlive a rollback."""
+        access = db.session.query(TableAccess).filter_by(table_id=test_table.id).first()
+        access.current_stack = 5
+        db.session.flush()
+        assert TableAccessManager.get_table_players(test_table.id)[0]["current_stack"] == 5
+
+        db.session.rollback()
+        assert TableAccessManager.get_table_players(test_table.id)[0]["current_stack"] == 100
+
+    def test_rollback_invalidates_with_module_loaded_twice(self, app_context, test_user, test_table):
+        """Test rollback still invalidates when another copy of the module also listens on Session."""
+        importlib.import_module("online_poker.services.table_roster_cache")
+        # Re-register this copy's hooks so the other copy's run first, whichever was imported first
+        for name in ("after_commit", "after_soft_rollback"):
+            event.remove(Session, name, roster_module._invalidate_transaction_rosters)
+            event.listen(Session, name, roster_module._invalidate_transaction_rosters)
+
+        access = db.session.query(TableAccess).filter_by(table_id=test_table.id).first()
+        access.current_stack = 5
+        db.session.flush()
+        assert TableAccessManager.get_table_players(test_table.id)[0]["current_stack"] == 5
+
+        db.session.rollback()
+        assert TableAccessManager.get_table_players(test_table.id)[0]["current_stack"] == 100
@@ -236,9 +236,8 @@ class TestWebSocketManager:
         
         assert success is False
     
-    @patch('src.online_poker.services.websocket_manager.PlayerSessionManager.get_player_info')
-    @patch('src.online_poker.services.websocket_manager.GameStateManager.generate_game_state_view')
-    def test_broadcast_game_state_update(self, mock_generate_state, mock_get_player_info, websocket_manager, mock_socketio):
+    @patch('src.online_poker.services.websocket_manager.GameStateManager.generate_game_state_payloads')
+    def test_broadcast_game_state_update(self, mock_generate_payloads, websocket_manager, mock_socketio):
         """Test broadcasting game state update."""
         table_id = "table123"
         user_id = "user456"
@@ -248,19 +247,74 @@ class TestWebSocketManager:
         websocket_manager.table_rooms[table_id] = {session_id}
         websocket_manager.session_users[session_id] = user_id
         
-        mock_get_player_info.return_value = {"is_spectator": False}
-        mock_game_state = MagicMock()
-        mock_game_state.to_dict.return_value = {"game": "state"}
-        mock_generate_state.return_value = mock_game_state
+        mock_generate_payloads.return_value = {user_id: {"game": "state"}}
         
         websocket_manager.broadcast_game_state_update(table_id)
         
-        mock_generate_state.assert_called_once_with(table_id, user_id, False)
-        mock_socketio.emit.assert_called_once_with(
-            GameEvent.GAME_STATE_UPDATE, 
-            {"game": "state"}, 
-            room=session_id
-        )
+        mock_generate_payloads.assert_called_once_with(table_id, {user_id})
+        mock_socketio.emit.assert_called_once()
+        event, payload = mock_socketio.emit.call_args[0]
+        assert event == GameEvent.GAME_STATE_UPDATE
+        assert payload["game"] == "state"
+        assert payload["state_version"] > 0
+        assert mock_socketio.emit.call_args[1] == {"room": session_id}
+
+    def test_send_game_state_full_without_delta_support(self, websocket_manager, mock_socketio):
+        """Test clients that did not opt in always get full snapshots."""
+        websocket_manager.send_game_state("session1", "table1", {"pot": 10}, version=1)
+        websocket_manager.send_game_state("session1", "table1", {"pot": 20}, version=2)
+
+        assert [c[0][0] for c in mock_socketio.emit.call_args_list] == [GameEvent.GAME_STATE_UPDATE] * 2
+        assert mock_socketio.emit.call_args[0][1] == {"pot": 20, "state_version": 2}
+
+    def test_send_game_state_deltas(self, websocket_manager, mock_socketio):
+        """Test opted-in clients get a snapshot, then deltas against the last state sent."""
+        websocket_manager.delta_sessions.add("session1")
+        state = {"pot": 10, "players": [{"user_id": "u1", "chip_stack": 100}, {"user_id": "u2", "chip_stack": 90}]}
+        websocket_manager.send_game_state("session1", "table1", state, version=1, full=True)
+        assert mock_socketio.emit.call_args[0] == (GameEvent.GAME_STATE_UPDATE, {**state, "state_version": 1})
+
+        new_state = {"pot": 20, "players": [{"user_id": "u1", "chip_stack": 90}, state["players"][1]]}
+        websocket_manager.send_game_state("session1", "table1", new_state, version=2)
+        event, delta = mock_socketio.emit.call_args[0]
+        assert event == GameEvent.GAME_STATE_DELTA
+        assert delta == {
+            "table_id": "table1",
+            "base_version": 1,
+            "version": 2,
+            "patch": [
+                {"op": "replace", "path": "/pot", "value": 20},
+                {"op": "replace", "path": "/players/0/chip_stack", "value": 90},
+            ],
+        }
+
+        # Nothing changed: nothing sent, and the client's version stays the base
+        websocket_manager.send_game_state("session1", "table1", new_state, version=3)
+        assert mock_socketio.emit.call_count == 2
+        assert websocket_manager.sent_game_states["session1"][1] == 2
+
+    def test_send_game_state_falls_back_to_snapshot(self, websocket_manager, mock_socketio):
+        """Test a full snapshot when forced, for another table, or when the delta is too large."""
+        from src.online_poker.services.websocket_manager import MAX_DELTA_OPS
+
+        websocket_manager.delta_sessions.add("session1")
+        websocket_manager.send_game_state("session1", "table1", {"pot": 10}, version=1)
+        websocket_manager.send_game_state("session1", "table1", {"pot": 20}, version=2, full=True)
+        websocket_manager.send_game_state("session1", "table2", {"pot": 30}, version=1)
+        big = {f"key{i}": i for i in range(MAX_DELTA_OPS + 1)}
+        websocket_manager.send_game_state("session1", "table2", big, version=2)
+
+        assert [c[0][0] for c in mock_socketio.emit.call_args_list] == [GameEvent.GAME_STATE_UPDATE] * 4
+
+    def test_leave_table_room_forgets_sent_state(self, websocket_manager):
+        """Test the next state after rejoining is a full snapshot."""
+        websocket_manager.user_sessions["user1"] = "session1"
+        websocket_manager.sent_game_states["session1"] = ("table1", 1, {"pot": 10})
+
+        with patch('src.online_poker.services.websocket_manager.leave_room'):
+            websocket_manager.leave_table_room("user1", "table1")
+
+        assert "session1" not in websocket_manager.sent_game_states
     
     def test_send_notification(self, websocket_manager):
         """Test sending notification."""
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+"""Engine micro-benchmarks with saved baselines.
+
+Times the engine's hot paths on fixed-seed scenarios:
+
+    evaluate.<type>   HandEvaluator.evaluate_hand, per hand, for each eval type
+    showdown.<game>   ShowdownManager.handle_showdown, per showdown (everyone calls down)
+    betting.<struct>  BettingManager.place_bet, per bet, over a scripted two-street hand
+    deck.build_shuffle  Deck construction plus shuffle
+    hand.<game>       Game.start_hand through completion, per hand (random policies)
+
+Each scenario runs once to warm caches (ranking files, configs), then
+--repeat timed runs; the median time per operation is reported. --save
+writes the results to a JSON baseline and --compare reports the change
+against one, exiting with status 1 if any scenario slowed down by more than
+--threshold. Baselines are machine-specific: compare on the machine (and
+Python) that saved them, with PYTHONHASHSEED pinned.
+
+Scenarios whose data is missing (e.g. an absent ranking file) are reported
+as skipped rather than failing the run.
+
+Usage:
+    python tools/benchmark_engine.py
+    python tools/benchmark_engine.py --filter evaluate,showdown --repeat 10
+    PYTHONHASHSEED=0 python tools/benchmark_engine.py --save benchmarks/main.json
+    PYTHONHASHSEED=0 python tools/benchmark_engine.py --compare benchmarks/main.json --threshold 0.1
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from generic_poker.config.loader import BettingStructure, GameRules
+from generic_poker.core.deck import Deck
+from generic_poker.evaluation.evaluator import EvaluationType, evaluator
+from generic_poker.game.betting import BetType
+from generic_poker.game.game import Game
+from generic_poker.sim import HandSimulator, PassivePolicy, RandomPolicy
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / "data" / "game_configs"
+
+# eval type -> cards per hand
+EVAL_SCENARIOS = {
+    EvaluationType.HIGH: 5,
+    EvaluationType.LOW_A5: 5,
+    EvaluationType.LOW_27: 5,
+    EvaluationType.LOW_A6: 5,
+    EvaluationType.BADUGI: 4,
+    EvaluationType.HIDUGI: 4,
+    EvaluationType.HIGH_WILD: 5,
+}
+SHOWDOWN_VARIANTS = ["hold_em", "omaha_8", "7_card_stud_8", "badugi"]
+HAND_VARIANTS = ["hold_em", "omaha_8", "7_card_stud", "27_triple_draw"]
+
+# Operations per timed run, before --scale
+EVAL_HANDS = 2000
+SHOWDOWN_HANDS = 40
+BETTING_HANDS = 300
+DECKS = 300
+PLAYED_HANDS = 60
+
+# A scenario builds its fixtures from a seed and returns a run: a callable
+# that performs the work and returns (operations, seconds spent on them).
+Run = Callable[[], tuple[int, float]]
+
+
+def evaluate_scenario(eval_type: EvaluationType, cards_per_hand: int, count: int) -> Callable[[int], Run]:
+    def setup(seed: int) -> Run:
+        rng = random.Random(seed)
+        cards = Deck().cards
+        hands = [rng.sample(cards, cards_per_hand) for _ in range(count)]
+
+        def run():
+            started = time.perf_counter()
+            for hand in hands:
+                evaluator.evaluate_hand(hand, eval_type)
+            return len(hands), time.perf_counter() - started
+
+        return run
+
+    return setup
+
+
+def showdown_scenario(variant: str, count: int) -> Callable[[int], Run]:
+    """Time only handle_showdown, over hands that every player calls down."""
+
+    def setup(seed: int) -> Run:
+        rules = GameRules.from_file(CONFIG_DIR / f"{variant}.json")
+        players = min(3, rules.max_players)
+        sim = HandSimulator(rules, policies=[PassivePolicy(seed + i) for i in range(players)], seed=seed)
+        manager = sim.game.showdown_manager
+        # Showdowns as the server runs them, with hand descriptions
+        manager.describe_hands = True
+        handle_showdown = manager.handle_showdown
+        timing = {"calls": 0, "seconds": 0.0}
+
+        def timed_showdown():
+            started = time.perf_counter()
+            try:
+                return handle_showdown()
+            finally:
+                timing["seconds"] += time.perf_counter() - started
+                timing["calls"] += 1
+
+        manager.handle_showdown = timed_showdown
+
+        def run():
+            timing.update(calls=0, seconds=0.0)
+            for _ in range(count):
+                sim.play_hand()
+            return timing["calls"], timing["seconds"]
+
+        return run
+
+    return setup
+
+
+def betting_scenario(structure: BettingStructure, count: int) -> Callable[[int], Run]:
+    """Blinds, a raise and two calls, then a bet and two calls on the next street."""
+
+    def setup(seed: int) -> Run:
+        rules = GameRules.from_file(CONFIG_DIR / "hold_em.json")
+        game = Game(rules, structure, small_bet=2, big_bet=4, small_blind=1, big_blind=2, auto_progress=False)
+        for pid in ("p1", "p2", "p3"):
+            game.add_player(pid, pid, 1000)
+        betting = game.betting
+        open_to = 4 if structure == BettingStructure.LIMIT else 6
+        street_bet = 4 if structure == BettingStructure.LIMIT else 10
+        bets = [
+            ("p2", 1, True, BetType.SMALL),
+            ("p3", 2, True, BetType.SMALL),
+            ("p1", open_to, False, BetType.SMALL),
+            ("p2", open_to, False, BetType.SMALL),
+            ("p3", open_to, False, BetType.SMALL),
+            None,  # next street
+            ("p2", street_bet, False, BetType.BIG),
+            ("p3", street_bet, False, BetType.BIG),
+            ("p1", street_bet, False, BetType.BIG),
+        ]
+
+        def run():
+            ops = 0
+            started = time.perf_counter()
+            for _ in range(count):
+                betting.new_hand()
+                for bet in bets:
+                    if bet is None:
+                        betting.new_round()
+                        continue
+                    player_id, amount, forced, bet_type = bet
+                    betting.place_bet(player_id, amount, 1000, is_forced=forced, bet_type=bet_type)
+                    ops += 1
+            return ops, time.perf_counter() - started
+
+        return run
+
+    return setup
+
+
+def deck_scenario(count: int) -> Callable[[int], Run]:
+    def setup(seed: int) -> Run:
+        rng = random.Random(seed)
+
+        def run():
+            started = time.perf_counter()
+            for _ in range(count):
+                Deck(rng=rng).shuffle()
+            return count, time.perf_counter() - started
+
+        return run
+
+    return setup
+
+
+def hand_scenario(variant: str, count: int) -> Callable[[int], Run]:
+    def setup(seed: int) -> Run:
+        rules = GameRules.from_file(CONFIG_DIR / f"{variant}.json")
+        players = min(3, rules.max_players)
+        sim = HandSimulator(rules, policies=[RandomPolicy(seed + i) for i in range(players)], seed=seed)
+
+        def run():
+            started = time.perf_counter()
+            for _ in range(count):
+                sim.play_hand()
+            return count, time.perf_counter() - started
+
+        return run
+
+    return setup
+
+
+def build_scenarios(scale: float) -> dict[str, Callable[[int], Run]]:
+    def scaled(n: int) -> int:
+        return max(1, round(n * scale))
+
+    scenarios = {}
+    for eval_type, cards_per_hand in EVAL_SCENARIOS.items():
+        scenarios[f"evaluate.{eval_type.value}"] = evaluate_scenario(eval_type, cards_per_hand, scaled(EVAL_HANDS))
+    for variant in SHOWDOWN_VARIANTS:
+        scenarios[f"showdown.{variant}"] = showdown_scenario(variant, scaled(SHOWDOWN_HANDS))
+    for structure in (BettingStructure.LIMIT, BettingStructure.NO_LIMIT):
+        key = structure.value.lower().replace(" ", "_")
+        scenarios[f"betting.{key}"] = betting_scenario(structure, scaled(BETTING_HANDS))
+    scenarios["deck.build_shuffle"] = deck_scenario(scaled(DECKS))
+    for variant in HAND_VARIANTS:
+        scenarios[f"hand.{variant}"] = hand_scenario(variant, scaled(PLAYED_HANDS))
+    return scenarios
+
+
+def measure(setup: Callable[[int], Run], seed: int, repeat: int) -> dict:
+    """Median and best time per operation, in microseconds, over repeat timed runs."""
+    run = setup(seed)
+    run()  # warm-up
+    per_op = []
+    ops = 0
+    for _ in range(repeat):
+        ops, seconds = run()
+        if ops:
+            per_op.append(seconds / ops * 1e6)
+    if not per_op:
+        raise RuntimeError("scenario performed no operations")
+    return {"median_us": round(statistics.median(per_op), 3), "min_us": round(min(per_op), 3), "ops": ops}
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], threshold: float, failed: list[str]) -> list[str]:
+    """Print each scenario's change against the baseline; returns the scenarios that regressed.
+
+    A scenario in failed (it ran but raised) that the baseline has counts as a regression.
+    """
+    regressions = []
+    print(f"\n{'Scenario':<32} {'Baseline µs':>12} {'Now µs':>10} {'Change':>8}")
+    for name in failed:
+        before = baseline.get(name)
+        if before:
+            regressions.append(name)
+            print(f"{name:<32} {before['median_us']:>12.2f} {'-':>10} {'failed':>8}  REGRESSION")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if not before:
+            print(f"{name:<32} {'-':>12} {result['median_us']:>10.2f} {'new':>8}")
+            continue
+        change = result["median_us"] / before["median_us"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<32} {before['median_us']:>12.2f} {result['median_us']:>10.2f} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Engine micro-benchmarks with saved baselines.")
+    parser.add_argument("--filter", default="", help="Comma-separated name prefixes to run, e.g. evaluate,hand.hold_em")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per scenario (default: 5)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply operations per run (default: 1.0)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for hands, decks and policies (default: 0)")
+    parser.add_argument("--save", type=Path, default=None, help="Write results to a JSON baseline")
+    parser.add_argument("--compare", type=Path, default=None, help="Compare against a JSON baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.15, help="Slowdown that counts as a regression (default: 0.15)"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    prefixes = [p.strip() for p in args.filter.split(",") if p.strip()]
+    scenarios = {
+        name: setup
+        for name, setup in build_scenarios(args.scale).items()
+        if not prefixes or any(name.startswith(p) for p in prefixes)
+    }
+    if not scenarios:
+        parser.error(f"no scenarios match {args.filter!r}")
+
+    print(f"{'Scenario':<32} {'Median µs':>10} {'Best µs':>10} {'Ops':>6}")
+    results = {}
+    failed = []
+    for name, setup in scenarios.items():
+        try:
+            result = measure(setup, args.seed, max(1, args.repeat))
+        except Exception as e:
+            print(f"{name:<32} skipped: {type(e).__name__}: {e}")
+            failed.append(name)
+            continue
+        results[name] = result
+        print(f"{name:<32} {result['median_us']:>10.2f} {result['min_us']:>10.2f} {result['ops']:>6}")
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "scale": args.scale,
+        }
+        args.save.write_text(json.dumps({"meta": meta, "results": results}, indent=2) + "\n")
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(results, baseline["results"], args.threshold, failed)
+        if regressions:
+            print(f"\n{len(regressions)} failed or over {args.threshold:.0%} slower: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,34 +2,54 @@
 """Offline bot arena: pit bot types against each other over many hands.
 
 Drives the core engine directly (no web server, no DB). Stacks reset every
-hand so results are a clean sum of per-hand chip deltas.
+hand so results are a clean sum of independent per-hand chip deltas, which
+also gives each bot's result a confidence interval.
+
+Hands are split into shards of --shard-hands hands per variant and played in
+worker processes. Each shard seeds its deck, the bots and the global random
+module from (--seed, variant, shard), so a run is reproducible shard by shard
+whatever the worker count. For bit-identical reruns also pin PYTHONHASHSEED
+(the engine iterates some sets of strings) and give MC bots a rollout cap
+they reach well within their time budget. Shard results are streamed to --output as they finish, as CSV or JSON lines
+depending on the file extension.
 
 Usage:
     python tools/bot_arena.py                                  # MC vs Simple, 200 hands of hold'em
     python tools/bot_arena.py --variant omaha_8 --hands 500
     python tools/bot_arena.py --bots mc,simple,simple --structure Limit
     python tools/bot_arena.py --variant 7_card_stud --structure Limit --seed 42
+    python tools/bot_arena.py --variant all --hands 100 --workers 8 --output nightly.jsonl
 """
 
 import argparse
+import contextlib
+import csv
+import json
+import math
 import os
+import random
 import sys
 import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, fields
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import logging
 
-from generic_poker.config.loader import BettingStructure, GameActionType, GameRules
+from generic_poker.config.loader import BettingStructure, GameRules
 from generic_poker.game.game import Game
-from generic_poker.game.game_state import GameState
+from generic_poker.sim import play_hand
 from online_poker.services.monte_carlo_bot import MonteCarloBot
 from online_poker.services.simple_bot import SimpleBot
 
 CONFIG_DIR = os.path.join(os.path.dirname(__file__), "..", "data", "game_configs")
 START_STACK = 200
-MAX_ACTIONS_PER_HAND = 500
+BIG_BLIND = 2
+# z for the ~95% confidence intervals reported on BB/100
+CONFIDENCE_Z = 1.96
 
 
 def make_bot(bot_type: str, player_id: str, name: str, seed: int | None, time_budget_ms: int):
@@ -38,65 +58,193 @@ def make_bot(bot_type: str, player_id: str, name: str, seed: int | None, time_bu
     return SimpleBot(player_id, name)
 
 
-def advance_non_player_steps(game):
-    while game.state != GameState.COMPLETE:
-        if game.current_step >= len(game.rules.gameplay):
-            break
-        if game.state == GameState.DEALING:
-            step = game.rules.gameplay[game.current_step]
-            if step.action_type == GameActionType.CHOOSE and game.current_player is not None:
-                break
-            game._next_step()
-        elif game.state == GameState.BETTING and game.current_player is None:
-            game._next_step()
+@dataclass
+class Shard:
+    """A run of hands of one variant, played in one worker."""
+
+    variant: str
+    structure: str
+    bot_types: list[str]
+    index: int
+    hands: int
+    seed: int
+    budget_ms: int
+
+
+@dataclass
+class ShardResult:
+    variant: str
+    structure: str
+    index: int
+    seed: int
+    completed: int = 0
+    stalled: int = 0
+    elapsed_s: float = 0.0
+    error: str = ""
+    # Per seat: sum of chip deltas and sum of squared deltas over completed hands
+    profit: list[int] = field(default_factory=list)
+    profit_sq: list[int] = field(default_factory=list)
+
+    def merge(self, other: "ShardResult") -> None:
+        """Add another shard's hands to this (variant total) result."""
+        self.completed += other.completed
+        self.stalled += other.stalled
+        self.elapsed_s += other.elapsed_s
+        self.error = self.error or other.error
+        for seat in range(len(other.profit)):
+            self.profit[seat] += other.profit[seat]
+            self.profit_sq[seat] += other.profit_sq[seat]
+
+
+def shard_seed(base_seed: int, variant: str, index: int) -> int:
+    """Deterministic seed for a shard, independent of how shards are scheduled."""
+    return (base_seed * 1_000_003 + zlib.crc32(f"{variant}:{index}".encode())) % 2**32
+
+
+def pick_structure(rules: GameRules, preferred: str) -> BettingStructure:
+    """The preferred structure if the variant allows it, else its first one."""
+    structure = BettingStructure(preferred)
+    return structure if structure in rules.betting_structures else rules.betting_structures[0]
+
+
+def run_shard(shard: Shard) -> ShardResult:
+    """Play one shard's hands. Runs in a worker process."""
+    result = ShardResult(shard.variant, shard.structure, shard.index, shard.seed)
+    started = time.monotonic()
+    try:
+        rules = GameRules.from_file(os.path.join(CONFIG_DIR, f"{shard.variant}.json"))
+        game = Game(
+            rules,
+            structure=BettingStructure(shard.structure),
+            small_blind=1,
+            big_blind=BIG_BLIND,
+            small_bet=2,
+            big_bet=4,
+            bring_in=1,
+            ante=1,
+            auto_progress=False,
+            describe_hands=False,
+        )
+        # SimpleBot and some engine paths draw from the global random module
+        random.seed(shard.seed)
+        game.table.set_deck_seed(shard.seed)
+
+        bots = {}
+        for i, bot_type in enumerate(shard.bot_types):
+            pid = f"bot_{i}"
+            name = f"{bot_type.upper()}-{i}"
+            bots[pid] = make_bot(bot_type, pid, name, shard.seed + i, shard.budget_ms)
+            game.add_player(pid, name, START_STACK)
+        result.profit = [0] * len(bots)
+        result.profit_sq = [0] * len(bots)
+
+        for _ in range(shard.hands):
+            for player in game.table.players.values():
+                player.stack = START_STACK
+            game.table.move_button()
+            if play_hand(game, bots):
+                result.completed += 1
+                for seat, pid in enumerate(bots):
+                    delta = game.table.players[pid].stack - START_STACK
+                    result.profit[seat] += delta
+                    result.profit_sq[seat] += delta * delta
+            else:
+                result.stalled += 1
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.elapsed_s = time.monotonic() - started
+    return result
+
+
+def bb100_interval(profit: int, profit_sq: int, hands: int) -> tuple[float, float]:
+    """Mean BB/100 and the half-width of its confidence interval."""
+    if hands == 0:
+        return 0.0, float("inf")
+    mean = profit / hands
+    if hands < 2:
+        return mean / BIG_BLIND * 100, float("inf")
+    variance = max(0.0, (profit_sq - hands * mean * mean) / (hands - 1))
+    half_width = CONFIDENCE_Z * math.sqrt(variance / hands)
+    return mean / BIG_BLIND * 100, half_width / BIG_BLIND * 100
+
+
+class ResultWriter:
+    """Streams shard results to a CSV or JSON lines file as they arrive."""
+
+    def __init__(self, f, as_csv: bool):
+        self._file = f
+        self._csv = None
+        if as_csv:
+            self._csv = csv.DictWriter(f, fieldnames=[field.name for field in fields(ShardResult)])
+            self._csv.writeheader()
+
+    def write(self, result: ShardResult) -> None:
+        row = asdict(result)
+        if self._csv:
+            # Per-seat lists as space-separated cells
+            self._csv.writerow(row | {key: " ".join(map(str, row[key])) for key in ("profit", "profit_sq")})
         else:
-            break
-
-
-def play_hand(game, bots) -> bool:
-    """Play one hand to completion. Returns False if the hand stalled."""
-    game.start_hand(shuffle_deck=True)
-    advance_non_player_steps(game)
-
-    for _ in range(MAX_ACTIONS_PER_HAND):
-        if game.state == GameState.COMPLETE:
-            return True
-        player = game.current_player
-        if player is None:
-            advance_non_player_steps(game)
-            if game.current_player is None and game.state != GameState.COMPLETE:
-                return False
+            self._file.write(json.dumps(row) + "\n")
+        self._file.flush()
+
+
+def resolve_variants(spec: str) -> list[str]:
+    """Variant names from a comma-separated list, or every config for "all"."""
+    if spec == "all":
+        return sorted(name[:-5] for name in os.listdir(CONFIG_DIR) if name.endswith(".json"))
+    return [v.strip() for v in spec.split(",") if v.strip()]
+
+
+def plan_shards(variants, bot_types, hands, shard_hands, structure, seed, budget_ms):
+    """Shards for every variant; variants that cannot seat the bots are reported and skipped."""
+    shards = []
+    skipped = {}
+    for variant in variants:
+        try:
+            rules = GameRules.from_file(os.path.join(CONFIG_DIR, f"{variant}.json"))
+        except Exception as e:
+            skipped[variant] = f"{type(e).__name__}: {e}"
+            continue
+        if not rules.min_players <= len(bot_types) <= rules.max_players:
+            skipped[variant] = f"needs {rules.min_players}-{rules.max_players} players"
             continue
+        variant_structure = pick_structure(rules, structure).value
+        for index, start in enumerate(range(0, hands, shard_hands)):
+            shards.append(
+                Shard(
+                    variant=variant,
+                    structure=variant_structure,
+                    bot_types=bot_types,
+                    index=index,
+                    hands=min(shard_hands, hands - start),
+                    seed=shard_seed(seed, variant, index),
+                    budget_ms=budget_ms,
+                )
+            )
+    return shards, skipped
 
-        bot = bots[player.id]
-        valid_actions = game.get_valid_actions(player.id)
-        if not valid_actions:
-            return False
-        decision = bot.choose_action_full(valid_actions, game, player.id)
-        result = game.player_action(
-            player.id,
-            decision.action,
-            decision.amount or 0,
-            cards=decision.cards,
-            declaration_data=decision.declaration_data,
-        )
-        if not result.success:
-            print(f"  ! action rejected for {bot.username}: {result.error}")
-            return False
-        if result.advance_step and game.state != GameState.COMPLETE:
-            game._next_step()
-            advance_non_player_steps(game)
-    return game.state == GameState.COMPLETE
+
+def _quiet_worker():
+    logging.basicConfig(level=logging.CRITICAL)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Pit bot types against each other offline.")
-    parser.add_argument("--variant", default="hold_em", help="Game config name (default: hold_em)")
-    parser.add_argument("--hands", type=int, default=200, help="Number of hands (default: 200)")
+    parser.add_argument(
+        "--variant", default="hold_em", help='Game config name(s), comma-separated, or "all" (default: hold_em)'
+    )
+    parser.add_argument("--hands", type=int, default=200, help="Hands per variant (default: 200)")
     parser.add_argument("--bots", default="mc,simple", help="Comma-separated bot types to seat, e.g. mc,simple,simple")
-    parser.add_argument("--structure", default="No Limit", help='Betting structure: "No Limit", "Pot Limit", "Limit"')
-    parser.add_argument("--seed", type=int, default=None, help="Seed for MC bots (reproducibility)")
+    parser.add_argument(
+        "--structure",
+        default="No Limit",
+        help='Betting structure: "No Limit", "Pot Limit", "Limit" (variants without it use their first structure)',
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Base seed for decks and bots (default: 0)")
     parser.add_argument("--budget-ms", type=int, default=300, help="MC time budget per decision (default: 300)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count; 1 in-process)")
+    parser.add_argument("--shard-hands", type=int, default=50, help="Hands per shard (default: 50)")
+    parser.add_argument("--output", default=None, help="Stream shard results to a .csv or .jsonl file")
     parser.add_argument("--verbose", action="store_true", help="Enable engine/bot logging")
     args = parser.parse_args()
 
@@ -105,55 +253,69 @@ def main():
     bot_types = [b.strip() for b in args.bots.split(",") if b.strip()]
     if len(bot_types) < 2:
         parser.error("need at least 2 bots")
+    variants = resolve_variants(args.variant)
+    unknown = [v for v in variants if not os.path.exists(os.path.join(CONFIG_DIR, f"{v}.json"))]
+    if unknown:
+        parser.error(f"unknown variants: {', '.join(unknown)}")
 
-    rules = GameRules.from_file(os.path.join(CONFIG_DIR, f"{args.variant}.json"))
-    game = Game(
-        rules,
-        structure=BettingStructure(args.structure),
-        small_blind=1,
-        big_blind=2,
-        small_bet=2,
-        big_bet=4,
-        bring_in=1,
-        ante=1,
-        auto_progress=False,
+    shards, skipped = plan_shards(
+        variants, bot_types, args.hands, max(1, args.shard_hands), args.structure, args.seed, args.budget_ms
+    )
+    for variant, reason in skipped.items():
+        print(f"  skipping {variant}: {reason}")
+    workers = args.workers or os.cpu_count() or 1
+    print(
+        f"Arena: {len(variants) - len(skipped)} variant(s), {args.hands} hands each, bots: {', '.join(bot_types)}, "
+        f"{len(shards)} shards on {workers} worker(s)"
     )
 
-    bots = {}
-    profits = {}
-    for i, bot_type in enumerate(bot_types):
-        pid = f"bot_{i}"
-        name = f"{bot_type.upper()}-{i}"
-        bots[pid] = make_bot(bot_type, pid, name, args.seed, args.budget_ms)
-        profits[pid] = 0
-        game.add_player(pid, name, START_STACK)
-
-    print(f"Arena: {args.variant} ({args.structure}), {args.hands} hands, bots: {', '.join(bot_types)}")
     started = time.monotonic()
-    completed = stalled = 0
-
-    for hand_num in range(1, args.hands + 1):
-        for player in game.table.players.values():
-            player.stack = START_STACK
-        game.table.move_button()
-        if play_hand(game, bots):
-            completed += 1
-            for pid, player in game.table.players.items():
-                profits[pid] += player.stack - START_STACK
+    totals: dict[str, ShardResult] = {}
+    with contextlib.ExitStack() as stack:
+        writer = None
+        if args.output:
+            f = stack.enter_context(open(args.output, "w", newline=""))
+            writer = ResultWriter(f, as_csv=args.output.endswith(".csv"))
+        if workers == 1:
+            results = map(run_shard, shards)
         else:
-            stalled += 1
-        if hand_num % 50 == 0:
-            print(f"  {hand_num} hands... " + "  ".join(f"{bots[p].username}: {profits[p]:+d}" for p in profits))
+            initializer = None if args.verbose else _quiet_worker
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers, initializer=initializer))
+            results = (future.result() for future in as_completed([pool.submit(run_shard, s) for s in shards]))
+
+        for done, result in enumerate(results, 1):
+            if writer:
+                writer.write(result)
+            if result.variant not in totals:
+                seats = len(bot_types)
+                totals[result.variant] = ShardResult(
+                    result.variant,
+                    result.structure,
+                    index=-1,
+                    seed=args.seed,
+                    profit=[0] * seats,
+                    profit_sq=[0] * seats,
+                )
+            totals[result.variant].merge(result)
+            if done % 50 == 0:
+                print(f"  {done}/{len(shards)} shards, {time.monotonic() - started:.0f}s")
 
     elapsed = time.monotonic() - started
+    completed = sum(t.completed for t in totals.values())
+    stalled = sum(t.stalled for t in totals.values())
     print(
         f"\nDone: {completed} hands completed, {stalled} stalled, {elapsed:.1f}s "
-        f"({elapsed / max(1, completed) * 1000:.0f}ms/hand)"
+        f"({elapsed / max(1, completed) * 1000:.0f}ms/hand wall clock)"
     )
-    print(f"{'Bot':<12} {'Profit':>8} {'BB/100':>8}")
-    for pid in profits:
-        bb100 = profits[pid] / 2 / max(1, completed) * 100  # big blind = 2
-        print(f"{bots[pid].username:<12} {profits[pid]:>+8d} {bb100:>+8.1f}")
+    names = [f"{bot_type.upper()}-{i}" for i, bot_type in enumerate(bot_types)]
+    print(f"{'Variant':<28} {'Bot':<12} {'Profit':>8} {'BB/100':>8} {'95% CI':>10}")
+    for variant in sorted(totals):
+        total = totals[variant]
+        if total.error:
+            print(f"{variant:<28} error: {total.error}")
+        for seat, name in enumerate(names):
+            bb100, half_width = bb100_interval(total.profit[seat], total.profit_sq[seat], total.completed)
+            print(f"{variant:<28} {name:<12} {total.profit[seat]:>+8d} {bb100:>+8.1f} {'±':>2}{half_width:>7.1f}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""Build preflop equity tables for the Monte Carlo bot.
+
+For each variant, computes the equity of every canonical starting hand
+against 1..N opponents with unknown cards, and writes it to
+data/preflop_equity/<variant>.json. MonteCarloBot looks decisions up there
+before any card beyond its own hand is seen, instead of rolling out.
+
+Only variants whose starting hand is dealt face down and whose rest of the
+hand is deal-only are supported (Hold'em, Omaha and friends).
+
+Usage:
+    python tools/build_preflop_equity.py                          # hold_em, up to 5 opponents
+    python tools/build_preflop_equity.py hold_em omaha_8 --samples 5000
+    python tools/build_preflop_equity.py omaha --opponents 3 --workers 8 --seed 1
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from generic_poker.analysis.equity import UnsupportedForEquity
+from generic_poker.analysis.preflop import PREFLOP_EQUITY_DIR, build_preflop_table
+from generic_poker.config.loader import GameRules
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / "data" / "game_configs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build preflop equity tables.")
+    parser.add_argument("variants", nargs="*", default=["hold_em"], help="Variant config names (default: hold_em)")
+    parser.add_argument("--opponents", type=int, default=5, help="Largest opponent count to tabulate (default: 5)")
+    parser.add_argument("--samples", type=int, default=2000, help="Samples per hand and opponent count")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=None, help="Base seed for reproducible tables")
+    parser.add_argument("--output-dir", type=Path, default=PREFLOP_EQUITY_DIR, help="Directory for the tables")
+    args = parser.parse_args()
+
+    for variant in args.variants:
+        config = CONFIG_DIR / f"{variant}.json"
+        if not config.exists():
+            parser.error(f"unknown variant: {variant}")
+        rules = GameRules.from_file(config)
+
+        start = time.monotonic()
+
+        def progress(done, total, start=start):
+            if done % 50 == 0 or done == total:
+                print(f"  {done}/{total} hands, {time.monotonic() - start:.0f}s")
+
+        print(f"{variant}: building table for 1-{args.opponents} opponents, {args.samples} samples each")
+        try:
+            table = build_preflop_table(
+                rules, args.opponents, args.samples, workers=args.workers, seed=args.seed, progress=progress
+            )
+        except UnsupportedForEquity as e:
+            print(f"{variant}: skipped ({e})")
+            continue
+        output_file = args.output_dir / f"{variant}.json"
+        table.save(output_file)
+        print(f"Wrote {output_file} ({len(table.equity)} hands) in {time.monotonic() - start:.0f}s")
+
+
+if __name__ == "__main__":
+    main()
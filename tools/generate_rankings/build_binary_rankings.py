@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""Build memory-mapped binary rankings files from the rankings CSVs.
+
+Each data/hand_rankings/all_card_hands_ranked_*.csv is compiled into a sibling
+.rnk file that HandRankingsCache maps directly, so worker processes share one
+page-cache copy and nothing is converted on the first hand of a variant.
+CSVs whose hand strings cannot be packed are skipped; they keep using the
+SQLite fallback.
+
+Usage:
+    python tools/generate_rankings/build_binary_rankings.py            # all rankings CSVs
+    python tools/generate_rankings/build_binary_rankings.py --force    # rebuild up-to-date files too
+    python tools/generate_rankings/build_binary_rankings.py data/hand_rankings/all_card_hands_ranked_high.csv
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from generic_poker.evaluation.cache import RANKINGS_BINARY_SUFFIX, PackedRankings
+
+RANKINGS_DIR = Path(__file__).resolve().parents[2] / "data" / "hand_rankings"
+
+
+def build(csv_file: Path, force: bool = False) -> bool:
+    """Build the binary file for one CSV. Returns True if a file was written."""
+    binary_file = csv_file.with_suffix(RANKINGS_BINARY_SUFFIX)
+    if not force and binary_file.exists() and binary_file.stat().st_mtime >= csv_file.stat().st_mtime:
+        print(f"Up to date: {binary_file.name}")
+        return False
+    try:
+        rankings = PackedRankings.from_csv(csv_file)
+    except ValueError as e:
+        print(f"Skipping {csv_file.name}: {e}")
+        return False
+    rankings.write_binary(binary_file)
+    print(f"Wrote {binary_file.name} ({len(rankings)} hands)")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build memory-mapped binary rankings files from rankings CSVs.")
+    parser.add_argument("csv_files", nargs="*", type=Path, help="CSV files to convert (default: all rankings CSVs)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the binary file is up to date")
+    args = parser.parse_args()
+
+    csv_files = args.csv_files or sorted(RANKINGS_DIR.glob("all_card_hands_ranked_*.csv"))
+    built = sum(build(csv_file, args.force) for csv_file in csv_files)
+    print(f"Built {built} of {len(csv_files)} binary rankings files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""Generate the standard high-hand rankings tables with the shared generator.
+
+Five-card hands rank royal flush (1) down to high card (10). Smaller hands
+have no straights or flushes and rank by their pairing pattern alone: pair,
+then high card for two cards.
+
+Usage:
+    python tools/generate_rankings/generate_high_hand_rankings.py high --format binary
+    python tools/generate_rankings/generate_high_hand_rankings.py two_card_high
+"""
+
+from collections import Counter
+
+from ranking_generator import RANKS, RankingSpec, main, standard_deck
+
+VALUES = {rank: 14 - i for i, rank in enumerate(RANKS)}
+
+
+def _patterns(cards: int, largest: int | None = None) -> list[tuple[int, ...]]:
+    """Pairing patterns of a hand, strongest first: (2,), (1, 1) for two cards."""
+    if cards == 0:
+        return [()]
+    largest = min(cards, largest or cards)
+    return [(size,) + rest for size in range(largest, 0, -1) for rest in _patterns(cards - size, size)]
+
+
+PATTERN_RANKS = {cards: {p: i + 1 for i, p in enumerate(_patterns(cards))} for cards in range(1, 5)}
+
+FIVE_CARD_RANKS = {(4, 1): 3, (3, 2): 4, (3, 1, 1): 7, (2, 2, 1): 8, (2, 1, 1, 1): 9, (1, 1, 1, 1, 1): 10}
+
+
+def classify_high(hand: tuple[str, ...]) -> tuple[int, tuple[int, ...]]:
+    """Rank and strength of a high hand; card values are negated so lower is stronger."""
+    counts = Counter(VALUES[card[0]] for card in hand)
+    groups = sorted(counts.items(), key=lambda item: (item[1], item[0]), reverse=True)
+    pattern = tuple(count for _, count in groups)
+    strength = tuple(-value for value, _ in groups)
+    if len(hand) < 5:
+        return PATTERN_RANKS[len(hand)][pattern], strength
+
+    flush = len({card[1] for card in hand}) == 1
+    straight_high = None
+    if len(counts) == 5:
+        if strength[0] - strength[4] == -4:
+            straight_high = -strength[0]
+        elif strength == (-14, -5, -4, -3, -2):
+            straight_high = 5  # the wheel
+    if straight_high and flush:
+        return (1, ()) if straight_high == 14 else (2, (-straight_high,))
+    if flush:
+        return 5, strength
+    if straight_high:
+        return 6, (-straight_high,)
+    return FIVE_CARD_RANKS[pattern], strength
+
+
+SPECS = {
+    name: RankingSpec(name=name, deck=standard_deck(), hand_size=size, classify=classify_high)
+    for name, size in (("two_card_high", 2), ("high", 5))
+}
+
+
+if __name__ == "__main__":
+    main(SPECS)
@@ -0,0 +1,246 @@
+"""Shared framework for generating hand rankings tables.
+
+A RankingSpec describes one rankings table: the deck, the hand size and a
+classify function mapping a hand to (rank, strength), where both are "lower
+is better". The generator enumerates every combination of the deck, sharded
+by leading cards across worker processes, and ranks the hands:
+
+- rank comes straight from classify
+- ordered_rank numbers the distinct strengths within a rank from 1, so
+  equal hands share an ordered_rank
+
+Each shard is written, sorted, to a checkpoint directory as soon as it is
+done, so an interrupted run picks up where it left off. The sorted shards
+are then merged and streamed straight into the requested output: the CSV
+format HandRankingsCache reads, a binary .rnk file, or a SQLite database.
+
+The deck must be listed in the order the evaluation type sorts cards, so
+each combination is already a canonical hand string.
+
+Adding an evaluation type means writing a classify function and a spec;
+see generate_high_hand_rankings.py.
+"""
+
+import argparse
+import heapq
+import json
+import os
+import shutil
+import sys
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import combinations
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from generic_poker.evaluation.cache import RANKINGS_BINARY_SUFFIX, PackedRankings, write_sqlite_rankings
+
+RANKINGS_DIR = Path(__file__).resolve().parents[2] / "data" / "hand_rankings"
+DEFAULT_WORK_DIR = Path(__file__).resolve().parent / "work"
+OUTPUT_FORMATS = ("csv", "binary", "sqlite")
+
+RANKS = "AKQJT98765432"
+SUITS = "shdc"
+
+
+def standard_deck(ranks: str = RANKS, suits: str = SUITS) -> tuple[str, ...]:
+    """Card strings ordered by rank (in the given order), then suit."""
+    return tuple(rank + suit for rank in ranks for suit in suits)
+
+
+@dataclass(frozen=True)
+class RankingSpec:
+    """One rankings table to generate.
+
+    classify must be a module-level function so it can be sent to workers.
+    """
+
+    name: str  # table name, as in all_card_hands_ranked_<name>.csv
+    deck: tuple[str, ...]
+    hand_size: int
+    classify: Callable[[tuple[str, ...]], tuple[int, tuple[int, ...]]]
+
+    @property
+    def prefix_size(self) -> int:
+        """Leading cards that identify a shard; two for big hands to keep shards small."""
+        return 2 if self.hand_size >= 5 else 1
+
+    def shards(self) -> list[tuple[int, ...]]:
+        """Deck indices of each shard's leading cards, in canonical order."""
+        return list(combinations(range(len(self.deck)), self.prefix_size))
+
+    def fingerprint(self) -> dict:
+        """What a checkpoint directory must match for a run to resume from it."""
+        return {
+            "name": self.name,
+            "deck": list(self.deck),
+            "hand_size": self.hand_size,
+            "classify": f"{self.classify.__module__}.{self.classify.__qualname__}",
+        }
+
+
+def _shard_path(shard_dir: Path, index: int) -> Path:
+    return shard_dir / f"shard_{index:06d}.tsv"
+
+
+def generate_shard(spec: RankingSpec, prefix: tuple[int, ...], path: Path) -> int:
+    """Classify every hand starting with the prefix cards and write them sorted to path.
+
+    Lines are "rank<TAB>strength<TAB>hand", ordered by (rank, strength) and
+    then by hand, and the file appears only once complete.
+    """
+    deck = spec.deck
+    lead = tuple(deck[i] for i in prefix)
+    rows = []
+    for rest in combinations(deck[prefix[-1] + 1 :], spec.hand_size - len(prefix)):
+        hand = lead + rest
+        rank, strength = spec.classify(hand)
+        rows.append((rank, strength, hand))
+    # Stable: hands with equal (rank, strength) stay in enumeration order
+    rows.sort(key=lambda row: (row[0], row[1]))
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        for rank, strength, hand in rows:
+            f.write(f"{rank}\t{','.join(map(str, strength))}\t{','.join(hand)}\n")
+    os.replace(tmp_path, path)
+    return len(rows)
+
+
+def _read_shard(path: Path) -> Iterator[tuple[int, tuple[int, ...], str]]:
+    with open(path) as f:
+        for line in f:
+            rank, strength, hand = line.rstrip("\n").split("\t")
+            yield int(rank), tuple(int(x) for x in strength.split(",") if x), hand
+
+
+def ranked_rows(spec: RankingSpec, shard_dir: Path) -> Iterator[tuple[str, int, int]]:
+    """Merge completed shards into (hand, rank, ordered_rank) rows in rankings order.
+
+    Hands are comma-separated card strings, as in the rankings CSVs.
+    """
+    shards = [_read_shard(_shard_path(shard_dir, i)) for i in range(len(spec.shards()))]
+    # heapq.merge is stable across its inputs, and shards are in canonical
+    # order, so equal hands come out in enumeration order
+    previous = None
+    ordered_rank = 0
+    for rank, strength, hand in heapq.merge(*shards, key=lambda row: (row[0], row[1])):
+        if previous is None or previous[0] != rank:
+            ordered_rank = 1
+        elif previous[1] != strength:
+            ordered_rank += 1
+        previous = (rank, strength)
+        yield hand, rank, ordered_rank
+
+
+def _prepare_shard_dir(spec: RankingSpec, work_dir: Path, fresh: bool) -> Path:
+    """Create or reuse the checkpoint directory for a spec.
+
+    Raises:
+        ValueError: If the directory holds a run of a different spec
+    """
+    shard_dir = work_dir / spec.name
+    manifest = shard_dir / "manifest.json"
+    if fresh and shard_dir.exists():
+        shutil.rmtree(shard_dir)
+    if manifest.exists():
+        if json.loads(manifest.read_text()) != spec.fingerprint():
+            raise ValueError(f"{shard_dir} holds a different run of {spec.name}; rerun with --fresh")
+    else:
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        manifest.write_text(json.dumps(spec.fingerprint(), indent=2))
+    return shard_dir
+
+
+def generate(
+    spec: RankingSpec,
+    output_format: str = "csv",
+    output_dir: Path = RANKINGS_DIR,
+    work_dir: Path = DEFAULT_WORK_DIR,
+    workers: int | None = None,
+    fresh: bool = False,
+    keep_shards: bool = False,
+) -> Path:
+    """Generate the rankings table for a spec, resuming any checkpointed shards.
+
+    Args:
+        spec: The table to generate
+        output_format: "csv", "binary" (.rnk) or "sqlite" (.db)
+        output_dir: Where the rankings file is written
+        work_dir: Parent directory for shard checkpoints
+        workers: Worker processes (default: CPU count)
+        fresh: Discard checkpoints from an earlier run
+        keep_shards: Keep the checkpoints after the output is written
+
+    Returns:
+        Path of the rankings file written
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
+    shard_dir = _prepare_shard_dir(spec, work_dir, fresh)
+    shards = spec.shards()
+    pending = [(i, prefix) for i, prefix in enumerate(shards) if not _shard_path(shard_dir, i).exists()]
+    print(f"{spec.name}: {len(shards) - len(pending)} of {len(shards)} shards already done")
+
+    start = time.monotonic()
+    hands = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(generate_shard, spec, prefix, _shard_path(shard_dir, i)) for i, prefix in pending]
+        for done, future in enumerate(as_completed(futures), 1):
+            hands += future.result()
+            if done % 100 == 0 or done == len(futures):
+                print(f"  {done}/{len(futures)} shards, {hands} hands, {time.monotonic() - start:.0f}s")
+
+    output_file = output_dir / f"all_card_hands_ranked_{spec.name}.csv"
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    rows = ranked_rows(spec, shard_dir)
+    if output_format == "csv":
+        tmp_file = output_file.with_name(output_file.name + ".tmp")
+        with open(tmp_file, "w") as f:
+            f.write("Hand,Rank,OrderedRank\n")
+            for hand, rank, ordered_rank in rows:
+                f.write(f"{hand},{rank},{ordered_rank}\n")
+        os.replace(tmp_file, output_file)
+    else:
+        packed_rows = ((hand.replace(",", ""), rank, ordered_rank) for hand, rank, ordered_rank in rows)
+        if output_format == "binary":
+            output_file = output_file.with_suffix(RANKINGS_BINARY_SUFFIX)
+            PackedRankings.from_rows(packed_rows).write_binary(output_file)
+        else:
+            output_file = output_file.with_suffix(".db")
+            write_sqlite_rankings(packed_rows, output_file)
+
+    if not keep_shards:
+        shutil.rmtree(shard_dir)
+    print(f"Wrote {output_file} in {time.monotonic() - start:.0f}s")
+    return output_file
+
+
+def main(specs: dict[str, RankingSpec]) -> None:
+    """Command line entry point for a generator script offering the given specs."""
+    parser = argparse.ArgumentParser(description="Generate hand rankings tables.")
+    parser.add_argument("names", nargs="*", help=f"Tables to generate (default: all of {', '.join(sorted(specs))})")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="csv", help="Output format (default: csv)")
+    parser.add_argument("--output-dir", type=Path, default=RANKINGS_DIR, help="Directory for the rankings files")
+    parser.add_argument("--work-dir", type=Path, default=DEFAULT_WORK_DIR, help="Directory for shard checkpoints")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--fresh", action="store_true", help="Discard checkpoints from an earlier run")
+    parser.add_argument("--keep-shards", action="store_true", help="Keep checkpoints after writing the output")
+    args = parser.parse_args()
+    unknown = set(args.names) - set(specs)
+    if unknown:
+        parser.error(f"unknown tables: {', '.join(sorted(unknown))}")
+
+    for name in args.names or sorted(specs):
+        generate(
+            specs[name],
+            output_format=args.format,
+            output_dir=args.output_dir,
+            work_dir=args.work_dir,
+            workers=args.workers,
+            fresh=args.fresh,
+            keep_shards=args.keep_shards,
+        )
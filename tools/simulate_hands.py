@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""Headless hand throughput: play random-policy hands and report hands/sec per variant.
+
+Runs generic_poker.sim.HandSimulator directly on the engine (no web layer,
+no DB, no hand descriptions, logging off), one variant at a time in this
+process. Useful for spotting engine slowdowns and variants that stall.
+
+Usage:
+    python tools/simulate_hands.py                            # hold_em, 1000 hands, 2 players
+    python tools/simulate_hands.py --variant omaha_8,razz --players 6
+    python tools/simulate_hands.py --variant all --hands 200 --seed 1
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from generic_poker.config.loader import BettingStructure, GameRules
+from generic_poker.sim import HandSimulator
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), "..", "data", "game_configs")
+
+
+def resolve_variants(spec: str) -> list[str]:
+    """Variant names from a comma-separated list, or every config for "all"."""
+    if spec == "all":
+        return sorted(name[:-5] for name in os.listdir(CONFIG_DIR) if name.endswith(".json"))
+    return [v.strip() for v in spec.split(",") if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure headless hand throughput per variant.")
+    parser.add_argument(
+        "--variant", default="hold_em", help='Game config name(s), comma-separated, or "all" (default: hold_em)'
+    )
+    parser.add_argument("--hands", type=int, default=1000, help="Hands per variant (default: 1000)")
+    parser.add_argument("--players", type=int, default=2, help="Players per table, clamped to the variant's limits")
+    parser.add_argument("--structure", default=None, help="Betting structure if the variant allows it")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for decks and policies")
+    args = parser.parse_args()
+
+    print(f"{'Variant':<28} {'Players':>7} {'Hands':>6} {'Stalled':>7} {'Hands/s':>9}")
+    started = time.monotonic()
+    total_hands = 0
+    for variant in resolve_variants(args.variant):
+        try:
+            rules = GameRules.from_file(os.path.join(CONFIG_DIR, f"{variant}.json"))
+            structure = BettingStructure(args.structure) if args.structure else None
+            if structure not in rules.betting_structures:
+                structure = None
+            players = min(max(args.players, rules.min_players), rules.max_players)
+            stats = HandSimulator(rules, num_players=players, structure=structure, seed=args.seed).run(args.hands)
+        except Exception as e:
+            print(f"{variant:<28} error: {type(e).__name__}: {e}")
+            continue
+        total_hands += stats.hands
+        print(f"{variant:<28} {players:>7} {stats.completed:>6} {stats.stalled:>7} {stats.hands_per_sec:>9.0f}")
+    print(f"\n{total_hands} hands in {time.monotonic() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()